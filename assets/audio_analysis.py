@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Precompute duration, level, loudness and waveform peaks for audio files
+PCM is read block by block (WAVs through a memory map, other formats through
+soundfile), so a music track is never held in memory as a whole. Loudness is
+a BS.1770-style integrated estimate in LUFS: K-weighted (high shelf plus
+high-pass), gated over 400 ms blocks. Results are cached by file hash.
+"""
+
+import argparse
+import base64
+import json
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from build_cache import file_hash
+from dsp import BiquadFilter, design_biquad
+
+try:
+    import soundfile
+except ImportError:  # Only needed for OGG/MP3 catalog files, not for generated WAVs
+    soundfile = None
+
+DEFAULT_BLOCK_FRAMES = 65536
+
+# min/max pairs per clip in the manifest waveform
+PEAK_BUCKETS = 64
+
+# Common loudness for normalization; generated files keep 1 dB of headroom
+TARGET_LOUDNESS = -16.0
+MAX_PEAK_DB = -1.0
+
+ANALYSIS_PATH = 'assets/audio-analysis.json'
+
+# Bump when analyze_audio's output changes so cached analyses are redone
+ANALYSIS_VERSION = 2
+
+# BS.1770 gating: 400 ms blocks every 100 ms, -70 LUFS absolute and -10 LU relative gates
+GATE_STEP_SECONDS = 0.1
+GATE_BLOCK_STEPS = 4
+ABSOLUTE_GATE = -70.0
+RELATIVE_GATE = -10.0
+
+_WAV_FORMAT_PCM = 1
+_WAV_FORMAT_FLOAT = 3
+_WAV_FORMAT_EXTENSIBLE = 0xFFFE
+
+def _wav_layout(path):
+    """(data offset, frames, channels, sample_rate, dtype, scale, offset) of a WAV's PCM data"""
+    with open(path, 'rb') as f:
+        riff, _, wave_id = struct.unpack('<4sI4s', f.read(12))
+        if riff != b'RIFF' or wave_id != b'WAVE':
+            raise ValueError(f"{path} is not a RIFF WAVE file")
+        fmt = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"{path} has no data chunk")
+            chunk_id, size = struct.unpack('<4sI', header)
+            if chunk_id == b'fmt ':
+                fmt = f.read(size)
+                f.seek(size % 2, 1)
+            elif chunk_id == b'data':
+                data_offset = f.tell()
+                break
+            else:
+                f.seek(size + size % 2, 1)
+        data_size = min(size, os.path.getsize(path) - data_offset)
+
+    if fmt is None:
+        raise ValueError(f"{path} has no fmt chunk")
+    format_tag, channels, sample_rate, _, _, bits = struct.unpack('<HHIIHH', fmt[:16])
+    if format_tag == _WAV_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        format_tag = struct.unpack('<H', fmt[24:26])[0]
+    if format_tag == _WAV_FORMAT_FLOAT and bits == 32:
+        dtype, scale, offset = '<f4', 1.0, 0.0
+    elif format_tag == _WAV_FORMAT_PCM and bits in (8, 16, 32):
+        dtype = {8: 'u1', 16: '<i2', 32: '<i4'}[bits]
+        scale, offset = 2.0 ** (bits - 1), (128.0 if bits == 8 else 0.0)
+    else:
+        raise ValueError(f"Unsupported WAV format {format_tag} ({bits} bit) in {path}")
+    frames = data_size // (channels * bits // 8)
+    return data_offset, frames, channels, sample_rate, dtype, scale, offset
+
+def audio_info(path):
+    """(frames, channels, sample_rate) without decoding the samples"""
+    path = str(path)
+    if path.endswith('.wav'):
+        _, frames, channels, sample_rate, _, _, _ = _wav_layout(path)
+        return frames, channels, sample_rate
+    if soundfile is None:
+        raise RuntimeError(f"Reading {path} needs the optional 'soundfile' package")
+    info = soundfile.info(path)
+    return info.frames, info.channels, info.samplerate
+
+def pcm_blocks(path, block_frames=DEFAULT_BLOCK_FRAMES):
+    """Yield (frames x channels) float32 blocks of an audio file in [-1, 1]"""
+    path = str(path)
+    if path.endswith('.wav'):
+        data_offset, frames, channels, _, dtype, scale, offset = _wav_layout(path)
+        if frames == 0:
+            return
+        pcm = np.memmap(path, dtype=dtype, mode='r', offset=data_offset, shape=(frames, channels))
+        for start in range(0, frames, block_frames):
+            yield (pcm[start:start + block_frames].astype(np.float32) - offset) / scale
+        return
+    if soundfile is None:
+        raise RuntimeError(f"Reading {path} needs the optional 'soundfile' package")
+    with soundfile.SoundFile(path) as sound_file:
+        yield from sound_file.blocks(block_frames, dtype='float32', always_2d=True)
+
+def k_weighting(sample_rate, block_size=DEFAULT_BLOCK_FRAMES):
+    """The two BS.1770 pre-filters as streaming BiquadFilters: a +4 dB high shelf and a 38 Hz high-pass"""
+    # With the cookbook's definition of q, these corner frequencies match the
+    # coefficients BS.1770 tabulates for 48 kHz to within 0.05 dB
+    shelf = design_biquad('highshelf', 1500.0, sample_rate, q=0.7071, gain_db=4.0)
+    rolloff = design_biquad('highpass', 38.0, sample_rate, q=0.5)
+    return BiquadFilter(*shelf, block_size=block_size), BiquadFilter(*rolloff, block_size=block_size)
+
+def _db(value):
+    return round(float(20 * np.log10(value)), 1) if value > 0 else None
+
+def gated_loudness(step_energy, step_frames):
+    """Integrated loudness in LUFS from summed K-weighted energy per 100 ms step.
+
+    Returns None for silence and for clips shorter than one 400 ms gating block.
+    """
+    step_energy = np.asarray(step_energy, dtype=float)
+    if len(step_energy) < GATE_BLOCK_STEPS:
+        return None
+    windows = np.convolve(step_energy, np.ones(GATE_BLOCK_STEPS), 'valid') / (GATE_BLOCK_STEPS * step_frames)
+    with np.errstate(divide='ignore'):
+        levels = -0.691 + 10 * np.log10(windows)
+    gated = windows[levels > ABSOLUTE_GATE]
+    if len(gated) == 0:
+        return None
+    threshold = -0.691 + 10 * np.log10(gated.mean()) + RELATIVE_GATE
+    gated = windows[(levels > ABSOLUTE_GATE) & (levels > threshold)]
+    return round(float(-0.691 + 10 * np.log10(gated.mean())), 1)
+
+def analyze_audio(path, buckets=PEAK_BUCKETS, block_frames=DEFAULT_BLOCK_FRAMES):
+    """{'duration', 'sample_rate', 'channels', 'peak', 'rms', 'loudness', 'waveform'} for one file.
+
+    peak and rms are in dBFS and loudness in LUFS (None when silent);
+    waveform is min/max pairs for `buckets` equal slices of the clip,
+    interleaved as int8 (-127..127) and base64-encoded.
+    """
+    frames, channels, sample_rate = audio_info(path)
+    buckets = max(1, min(buckets, frames))
+    edges = np.arange(buckets + 1) * frames // buckets
+    lows = np.full(buckets, np.inf, dtype=np.float32)
+    highs = np.full(buckets, -np.inf, dtype=np.float32)
+    # Short clips get short filter blocks; building the impulse response dominates otherwise
+    shelf, rolloff = k_weighting(sample_rate, max(1, min(block_frames, frames)))
+    step_frames = max(1, int(round(sample_rate * GATE_STEP_SECONDS)))
+    step_energy = []
+    pending = np.zeros(0)
+    peak = square_sum = total_energy = 0.0
+
+    start = 0
+    for block in pcm_blocks(path, block_frames):
+        # Decoders may deliver a few frames more than audio_info() promised
+        block = block[:max(0, frames - start)]
+        stop = start + len(block)
+        if stop > start:
+            peak = max(peak, float(np.abs(block).max()))
+            square_sum += float(np.square(block, dtype=np.float64).sum())
+
+            # Waveform: reduce each bucket slice that falls in this block
+            first = np.searchsorted(edges, start, 'right') - 1
+            cuts = edges[(edges > start) & (edges < stop)] - start
+            cuts = np.concatenate([[0], cuts])
+            slots = slice(first, first + len(cuts))
+            lows[slots] = np.minimum(lows[slots], np.minimum.reduceat(block.min(axis=1), cuts))
+            highs[slots] = np.maximum(highs[slots], np.maximum.reduceat(block.max(axis=1), cuts))
+
+            # Loudness: K-weighted energy, summed over channels, per 100 ms step
+            weighted = rolloff.process(shelf.process(block.T))
+            energy = np.square(weighted).sum(axis=0)
+            total_energy += float(energy.sum())
+            pending = np.concatenate([pending, energy])
+            whole = len(pending) // step_frames * step_frames
+            step_energy.extend(pending[:whole].reshape(-1, step_frames).sum(axis=1))
+            pending = pending[whole:]
+        start = stop
+
+    loudness = gated_loudness(step_energy, step_frames)
+    # Short clips are measured ungated over their whole length
+    if loudness is None and 0 < frames < GATE_BLOCK_STEPS * step_frames and total_energy > 0:
+        loudness = round(float(-0.691 + 10 * np.log10(total_energy / frames)), 1)
+    # Buckets no block reached (a decoder delivering fewer frames than promised) draw as silence
+    untouched = ~np.isfinite(lows)
+    lows[untouched] = highs[untouched] = 0
+    pairs = np.stack([lows, highs], axis=1).ravel()
+    waveform = np.clip(np.round(pairs * 127), -127, 127).astype(np.int8)
+    return {
+        'duration': round(frames / sample_rate, 3) if sample_rate else 0.0,
+        'sample_rate': sample_rate,
+        'channels': channels,
+        'peak': _db(peak),
+        'rms': _db(np.sqrt(square_sum / (frames * channels))) if frames else None,
+        'loudness': loudness,
+        'waveform': base64.b64encode(waveform.tobytes()).decode('ascii'),
+    }
+
+def loudness_gain(analysis, target=TARGET_LOUDNESS, max_peak_db=None):
+    """Linear gain that brings analysis['loudness'] to target.
+
+    With max_peak_db the gain is lowered so the peak stays at or under it.
+    Silent clips get 1.0.
+    """
+    if analysis['loudness'] is None:
+        return 1.0
+    gain_db = target - analysis['loudness']
+    if max_peak_db is not None and analysis['peak'] is not None:
+        gain_db = min(gain_db, max_peak_db - analysis['peak'])
+    return 10 ** (gain_db / 20)
+
+def normalize_wave(path, gain, block_frames=DEFAULT_BLOCK_FRAMES):
+    """Scale a WAV's samples by gain in place, block by block through a memory map"""
+    data_offset, frames, channels, _, dtype, scale, offset = _wav_layout(path)
+    if frames == 0 or gain == 1.0:
+        return
+    pcm = np.memmap(path, dtype=dtype, mode='r+', offset=data_offset, shape=(frames, channels))
+    info = np.iinfo(pcm.dtype) if pcm.dtype.kind in 'iu' else None
+    for start in range(0, frames, block_frames):
+        block = (pcm[start:start + block_frames].astype(np.float64) - offset) * gain + offset
+        if info is not None:
+            block = np.clip(np.round(block), info.min, info.max)
+        pcm[start:start + block_frames] = block
+    pcm.flush()
+    del pcm
+
+def load_analyses(path=ANALYSIS_PATH):
+    """{file path: analysis with its 'sha256' and 'version'} from a previous run, or {}"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_analyses(analyses, path=ANALYSIS_PATH):
+    """Write analyses atomically as compact JSON"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(analyses, f, separators=(',', ':'), sort_keys=True)
+    os.replace(tmp_path, path)
+
+def cached_analysis(path, digest, previous):
+    """(analysis, decoded) for path: the entry in previous if its sha256 is digest, else a fresh one"""
+    cached = previous.get(str(path))
+    if cached is not None and cached.get('sha256') == digest and cached.get('version') == ANALYSIS_VERSION:
+        return cached, False
+    return dict(analyze_audio(path), sha256=digest, version=ANALYSIS_VERSION), True
+
+def analyze_files(paths, analysis_path=ANALYSIS_PATH, digests=None):
+    """Analyze paths, reusing cached results for files whose hash is unchanged.
+
+    digests optionally maps paths to known sha256s. Writes the results for
+    exactly these paths to analysis_path and returns them with the number
+    of files actually decoded.
+    """
+    previous = load_analyses(analysis_path)
+    analyses = {}
+    decoded = 0
+    for path in map(str, paths):
+        digest = (digests or {}).get(path) or file_hash(path)
+        analyses[path], fresh = cached_analysis(path, digest, previous)
+        decoded += fresh
+    save_analyses(analyses, analysis_path)
+    return analyses, decoded
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=['assets/sounds', 'assets/music'],
+                        help='audio files or directories (default: the generated sounds and music)')
+    parser.add_argument('--out', default=ANALYSIS_PATH, help='analysis JSON to write')
+    args = parser.parse_args()
+
+    files = []
+    for path in map(Path, args.paths):
+        if path.is_dir():
+            files += sorted(p for p in path.rglob('*') if p.suffix in ('.wav', '.ogg', '.mp3'))
+        elif path.exists():
+            files.append(path)
+    print(f"Analyzing {len(files)} audio files...")
+    analyses, decoded = analyze_files(files, args.out)
+    for path, analysis in analyses.items():
+        loudness = 'silent' if analysis['loudness'] is None else f"{analysis['loudness']:6.1f} LUFS"
+        print(f"  {analysis['duration']:7.2f}s  peak {analysis['peak']} dBFS  {loudness}  {path}")
+    print(f"  {decoded} decoded, {len(files) - decoded} unchanged; wrote {args.out}")
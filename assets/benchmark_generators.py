@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Benchmark the asset generators
+Times each generator at several sizes, reports throughput and peak memory,
+writes the results as JSON and can compare them against a stored baseline
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+
+import numpy as np
+import PIL
+
+DEFAULT_THRESHOLD = 0.25
+
+def benchmark_cases(quick=False):
+    """Return [(case_id, kind, params, work_units, unit)] for every benchmark"""
+    durations = [1, 30] if quick else [1, 30, 300]
+    cases = []
+    for sprite_size, cols, rows in [(32, 8, 8), (64, 8, 8), (32, 16, 16), (128, 16, 16)]:
+        if quick and sprite_size == 128:
+            continue
+        cases.append((f'create_sprite_sheet[{sprite_size}px {cols}x{rows}]', 'sprite_sheet',
+                      {'sprite_size': sprite_size, 'cols': cols, 'rows': rows},
+                      sprite_size * cols * sprite_size * rows, 'pixels'))
+    for tile_size in [16, 32, 64]:
+        cases.append((f'create_tileset[{tile_size}px 16x16]', 'tileset',
+                      {'tile_size': tile_size, 'cols': 16, 'rows': 16},
+                      tile_size * 16 * tile_size * 16, 'pixels'))
+    cases.append(('create_character_sprites', 'character_sprites', {}, 4 * 128 * 128, 'pixels'))
+    cases.append(('create_ui_elements', 'ui_elements', {}, 256 * 128 + 256 * 64 + 256 * 256, 'pixels'))
+    for duration in durations:
+        samples = 44100 * duration
+        cases.append((f'apply_envelope[{duration}s]', 'apply_envelope', {'duration': duration},
+                      samples, 'samples'))
+        cases.append((f'create_ambient_music[{duration}s]', 'ambient_music', {'duration': duration},
+                      samples, 'samples'))
+        cases.append((f'save_wave[{duration}s]', 'save_wave', {'duration': duration},
+                      samples, 'samples'))
+    return cases
+
+def _case_callable(kind, params, tmp_dir):
+    """Set up inputs outside the timed region and return the call to time"""
+    import generate_assets
+    import generate_sounds
+
+    if kind == 'sprite_sheet':
+        return lambda: generate_assets.create_sprite_sheet('bench', **params)
+    elif kind == 'tileset':
+        return lambda: generate_assets.create_tileset('bench', **params)
+    elif kind == 'character_sprites':
+        return generate_assets.create_character_sprites
+    elif kind == 'ui_elements':
+        return generate_assets.create_ui_elements
+    elif kind == 'apply_envelope':
+        wave_data = np.random.default_rng(0).standard_normal(44100 * params['duration'])
+        return lambda: generate_sounds.apply_envelope(wave_data, 0.5, 2.0, 0.6, 0.5)
+    elif kind == 'ambient_music':
+        return lambda: generate_sounds.create_ambient_music(params['duration'])
+    elif kind == 'save_wave':
+        wave_data = np.random.default_rng(0).standard_normal(44100 * params['duration'])
+        path = os.path.join(tmp_dir, 'bench.wav')
+        return lambda: generate_sounds.save_wave(path, wave_data)
+    raise ValueError(f"Unknown benchmark kind: {kind}")
+
+def _peak_rss_mb():
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is kilobytes on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def run_case(kind, params, work_units, repeat=3):
+    """Run one benchmark and return its measurements.
+
+    Wall time is the best of `repeat` untraced runs; memory comes from one
+    extra run under tracemalloc plus the process's peak RSS.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        call = _case_callable(kind, params, tmp_dir)
+        rss_before = _peak_rss_mb()
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            call()
+            times.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        call()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    wall = min(times)
+    return {
+        'wall_s': wall,
+        'throughput': work_units / wall if wall > 0 else float('inf'),
+        'tracemalloc_peak_mb': traced_peak / (1024 * 1024),
+        'peak_rss_mb': _peak_rss_mb(),
+        'peak_rss_delta_mb': _peak_rss_mb() - rss_before,
+    }
+
+def run_benchmarks(cases, repeat=3, isolate=True):
+    """Run every case, each in a fresh process unless isolate is False"""
+    results = {}
+    if isolate:
+        context = multiprocessing.get_context('spawn')
+        executor = ProcessPoolExecutor(max_workers=1, mp_context=context, max_tasks_per_child=1)
+    else:
+        executor = None
+    try:
+        for case_id, kind, params, work_units, unit in cases:
+            if executor is None:
+                result = run_case(kind, params, work_units, repeat)
+            else:
+                result = executor.submit(run_case, kind, params, work_units, repeat).result()
+            result['unit'] = unit
+            results[case_id] = result
+            print(f"  {case_id:<36} {result['wall_s'] * 1000:9.1f} ms  "
+                  f"{result['throughput']:>14,.0f} {unit}/s  "
+                  f"traced {result['tracemalloc_peak_mb']:7.1f} MB  "
+                  f"rss {result['peak_rss_mb']:7.1f} MB")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return results
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """Print the change against a baseline; returns the ids of regressed cases.
+
+    A case regresses when its wall time or traced memory peak grows by
+    more than `threshold` (a fraction, 0.25 == 25%).
+    """
+    regressions = []
+    print(f"\nComparison against baseline (threshold {threshold:.0%}):")
+    for case_id, result in results.items():
+        base = baseline.get('results', {}).get(case_id)
+        if base is None:
+            print(f"  {case_id:<36} (new)")
+            continue
+        time_ratio = result['wall_s'] / base['wall_s'] if base['wall_s'] else 1.0
+        mem_ratio = (result['tracemalloc_peak_mb'] / base['tracemalloc_peak_mb']
+                     if base['tracemalloc_peak_mb'] else 1.0)
+        regressed = time_ratio > 1 + threshold or mem_ratio > 1 + threshold
+        if regressed:
+            regressions.append(case_id)
+        print(f"  {case_id:<36} time x{time_ratio:5.2f}  memory x{mem_ratio:5.2f}"
+              f"{'  REGRESSION' if regressed else ''}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', default='assets/benchmark-results.json',
+                        help='where to write the JSON results')
+    parser.add_argument('--baseline', help='JSON results to compare against')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed slowdown/memory growth as a fraction (default 0.25)')
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per case (best is kept)')
+    parser.add_argument('--quick', action='store_true', help='skip the largest sizes')
+    parser.add_argument('--filter', default='', help='only run cases whose id contains this text')
+    parser.add_argument('--in-process', action='store_true',
+                        help='run every case in this process (faster, but RSS is cumulative)')
+    args = parser.parse_args()
+
+    cases = [case for case in benchmark_cases(args.quick) if args.filter in case[0]]
+    print(f"Running {len(cases)} benchmarks...")
+    results = run_benchmarks(cases, args.repeat, isolate=not args.in_process)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pillow': PIL.__version__,
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
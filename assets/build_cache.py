@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Content-addressed build cache for the asset generators
+Each output is recorded with a key hashed from the generator's source code
+(including the helpers it calls), its parameters and its seed, plus the hash
+of the file that was written. Outputs whose key and file hash still match
+are skipped on the next run.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import types
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_PLAIN_TYPES = (bool, int, float, str, bytes, type(None), tuple, list, dict, frozenset)
+
+def _code_names(code):
+    """Global names used by a code object and any functions nested in it"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+def _is_local(func):
+    """True for functions and classes defined in this directory (not numpy/PIL/stdlib)"""
+    try:
+        source_file = inspect.getsourcefile(func)
+    except TypeError:
+        return False
+    return source_file is not None and os.path.abspath(source_file).startswith(ROOT + os.sep)
+
+def _methods(cls):
+    """Functions defined in a class body, including static/class methods and properties"""
+    for value in vars(cls).values():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        elif isinstance(value, property):
+            value = value.fget
+        if isinstance(value, types.FunctionType):
+            yield value
+
+def code_fingerprint(func, _seen=None):
+    """Hash the source of func and, transitively, the local functions,
+    classes and plain module constants it refers to.
+
+    A class is hashed with its source, its local base classes and
+    everything its methods refer to.
+    """
+    seen = set() if _seen is None else _seen
+    digest = hashlib.sha256()
+
+    if isinstance(func, functools.partial):
+        digest.update(repr((func.args, sorted(func.keywords.items()))).encode())
+        func = func.func
+    if id(func) in seen or not _is_local(func):
+        return digest.hexdigest()
+    seen.add(id(func))
+
+    digest.update(inspect.getsource(func).encode())
+    if isinstance(func, type):
+        for dependency in list(func.__bases__) + list(_methods(func)):
+            digest.update(code_fingerprint(dependency, seen).encode())
+        return digest.hexdigest()
+    for name in sorted(_code_names(func.__code__)):
+        value = func.__globals__.get(name)
+        if isinstance(value, (types.FunctionType, functools.partial, type)):
+            digest.update(code_fingerprint(value, seen).encode())
+        elif isinstance(value, _PLAIN_TYPES):
+            digest.update(f'{name}={value!r}'.encode())
+    return digest.hexdigest()
+
+def file_hash(path):
+    """sha256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class BuildCache:
+    """Manifest of generated files mapping each output path to its key and file hash"""
+
+    def __init__(self, manifest_path, force=False):
+        self.manifest_path = manifest_path
+        self.force = force
+        self.entries = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.entries = json.load(f).get('outputs', {})
+
+    def key(self, funcs, params=None, seed=None):
+        """Cache key for the given generator function(s), parameters and seed"""
+        if callable(funcs):
+            funcs = [funcs]
+        payload = {
+            'code': [code_fingerprint(func) for func in funcs],
+            'params': repr(params),
+            'seed': seed,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def is_fresh(self, output, key):
+        """True if output exists, was built with key and has not been modified since"""
+        if self.force:
+            return False
+        entry = self.entries.get(output)
+        if entry is None or entry['key'] != key or not os.path.exists(output):
+            return False
+        return file_hash(output) == entry['sha256']
+
+    def record(self, output, key):
+        """Remember that output was just written with key"""
+        self.entries[output] = {'key': key, 'sha256': file_hash(output)}
+
+    def prune(self, outputs):
+        """Forget entries not in outputs and delete their files; returns removed paths"""
+        keep = set(outputs)
+        removed = []
+        for output in sorted(set(self.entries) - keep):
+            if os.path.exists(output):
+                os.remove(output)
+            removed.append(output)
+            del self.entries[output]
+        return removed
+
+    def save(self):
+        """Write the manifest atomically"""
+        os.makedirs(os.path.dirname(self.manifest_path) or '.', exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'outputs': self.entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
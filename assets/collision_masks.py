@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Precompute collision data for every generated and cataloged sprite
+For each frame (sheets are cut with the grid from sprite_grid.py) the pixels
+with alpha above a threshold are trimmed to a tight bounding box and stored
+as a bit-packed mask. All masks go into one binary sidecar with a JSON index,
+so games test collisions with integer ANDs instead of reading pixels.
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from sprite_grid import CATALOG_2D, GRID_KEYS, catalog_entries, detect_files
+
+# The grid keys frame_grids() needs; 'frames' and the single 'spacing' follow from them
+MASK_GRID_KEYS = tuple(key for key in GRID_KEYS if key not in ('frames', 'spacing'))
+
+MASKS_PATH = 'assets/collision-masks.bin'
+INDEX_PATH = 'assets/collision-masks.json'
+INDEX_VERSION = 2
+MAGIC = b'SPRMASK1'
+
+# Pixels with alpha above this are solid (pygame.mask.from_surface's default)
+DEFAULT_THRESHOLD = 127
+
+def frame_grids(sprite_dir='assets/sprites', catalog_path=CATALOG_2D):
+    """{path: {'frame_width', 'frame_height', 'rows', 'spacing_x', 'spacing_y'}} for the generated
+    sheets and cataloged sprites.
+
+    Catalog entries use the grid stored by sprite_grid.py; generated sheets
+    (and entries without one) are detected here. Backgrounds are left out.
+    """
+    grids = {}
+    unknown = sorted(str(path) for path in Path(sprite_dir).glob('*.png'))
+    if os.path.exists(catalog_path):
+        with open(catalog_path) as f:
+            catalog = json.load(f)
+        for entry in catalog_entries(catalog):
+            if not os.path.exists(entry['path']) or entry.get('suggested_usage') == 'background':
+                continue
+            if 'frame_width' in entry:
+                grids[entry['path']] = entry
+            else:
+                unknown.append(entry['path'])
+    grids.update(detect_files(unknown))
+    return {path: {key: grid.get(key, 0) for key in MASK_GRID_KEYS} for path, grid in sorted(grids.items())}
+
+def grid_shape(width, height, grid):
+    """(rows, columns, pitch_x, pitch_y) of a grid laid over a width x height sheet.
+
+    Columns are the whole frames that fit (the last one may drop its
+    spacing); rows come from the grid when it has them, since a strip's
+    single row can be shorter than the sheet.
+    """
+    spacing_x, spacing_y = grid.get('spacing_x', 0), grid.get('spacing_y', 0)
+    pitch_x, pitch_y = grid['frame_width'] + spacing_x, grid['frame_height'] + spacing_y
+    columns = max(1, (width + spacing_x) // pitch_x)
+    rows = grid.get('rows') or max(1, (height + spacing_y) // pitch_y)
+    return rows, columns, pitch_x, pitch_y
+
+def frame_masks(alpha, grid, threshold=DEFAULT_THRESHOLD):
+    """[(x, y, w, h, packed rows)] per grid cell of an alpha channel, row by row.
+
+    x, y are the trimmed box relative to the frame's own origin; packed
+    rows hold ceil(w / 8) bytes per row, pixel i in bit i % 8 of byte
+    i // 8 (np.packbits with bitorder='little'). Empty frames are (0, 0, 0, 0, b'').
+    """
+    frame_width, frame_height = grid['frame_width'], grid['frame_height']
+    rows, columns, pitch_x, pitch_y = grid_shape(alpha.shape[1], alpha.shape[0], grid)
+
+    # (rows, columns, frame_height, frame_width) view of the solid pixels
+    visible = alpha[:rows * pitch_y, :columns * pitch_x] > threshold
+    solid = np.zeros((rows * pitch_y, columns * pitch_x), dtype=bool)
+    solid[:visible.shape[0], :visible.shape[1]] = visible
+    cells = solid.reshape(rows, pitch_y, columns, pitch_x)[:, :frame_height, :, :frame_width].swapaxes(1, 2)
+    cells = cells.reshape(rows * columns, frame_height, frame_width)
+
+    # Bounding boxes of every frame at once from the row/column occupancy
+    filled_rows, filled_columns = cells.any(axis=2), cells.any(axis=1)
+    top = filled_rows.argmax(axis=1)
+    bottom = frame_height - filled_rows[:, ::-1].argmax(axis=1)
+    left = filled_columns.argmax(axis=1)
+    right = frame_width - filled_columns[:, ::-1].argmax(axis=1)
+
+    masks = []
+    for cell, empty, x0, x1, y0, y1 in zip(cells, ~filled_rows.any(axis=1), left.tolist(), right.tolist(),
+                                           top.tolist(), bottom.tolist()):
+        if empty:
+            masks.append((0, 0, 0, 0, b''))
+            continue
+        packed = np.packbits(cell[y0:y1, x0:x1], axis=1, bitorder='little')
+        masks.append((x0, y0, x1 - x0, y1 - y0, packed.tobytes()))
+    return masks
+
+def build_masks(grids, threshold=DEFAULT_THRESHOLD, masks_path=MASKS_PATH, index_path=INDEX_PATH):
+    """Write the binary sidecar and its index for {path: grid}; returns (frames, bytes written).
+
+    The sidecar is MAGIC followed by every mask back to back. The index
+    maps each path to its grid and a [x, y, w, h, offset] list per frame,
+    offset being the mask's byte position in the sidecar.
+    """
+    sprites = {}
+    frames = 0
+    tmp_path = masks_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        for path, grid in grids.items():
+            with Image.open(path) as img:
+                alpha = np.asarray(img.convert('RGBA'))[..., 3]
+            entries = []
+            for x, y, w, h, packed in frame_masks(alpha, grid, threshold):
+                entries.append([x, y, w, h, f.tell()])
+                f.write(packed)
+            sprites[path] = {'frame_width': grid['frame_width'], 'frame_height': grid['frame_height'],
+                             'rows': grid_shape(alpha.shape[1], alpha.shape[0], grid)[0],
+                             'spacing_x': grid.get('spacing_x', 0), 'spacing_y': grid.get('spacing_y', 0),
+                             'frames': entries}
+            frames += len(entries)
+    os.replace(tmp_path, masks_path)
+    with open(index_path, 'w') as f:
+        json.dump({'version': INDEX_VERSION, 'threshold': threshold, 'masks': os.path.basename(masks_path),
+                   'sprites': sprites}, f, separators=(',', ':'))
+    return frames, os.path.getsize(masks_path)
+
+class FrameMask:
+    """One frame's solid pixels: a box inside the frame and one int per row (bit i = pixel i)"""
+
+    def __init__(self, x, y, width, height, rows):
+        self.x, self.y, self.width, self.height = x, y, width, height
+        self.rows = rows
+
+    def overlaps(self, x, y, other, other_x, other_y):
+        """True if this frame drawn at (x, y) shares a solid pixel with other drawn at (other_x, other_y)"""
+        left_a, top_a = x + self.x, y + self.y
+        left_b, top_b = other_x + other.x, other_y + other.y
+        left = max(left_a, left_b)
+        right = min(left_a + self.width, left_b + other.width)
+        top = max(top_a, top_b)
+        bottom = min(top_a + self.height, top_b + other.height)
+        if left >= right or top >= bottom:
+            return False
+        for world_y in range(top, bottom):
+            row_a = self.rows[world_y - top_a] >> (left - left_a)
+            row_b = other.rows[world_y - top_b] >> (left - left_b)
+            if row_a & row_b:
+                return True
+        return False
+
+class CollisionMasks:
+    """Reads build_masks() output; plain Python, so it also runs inside the generated games"""
+
+    def __init__(self, index_path=INDEX_PATH):
+        with open(index_path) as f:
+            index = json.load(f)
+        with open(os.path.join(os.path.dirname(index_path), index['masks']), 'rb') as f:
+            self.data = f.read()
+        if not self.data.startswith(MAGIC):
+            raise ValueError(f"{index['masks']} is not a collision mask file")
+        self.threshold = index['threshold']
+        self.sprites = index['sprites']
+        self._frames = {}
+
+    def frame(self, path, index=0):
+        """FrameMask of frame `index` (row-major over the sheet's grid) of a sprite"""
+        key = (path, index)
+        if key not in self._frames:
+            x, y, width, height, offset = self.sprites[path]['frames'][index]
+            stride = (width + 7) // 8
+            rows = [int.from_bytes(self.data[start:start + stride], 'little')
+                    for start in range(offset, offset + stride * height, stride)]
+            self._frames[key] = FrameMask(x, y, width, height, rows)
+        return self._frames[key]
+
+def _pixels_overlap(a, b, dx, dy):
+    """Overlap test by reading pixels: solid arrays a at (0, 0) and b at (dx, dy)"""
+    x0, x1 = max(0, dx), min(a.shape[1], dx + b.shape[1])
+    y0, y1 = max(0, dy), min(a.shape[0], dy + b.shape[0])
+    if x0 >= x1 or y0 >= y1:
+        return False
+    return bool((a[y0:y1, x0:x1] & b[y0 - dy:y1 - dy, x0 - dx:x1 - dx]).any())
+
+def benchmark(masks, pairs=2000, seed=0):
+    """Time mask tests against reading both frames' pixels, for random nearby placements"""
+    rng = np.random.default_rng(seed)
+    keys = [(path, i) for path, sprite in masks.sprites.items()
+            for i, frame in enumerate(sprite['frames']) if frame[2]]
+    picks = rng.integers(len(keys), size=(pairs, 2))
+    offsets = rng.integers(-24, 24, size=(pairs, 2)).tolist()
+
+    solids = {}
+    for path in {keys[i][0] for i in picks.ravel()}:
+        sprite = masks.sprites[path]
+        with Image.open(path) as img:
+            alpha = np.asarray(img.convert('RGBA'))[..., 3]
+        rows, columns, pitch_x, pitch_y = grid_shape(alpha.shape[1], alpha.shape[0], sprite)
+        for i in range(len(sprite['frames'])):
+            row, column = divmod(i, columns)
+            solids[(path, i)] = alpha[row * pitch_y:row * pitch_y + sprite['frame_height'],
+                                      column * pitch_x:column * pitch_x + sprite['frame_width']] > masks.threshold
+
+    pixel_pairs = [(solids[keys[i]], solids[keys[j]]) for i, j in picks]
+    mask_pairs = [(masks.frame(*keys[i]), masks.frame(*keys[j])) for i, j in picks]
+    start = time.perf_counter()
+    by_pixels = [_pixels_overlap(a, b, dx, dy) for (a, b), (dx, dy) in zip(pixel_pairs, offsets)]
+    pixel_time = time.perf_counter() - start
+    start = time.perf_counter()
+    by_masks = [a.overlaps(0, 0, b, dx, dy) for (a, b), (dx, dy) in zip(mask_pairs, offsets)]
+    mask_time = time.perf_counter() - start
+    agree = sum(p == m for p, m in zip(by_pixels, by_masks))
+    print(f"  {pairs} tests: pixel reads {pixel_time / pairs * 1e6:.1f} us, masks {mask_time / pairs * 1e6:.1f} us "
+          f"per test; {sum(by_masks)} hits, {agree}/{pairs} agree")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help=f'alpha above which a pixel is solid (default {DEFAULT_THRESHOLD})')
+    parser.add_argument('--out', default=INDEX_PATH, help='index file to write (the .bin goes next to it)')
+    parser.add_argument('--benchmark', action='store_true', help='time mask tests against pixel reads')
+    args = parser.parse_args()
+
+    print("Building collision masks...")
+    start = time.perf_counter()
+    grids = frame_grids()
+    masks_path = os.path.splitext(args.out)[0] + '.bin'
+    frames, size = build_masks(grids, args.threshold, masks_path, args.out)
+    print(f"  {len(grids)} sprites, {frames} frames: {masks_path} ({size:,} bytes), "
+          f"{args.out} ({os.path.getsize(args.out):,} bytes) in {time.perf_counter() - start:.2f}s")
+    if args.benchmark:
+        benchmark(CollisionMasks(args.out))
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Find duplicate and near-duplicate images across asset packs
+Exact copies share a content hash. Near copies (the same art re-exported by
+another pack, or at a whole multiple of its size) are found in three steps:
+a 64-bit difference hash (dHash) for every image, computed in bulk, with a
+banded Hamming index to find hashes a few bits apart; a 16x16 color
+thumbnail check, since dHash only sees brightness edges; and finally a
+full-resolution pixel comparison. Matches are merged into clusters with
+union-find
+"""
+
+import argparse
+import os
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from build_cache import file_hash
+
+HASH_SIZE = 8
+SIGNATURE_SIZE = 16
+
+# Near duplicates: at most this many differing hash bits...
+DEFAULT_MAX_DISTANCE = 3
+# ...aspect ratios within this fraction of each other...
+MAX_ASPECT_DELTA = 0.02
+# ...a mean difference of the 16x16 thumbnails (over their visible pixels) of at most this...
+MAX_SIGNATURE_DELTA = 6
+# ...and, at the smaller image's size, at most this share of visible pixels
+# differing by more than PIXEL_TOLERANCE in any channel
+MAX_DIFFERING_PIXELS = 0.0005
+PIXEL_TOLERANCE = 8
+
+def file_signature(path):
+    """{'sha256', 'bytes', 'width', 'height', 'hash_pixels', 'signature'} for an image file.
+
+    hash_pixels is the (8, 9, 4) thumbnail dHash is computed from and
+    signature the (16, 16, 4) one used to confirm matches.
+    """
+    with Image.open(path) as img:
+        rgba = img.convert('RGBA')
+        width, height = img.size
+    return {'sha256': file_hash(path), 'bytes': os.path.getsize(path), 'width': width, 'height': height,
+            'hash_pixels': np.asarray(rgba.resize((HASH_SIZE + 1, HASH_SIZE), Image.BOX), dtype=np.uint8),
+            'signature': np.asarray(rgba.resize((SIGNATURE_SIZE, SIGNATURE_SIZE), Image.BOX), dtype=np.uint8)}
+
+def dhashes(hash_pixels):
+    """64-bit difference hashes of a (N, 8, 9, 4) thumbnail stack as a uint64 array.
+
+    Brightness is taken over black so transparent areas count as dark; each
+    bit says whether a pixel is brighter than its left neighbour.
+    """
+    rgba = np.asarray(hash_pixels, dtype=np.float32)
+    gray = (rgba[..., :3] @ np.array([0.299, 0.587, 0.114], dtype=np.float32)) * (rgba[..., 3] / 255)
+    bits = gray[:, :, 1:] > gray[:, :, :-1]
+    return np.packbits(bits.reshape(len(bits), -1), axis=1).view('>u8')[:, 0].astype(np.uint64)
+
+def popcount(values):
+    """Number of set bits of each uint64"""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    return np.unpackbits(values.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+def candidate_pairs(hashes, max_distance):
+    """(i, j) index arrays of every pair of hashes that may be within max_distance bits.
+
+    The 64 bits are cut into max_distance + 1 bands; two hashes that
+    differ in at most max_distance bits agree exactly on at least one band,
+    so only hashes sharing a band value need comparing.
+    """
+    edges = np.linspace(0, 64, max_distance + 2).astype(int)
+    pairs = set()
+    for low, high in zip(edges, edges[1:]):
+        keys = (hashes >> np.uint64(low)) & np.uint64((1 << int(high - low)) - 1)
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        for start, end in zip(starts, ends):
+            if end - start > 1:
+                members = np.sort(order[start:end])
+                i, j = np.triu_indices(len(members), 1)
+                pairs.update(zip(members[i].tolist(), members[j].tolist()))
+    if not pairs:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int)
+    i, j = np.array(sorted(pairs)).T
+    return i, j
+
+def _premultiplied(rgba):
+    """RGBA as int32 with color scaled by alpha, so hidden color under transparency does not count"""
+    rgba = rgba.astype(np.int32)
+    rgba[..., :3] = rgba[..., :3] * rgba[..., 3:] // 255
+    return rgba
+
+def _visible_delta(a, b):
+    """Per-pixel max channel difference of two same-size RGBA arrays, over pixels visible in either"""
+    delta = np.abs(_premultiplied(a) - _premultiplied(b)).max(axis=-1)
+    return delta[(a[..., 3] > 0) | (b[..., 3] > 0)]
+
+def pixels_match(path_a, path_b):
+    """True if two images are the same picture once the larger is reduced to the smaller's size"""
+    with Image.open(path_a) as a, Image.open(path_b) as b:
+        a, b = a.convert('RGBA'), b.convert('RGBA')
+    if a.width * a.height < b.width * b.height:
+        a, b = b, a
+    if a.size != b.size:
+        a = a.resize(b.size, Image.BOX)
+    delta = _visible_delta(np.asarray(a), np.asarray(b))
+    return len(delta) == 0 or np.mean(delta > PIXEL_TOLERANCE) <= MAX_DIFFERING_PIXELS
+
+def near_duplicate_pairs(items, paths, max_distance=DEFAULT_MAX_DISTANCE):
+    """(i, j) pairs of file_signature() items whose images look the same"""
+    if len(items) < 2:
+        return []
+    hashes = dhashes(np.stack([item['hash_pixels'] for item in items]))
+    i, j = candidate_pairs(hashes, max_distance)
+    if len(i) == 0:
+        return []
+    aspect = np.array([item['width'] / item['height'] for item in items])
+    close = popcount(hashes[i] ^ hashes[j]) <= max_distance
+    close &= np.abs(aspect[i] - aspect[j]) <= MAX_ASPECT_DELTA * np.maximum(aspect[i], aspect[j])
+    i, j = i[close], j[close]
+
+    signatures = np.stack([item['signature'] for item in items])
+    pairs = []
+    for a, b in zip(i.tolist(), j.tolist()):
+        delta = _visible_delta(signatures[a], signatures[b])
+        if (len(delta) == 0 or delta.mean() <= MAX_SIGNATURE_DELTA) and pixels_match(paths[a], paths[b]):
+            pairs.append((a, b))
+    return pairs
+
+def _find(parent, i):
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+def cluster(count, pairs):
+    """Union-find over count items; returns each item's cluster root"""
+    parent = list(range(count))
+    for i, j in pairs:
+        root_i, root_j = _find(parent, i), _find(parent, j)
+        if root_i != root_j:
+            parent[max(root_i, root_j)] = min(root_i, root_j)
+    return [_find(parent, i) for i in range(count)]
+
+def find_duplicates(items, paths, near=False, max_distance=DEFAULT_MAX_DISTANCE):
+    """Canonical item index for every file_signature() item (paths are the matching files).
+
+    Items with equal sha256 are always merged; near=True also merges
+    near-duplicates. Each cluster's canonical item is its largest image
+    (then the smallest file, then the earliest item).
+    """
+    first_with_hash = {}
+    pairs = []
+    for i, item in enumerate(items):
+        j = first_with_hash.setdefault(item['sha256'], i)
+        if j != i:
+            pairs.append((j, i))
+    if near:
+        pairs += near_duplicate_pairs(items, paths, max_distance)
+
+    members = {}
+    for i, root in enumerate(cluster(len(items), pairs)):
+        members.setdefault(root, []).append(i)
+    canonical = [None] * len(items)
+    for group in members.values():
+        best = min(group, key=lambda i: (-items[i]['width'] * items[i]['height'], items[i]['bytes'], i))
+        for i in group:
+            canonical[i] = best
+    return canonical
+
+def bytes_eliminated(items, canonical):
+    """Bytes of every item that is not its cluster's canonical file"""
+    return sum(item['bytes'] for i, item in enumerate(items) if canonical[i] != i)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='PNG files or directories to scan')
+    parser.add_argument('--near', action='store_true', help='also merge near-duplicates, not just identical files')
+    parser.add_argument('--distance', type=int, default=DEFAULT_MAX_DISTANCE,
+                        help='most differing hash bits for a near duplicate')
+    args = parser.parse_args()
+
+    files = []
+    for path in map(Path, args.paths):
+        files += sorted(path.rglob('*.png')) if path.is_dir() else [path]
+    items = [file_signature(path) for path in files]
+    canonical = find_duplicates(items, files, near=args.near, max_distance=args.distance)
+
+    clusters = {}
+    for i, best in enumerate(canonical):
+        if best != i:
+            clusters.setdefault(best, []).append(i)
+    for best, aliases in sorted(clusters.items()):
+        print(f"  {files[best]}")
+        for i in aliases:
+            print(f"    = {files[i]}")
+    print(f"\n{len(files)} images, {len(clusters)} clusters with duplicates, "
+          f"{sum(len(aliases) for aliases in clusters.values())} duplicates "
+          f"({bytes_eliminated(items, canonical):,} bytes)")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Envelope and automation curves for Pixel's PyGame Palace sound generation
+Builds gain curves as whole NumPy arrays instead of filling them sample by sample
+"""
+
+import time
+import numpy as np
+
+def _segment(start_level, end_level, length, curve=0.0):
+    """Interpolate one segment of `length` samples from start_level towards end_level.
+
+    curve == 0 is a straight line; positive values start slow and end fast,
+    negative values start fast and end slow (exponential shaping).
+    """
+    x = np.arange(length) / length
+    if abs(curve) < 1e-6:
+        return start_level + (end_level - start_level) * x
+    shape = (1.0 - np.exp(curve * x)) / (1.0 - np.exp(curve))
+    return start_level + (end_level - start_level) * shape
+
+def breakpoint_envelope(breakpoints, total_samples, sample_rate=44100, curve=0.0):
+    """Build an envelope from a list of (time, level) or (time, level, curve) breakpoints.
+
+    Times are in seconds. The level before the first breakpoint is the first
+    level and the level after the last breakpoint is held to the end.
+    A per-point curve shapes the segment that ends at that point.
+    """
+    envelope = np.empty(total_samples)
+    if not breakpoints:
+        envelope.fill(1.0)
+        return envelope
+
+    points = sorted(breakpoints, key=lambda p: p[0])
+    positions = [min(total_samples, max(0, int(round(p[0] * sample_rate)))) for p in points]
+
+    envelope[:positions[0]] = points[0][1]
+    for i in range(1, len(points)):
+        pos_a, pos_b = positions[i - 1], positions[i]
+        if pos_b > pos_a:
+            seg_curve = points[i][2] if len(points[i]) > 2 else curve
+            envelope[pos_a:pos_b] = _segment(points[i - 1][1], points[i][1], pos_b - pos_a, seg_curve)
+    envelope[positions[-1]:] = points[-1][1]
+    return envelope
+
+def adsr_envelope(total_samples, attack=0.01, decay=0.1, sustain=0.7, release=0.2,
+                  sample_rate=44100, curve=0.0):
+    """Build an ADSR envelope of total_samples samples.
+
+    With curve == 0 the result matches the original per-sample loops exactly.
+    """
+    attack_samples = int(attack * sample_rate)
+    decay_samples = int(decay * sample_rate)
+    release_samples = int(release * sample_rate)
+    sustain_samples = total_samples - attack_samples - decay_samples - release_samples
+
+    envelope = np.ones(total_samples)
+
+    # Segments are written in order so overlaps behave like the old loops
+    start = 0
+    for length, start_level, end_level in [
+        (attack_samples, 0.0, 1.0),
+        (decay_samples, 1.0, sustain),
+    ]:
+        stop = min(start + length, total_samples)
+        if stop > start:
+            envelope[start:stop] = _segment(start_level, end_level, length, curve)[:stop - start]
+        start += length
+
+    if sustain_samples > 0:
+        envelope[start:start + sustain_samples] = sustain
+
+    release_start = attack_samples + decay_samples + max(sustain_samples, 0)
+    if sustain_samples < 0:
+        release_start = total_samples - release_samples
+    if release_samples > 0:
+        release = sustain * (1.0 - _segment(0.0, 1.0, release_samples, curve))
+        lo = max(release_start, 0)
+        hi = min(release_start + release_samples, total_samples)
+        if hi > lo:
+            envelope[lo:hi] = release[lo - release_start:hi - release_start]
+
+    return envelope
+
+def apply_envelope(wave_data, envelope):
+    """Multiply a 1-D wave or a 2-D (voices x samples) array by an envelope.
+
+    The envelope may be 1-D (shared by every voice) or 2-D (one row per voice).
+    """
+    return np.asarray(wave_data) * envelope
+
+def apply_adsr(wave_data, attack=0.01, decay=0.1, sustain=0.7, release=0.2,
+               sample_rate=44100, curve=0.0):
+    """Apply one ADSR envelope along the last axis of wave_data"""
+    wave_data = np.asarray(wave_data)
+    envelope = adsr_envelope(wave_data.shape[-1], attack, decay, sustain, release,
+                             sample_rate, curve)
+    return wave_data * envelope
+
+def stack_envelopes(breakpoint_lists, total_samples, sample_rate=44100, curve=0.0):
+    """Build a (voices x samples) envelope array, one breakpoint list per voice"""
+    envelopes = np.empty((len(breakpoint_lists), total_samples))
+    for row, breakpoints in enumerate(breakpoint_lists):
+        envelopes[row] = breakpoint_envelope(breakpoints, total_samples, sample_rate, curve)
+    return envelopes
+
+def _loop_adsr(wave_data, attack, decay, sustain, release, sample_rate=44100):
+    """Original per-sample ADSR implementation, kept as the benchmark baseline"""
+    total_samples = len(wave_data)
+    attack_samples = int(attack * sample_rate)
+    decay_samples = int(decay * sample_rate)
+    release_samples = int(release * sample_rate)
+    sustain_samples = total_samples - attack_samples - decay_samples - release_samples
+
+    envelope = np.ones(total_samples)
+    for i in range(attack_samples):
+        envelope[i] = i / attack_samples
+    for i in range(decay_samples):
+        envelope[attack_samples + i] = 1.0 - (1.0 - sustain) * (i / decay_samples)
+    for i in range(sustain_samples):
+        envelope[attack_samples + decay_samples + i] = sustain
+    for i in range(release_samples):
+        envelope[attack_samples + decay_samples + sustain_samples + i] = sustain * (1.0 - i / release_samples)
+    return wave_data * envelope
+
+def benchmark(duration=40, sample_rate=44100, voices=8):
+    """Compare the per-sample loop against the vectorized envelope"""
+    samples = int(duration * sample_rate)
+    wave_data = np.random.default_rng(0).standard_normal(samples)
+    params = (0.5, 2.0, 0.6, 5.0)
+
+    start = time.perf_counter()
+    expected = _loop_adsr(wave_data, *params, sample_rate=sample_rate)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = apply_adsr(wave_data, *params, sample_rate=sample_rate)
+    vector_time = time.perf_counter() - start
+
+    batch = np.tile(wave_data, (voices, 1))
+    start = time.perf_counter()
+    apply_adsr(batch, *params, sample_rate=sample_rate)
+    batch_time = time.perf_counter() - start
+
+    print(f"ADSR envelope, {duration}s at {sample_rate} Hz ({samples} samples)")
+    print(f"  per-sample loop: {samples / loop_time:>14,.0f} samples/s")
+    print(f"  vectorized:      {samples / vector_time:>14,.0f} samples/s "
+          f"({loop_time / vector_time:.0f}x)")
+    print(f"  batched x{voices}:     {voices * samples / batch_time:>14,.0f} samples/s")
+    print(f"  identical output: {np.array_equal(expected, result)}")
+
+if __name__ == "__main__":
+    benchmark()
@@ -5,189 +5,207 @@ Creates sprite sheets, placeholder sounds, and organizes assets
 """
 
 from PIL import Image, ImageDraw, ImageFont
+import argparse
 import json
 import os
-import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 import numpy as np
 
-def create_sprite_sheet(name, sprite_size=32, cols=8, rows=8, color_scheme=None):
-    """Generate a sprite sheet with simple geometric shapes"""
-    width = sprite_size * cols
-    height = sprite_size * rows
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-    
+from build_cache import BuildCache
+from image_encoding import format_savings, save_compact
+from palette_swap import apply_palette, hue_variants, index_image, remap_colors
+from sdf_raster import render_sheet
+from seeding import rng_for, seed_for
+from textures import tile_noise
+
+def create_sprite_sheet(name, sprite_size=32, cols=8, rows=8, color_scheme=None, rng=None):
+    """Generate a sprite sheet with simple geometric shapes.
+
+    rng is a numpy Generator (a fresh unseeded one by default).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
     if color_scheme is None:
         color_scheme = [(255, 100, 100), (100, 255, 100), (100, 100, 255), 
                        (255, 255, 100), (255, 100, 255), (100, 255, 255)]
     
-    for row in range(rows):
-        for col in range(cols):
-            x = col * sprite_size
-            y = row * sprite_size
-            
-            # Random sprite type
-            sprite_type = random.choice(['circle', 'square', 'triangle', 'diamond', 'star'])
-            color = random.choice(color_scheme)
-            
-            if sprite_type == 'circle':
-                draw.ellipse([x+4, y+4, x+sprite_size-4, y+sprite_size-4], fill=color)
-            elif sprite_type == 'square':
-                draw.rectangle([x+6, y+6, x+sprite_size-6, y+sprite_size-6], fill=color)
-            elif sprite_type == 'triangle':
-                points = [(x+sprite_size//2, y+4), (x+4, y+sprite_size-4), 
-                         (x+sprite_size-4, y+sprite_size-4)]
-                draw.polygon(points, fill=color)
-            elif sprite_type == 'diamond':
-                points = [(x+sprite_size//2, y+4), (x+sprite_size-4, y+sprite_size//2),
-                         (x+sprite_size//2, y+sprite_size-4), (x+4, y+sprite_size//2)]
-                draw.polygon(points, fill=color)
-            else:  # star
-                # Simple 4-point star
-                points = []
-                for i in range(8):
-                    angle = i * np.pi / 4
-                    if i % 2 == 0:
-                        r = sprite_size // 2 - 4
-                    else:
-                        r = sprite_size // 4
-                    px = x + sprite_size // 2 + r * np.cos(angle)
-                    py = y + sprite_size // 2 + r * np.sin(angle)
-                    points.append((px, py))
-                draw.polygon(points, fill=color)
+    # Random sprite type and color for every cell
+    shape_names = ['circle', 'square', 'triangle', 'diamond', 'star']
+    shapes = np.array(shape_names, dtype=object)[rng.integers(0, len(shape_names), (rows, cols))]
+    colors = np.array(color_scheme)[rng.integers(0, len(color_scheme), (rows, cols))]
     
-    return img
+    # All cells are rasterized together as anti-aliased signed distance fields
+    return Image.fromarray(render_sheet(shapes, colors, sprite_size), 'RGBA')
 
-def create_tileset(name, tile_size=16, cols=16, rows=16):
-    """Generate a tileset with various tile patterns"""
-    width = tile_size * cols
-    height = tile_size * rows
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+# Tile types in the order they repeat across a tileset
+TILE_TYPES = [
+    ('grass', (34, 139, 34)),
+    ('dirt', (139, 69, 19)),
+    ('stone', (128, 128, 128)),
+    ('water', (64, 164, 223)),
+    ('sand', (238, 203, 173)),
+    ('wood', (160, 82, 45)),
+    ('brick', (178, 34, 34)),
+    ('ice', (176, 224, 230)),
+]
+
+def create_tileset(name, tile_size=16, cols=16, rows=16, rng=None, noise=None, noise_strength=0.12):
+    """Generate a tileset with various tile patterns.
+
+    The whole sheet is built as one (rows, cols, tile_size, tile_size) array:
+    base colors with per-tile jitter, optionally shaded by tileable 'value'
+    or 'perlin' noise (flat by default), then grass blades, brick mortar and water
+    ripples are written with array indexing. rng is a numpy Generator (a
+    fresh unseeded one by default).
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    ts = tile_size
+    scale = ts / 16
     
-    # Define tile types
-    tile_types = {
-        'grass': (34, 139, 34),
-        'dirt': (139, 69, 19),
-        'stone': (128, 128, 128),
-        'water': (64, 164, 223),
-        'sand': (238, 203, 173),
-        'wood': (160, 82, 45),
-        'brick': (178, 34, 34),
-        'ice': (176, 224, 230)
-    }
+    # Choose tile type based on position
+    types = (np.arange(rows * cols) % len(TILE_TYPES)).reshape(rows, cols)
+    type_names = [tile_name for tile_name, _ in TILE_TYPES]
+    base_colors = np.array([color for _, color in TILE_TYPES])
     
-    tile_list = list(tile_types.items())
+    # Add variation
+    colors = np.clip(base_colors[types] + rng.integers(-20, 21, (rows, cols, 3)), 0, 255)
+    rgb = np.broadcast_to(colors[:, :, np.newaxis, np.newaxis, :].astype(float), (rows, cols, ts, ts, 3))
+    if noise is not None:
+        period = max(2, ts // 8)
+        field = tile_noise(noise, rows * cols, ts, period, rng, octaves=2).reshape(rows, cols, ts, ts)
+        rgb = rgb * (1 + noise_strength * (2 * field - 1))[..., np.newaxis]
+    rgb = np.clip(np.round(rgb), 0, 255).astype(np.uint8)
     
-    for row in range(rows):
-        for col in range(cols):
-            x = col * tile_size
-            y = row * tile_size
-            
-            # Choose tile type based on position
-            tile_idx = (row * cols + col) % len(tile_list)
-            tile_name, base_color = tile_list[tile_idx]
+    # Grass blades: short vertical strokes, more of them on bigger tiles
+    # (a 3-pixel blade needs a tile of at least 4 pixels)
+    grass_rows, grass_cols = np.nonzero(types == type_names.index('grass'))
+    if ts >= 4:
+        blades = max(3, int(round(3 * scale * scale)))
+        gx = rng.integers(2, ts - 1, (len(grass_rows), blades))
+        gy = rng.integers(2, ts - 1, (len(grass_rows), blades))
+        for dy in range(3):
+            rgb[grass_rows[:, None], grass_cols[:, None], gy - dy, gx] = (0, 100, 0)
+    
+    # Brick mortar: a horizontal line through every brick, a vertical one on even rows
+    mortar = max(1, ts // 16)
+    middle = slice(ts // 2, ts // 2 + mortar)
+    bricks = types == type_names.index('brick')
+    rgb[bricks, middle, :] = (100, 20, 20)
+    rgb[bricks & (np.arange(rows) % 2 == 0)[:, np.newaxis], :, middle] = (100, 20, 20)
+    
+    # Water: a dotted sine ripple blended in at 50/255 white
+    water_rows, water_cols = np.nonzero(types == type_names.index('water'))
+    wave_x = np.arange(0, ts, 4)
+    x = water_cols[:, None] * ts
+    wave_y = ts // 2 + np.trunc(2 * scale * np.sin(x + wave_x)).astype(int)
+    wave_y = np.clip(wave_y, 0, ts - 1)
+    ripple = rgb[water_rows[:, None], water_cols[:, None], wave_y, wave_x].astype(float)
+    ripple += (255 - ripple) * (50 / 255)
+    rgb[water_rows[:, None], water_cols[:, None], wave_y, wave_x] = np.round(ripple).astype(np.uint8)
+    
+    # (rows, cols, ts, ts, 3) -> (rows * ts, cols * ts, 4)
+    pixels = np.full((rows, ts, cols, ts, 4), 255, dtype=np.uint8)
+    pixels[..., :3] = rgb.transpose(0, 2, 1, 3, 4)
+    return Image.fromarray(pixels.reshape(rows * ts, cols * ts, 4), 'RGBA')
+
+# Character colors
+CHARACTER_COLORS = [
+    ('hero', (100, 100, 255)),  # Blue hero
+    ('enemy1', (255, 100, 100)),  # Red enemy
+    ('enemy2', (100, 255, 100)),  # Green enemy
+    ('npc', (255, 255, 100)),  # Yellow NPC
+]
+
+IMAGE_CACHE_MANIFEST = 'assets/.build-cache/images.json'
+
+# Characters are drawn once in this color and recolored per character
+CHARACTER_KEY_COLOR = (255, 255, 255)
+
+def draw_character_sheet(color, sprite_size=32):
+    """Draw the character sheet in one color: poses in rows, animation frames in columns"""
+    img = Image.new('RGBA', (sprite_size * 4, sprite_size * 4), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    
+    # Different poses (rows): idle, walk, jump, attack
+    for pose in range(4):
+        # Animation frames (columns)
+        for frame in range(4):
+            x = frame * sprite_size
+            y = pose * sprite_size
             
-            # Add variation
-            color = tuple(min(255, max(0, c + random.randint(-20, 20))) for c in base_color)
+            # Draw simple character
+            # Head
+            head_size = 8
+            draw.ellipse([x+12, y+4, x+20, y+12], fill=color)
             
-            # Draw base tile
-            draw.rectangle([x, y, x+tile_size, y+tile_size], fill=color)
+            # Body
+            body_height = 12
+            draw.rectangle([x+14, y+12, x+18, y+24], fill=color)
             
-            # Add texture
-            if tile_name == 'grass':
-                for _ in range(3):
-                    gx = x + random.randint(2, tile_size-2)
-                    gy = y + random.randint(2, tile_size-2)
-                    draw.line([gx, gy, gx, gy-2], fill=(0, 100, 0))
-            elif tile_name == 'brick':
-                # Draw brick lines
-                if row % 2 == 0:
-                    draw.line([x+tile_size//2, y, x+tile_size//2, y+tile_size], fill=(100, 20, 20))
-                draw.line([x, y+tile_size//2, x+tile_size, y+tile_size//2], fill=(100, 20, 20))
-            elif tile_name == 'water':
-                # Add wave pattern
-                for i in range(0, tile_size, 4):
-                    wave_y = y + tile_size//2 + int(2 * np.sin(x + i))
-                    draw.point((x+i, wave_y), fill=(255, 255, 255, 50))
+            # Arms and legs with animation
+            if pose == 0:  # Idle
+                # Arms
+                draw.line([x+14, y+14, x+10, y+18], fill=color, width=2)
+                draw.line([x+18, y+14, x+22, y+18], fill=color, width=2)
+                # Legs
+                draw.line([x+15, y+24, x+13, y+30], fill=color, width=2)
+                draw.line([x+17, y+24, x+19, y+30], fill=color, width=2)
+            elif pose == 1:  # Walk
+                # Animated walking
+                offset = frame * 2
+                # Arms swing
+                draw.line([x+14, y+14, x+10-offset, y+18], fill=color, width=2)
+                draw.line([x+18, y+14, x+22+offset, y+18], fill=color, width=2)
+                # Legs walk
+                draw.line([x+15, y+24, x+13-offset, y+30], fill=color, width=2)
+                draw.line([x+17, y+24, x+19+offset, y+30], fill=color, width=2)
+            elif pose == 2:  # Jump
+                # Arms up
+                draw.line([x+14, y+14, x+10, y+10], fill=color, width=2)
+                draw.line([x+18, y+14, x+22, y+10], fill=color, width=2)
+                # Legs bent
+                draw.line([x+15, y+24, x+13, y+26], fill=color, width=2)
+                draw.line([x+17, y+24, x+19, y+26], fill=color, width=2)
+            else:  # Attack
+                # Arm extended
+                draw.line([x+14, y+14, x+8, y+14], fill=color, width=2)
+                draw.line([x+18, y+14, x+26, y+14], fill=color, width=2)
+                # Legs stance
+                draw.line([x+15, y+24, x+11, y+30], fill=color, width=2)
+                draw.line([x+17, y+24, x+21, y+30], fill=color, width=2)
     
     return img
 
+def character_base(sprite_size=32):
+    """(palette, indices) of the key-colored character sheet, for palette swaps"""
+    return index_image(draw_character_sheet(CHARACTER_KEY_COLOR, sprite_size))
+
+def create_character_sprite(char_name, sprite_size=32, base=None):
+    """Create one character's sprite sheet by recoloring the shared base sheet.
+
+    Pass base=character_base(sprite_size) to reuse one render across calls.
+    """
+    palette, indices = base if base is not None else character_base(sprite_size)
+    color = dict(CHARACTER_COLORS)[char_name]
+    return apply_palette(remap_colors(palette, {CHARACTER_KEY_COLOR: color}), indices)
+
 def create_character_sprites():
     """Create simple character sprites in different poses"""
-    sprites = []
-    sprite_size = 32
-    
-    # Character colors
-    colors = [
-        ('hero', (100, 100, 255)),  # Blue hero
-        ('enemy1', (255, 100, 100)),  # Red enemy
-        ('enemy2', (100, 255, 100)),  # Green enemy
-        ('npc', (255, 255, 100)),  # Yellow NPC
-    ]
-    
-    for char_name, color in colors:
-        # Create sprite sheet for this character
-        img = Image.new('RGBA', (sprite_size * 4, sprite_size * 4), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Different poses (rows): idle, walk, jump, attack
-        for pose in range(4):
-            # Animation frames (columns)
-            for frame in range(4):
-                x = frame * sprite_size
-                y = pose * sprite_size
-                
-                # Draw simple character
-                # Head
-                head_size = 8
-                draw.ellipse([x+12, y+4, x+20, y+12], fill=color)
-                
-                # Body
-                body_height = 12
-                draw.rectangle([x+14, y+12, x+18, y+24], fill=color)
-                
-                # Arms and legs with animation
-                if pose == 0:  # Idle
-                    # Arms
-                    draw.line([x+14, y+14, x+10, y+18], fill=color, width=2)
-                    draw.line([x+18, y+14, x+22, y+18], fill=color, width=2)
-                    # Legs
-                    draw.line([x+15, y+24, x+13, y+30], fill=color, width=2)
-                    draw.line([x+17, y+24, x+19, y+30], fill=color, width=2)
-                elif pose == 1:  # Walk
-                    # Animated walking
-                    offset = frame * 2
-                    # Arms swing
-                    draw.line([x+14, y+14, x+10-offset, y+18], fill=color, width=2)
-                    draw.line([x+18, y+14, x+22+offset, y+18], fill=color, width=2)
-                    # Legs walk
-                    draw.line([x+15, y+24, x+13-offset, y+30], fill=color, width=2)
-                    draw.line([x+17, y+24, x+19+offset, y+30], fill=color, width=2)
-                elif pose == 2:  # Jump
-                    # Arms up
-                    draw.line([x+14, y+14, x+10, y+10], fill=color, width=2)
-                    draw.line([x+18, y+14, x+22, y+10], fill=color, width=2)
-                    # Legs bent
-                    draw.line([x+15, y+24, x+13, y+26], fill=color, width=2)
-                    draw.line([x+17, y+24, x+19, y+26], fill=color, width=2)
-                else:  # Attack
-                    # Arm extended
-                    draw.line([x+14, y+14, x+8, y+14], fill=color, width=2)
-                    draw.line([x+18, y+14, x+26, y+14], fill=color, width=2)
-                    # Legs stance
-                    draw.line([x+15, y+24, x+11, y+30], fill=color, width=2)
-                    draw.line([x+17, y+24, x+21, y+30], fill=color, width=2)
-        
-        sprites.append((f"{char_name}_sprites.png", img))
-    
-    return sprites
+    base = character_base()
+    return [(f"{char_name}_sprites.png", create_character_sprite(char_name, base=base))
+            for char_name, _ in CHARACTER_COLORS]
 
-def create_ui_elements():
-    """Create UI element sprites"""
-    elements = []
-    
-    # Buttons
+def create_enemy_variants(count, enemy='enemy1', sprite_size=32, saturation=1.0, value=1.0):
+    """Create `count` hue-rotated variants of an enemy's sheet from one render"""
+    palette, indices = character_base(sprite_size)
+    palette = remap_colors(palette, {CHARACTER_KEY_COLOR: dict(CHARACTER_COLORS)[enemy]})
+    return hue_variants(palette, indices, count, saturation, value)
+
+def create_ui_buttons():
+    """Create the button sheet: normal, hover, pressed and disabled states"""
     button_img = Image.new('RGBA', (256, 128), (0, 0, 0, 0))
     draw = ImageDraw.Draw(button_img)
     
@@ -207,9 +225,10 @@ def create_ui_elements():
         # Button border
         draw.rounded_rectangle([x+4, y+4, x+124, y+60], radius=8, outline=(0, 0, 0), width=2)
     
-    elements.append(('ui_buttons.png', button_img))
-    
-    # Health bars
+    return button_img
+
+def create_ui_health_bars():
+    """Create health bars from full to nearly empty"""
     bar_img = Image.new('RGBA', (256, 64), (0, 0, 0, 0))
     draw = ImageDraw.Draw(bar_img)
     
@@ -234,9 +253,10 @@ def create_ui_elements():
         # Bar border
         draw.rectangle([x, y, x+width, y+height], outline=(0, 0, 0), width=1)
     
-    elements.append(('ui_health_bars.png', bar_img))
-    
-    # Icons
+    return bar_img
+
+def create_ui_icons():
+    """Create a row of item icons"""
     icon_img = Image.new('RGBA', (256, 256), (0, 0, 0, 0))
     draw = ImageDraw.Draw(icon_img)
     
@@ -279,54 +299,175 @@ def create_ui_elements():
             # Generic square icon
             draw.rectangle([x+8, y+8, x+24, y+24], fill=color)
     
-    elements.append(('ui_icons.png', icon_img))
-    
-    return elements
+    return icon_img
 
-def generate_all_assets():
-    """Generate all game assets"""
-    
-    # Create sprite sheets
-    print("Generating sprite sheets...")
-    os.makedirs('assets/sprites', exist_ok=True)
-    
-    # Generic sprite sheets
-    sprite_names = [
-        'enemies', 'items', 'effects', 'projectiles', 'platforms',
-        'powerups', 'obstacles', 'decorations', 'particles', 'backgrounds'
+def create_ui_elements():
+    """Create UI element sprites"""
+    return [
+        ('ui_buttons.png', create_ui_buttons()),
+        ('ui_health_bars.png', create_ui_health_bars()),
+        ('ui_icons.png', create_ui_icons()),
     ]
+
+def save_image(img, path, webp=False):
+    """Write a generated image to disk as a compact PNG (plus a lossless .webp if asked).
+
+    Returns the byte sizes from image_encoding.save_compact.
+    """
+    return save_compact(img, path, webp=webp)
+
+# Generic sprite sheets
+SPRITE_NAMES = [
+    'enemies', 'items', 'effects', 'projectiles', 'platforms',
+    'powerups', 'obstacles', 'decorations', 'particles', 'backgrounds'
+]
+
+TILESET_NAMES = [
+    'dungeon', 'forest', 'desert', 'ice', 'lava',
+    'city', 'space', 'underwater', 'clouds', 'cave'
+]
+
+def image_jobs(tile_size=16, tile_noise=None):
+    """Return [(name, render)] for every generated image, in output order.
+
+    render(rng) returns the image; rng is the image's own Generator, seeded
+    from its name. tile_noise is the tilesets' noise kind (None for flat tiles).
+    """
+    jobs = []
+    for name in SPRITE_NAMES:
+        jobs.append((f'{name}_sprites', lambda rng, name=name: create_sprite_sheet(name, rng=rng)))
+    for char_name, _ in CHARACTER_COLORS:
+        jobs.append((f'{char_name}_sprites', lambda rng, char_name=char_name: create_character_sprite(char_name)))
+    jobs += [
+        ('ui_buttons', lambda rng: create_ui_buttons()),
+        ('ui_health_bars', lambda rng: create_ui_health_bars()),
+        ('ui_icons', lambda rng: create_ui_icons()),
+    ]
+    for name in TILESET_NAMES:
+        jobs.append((f'{name}_tileset',
+                     lambda rng, name=name: create_tileset(name, tile_size=tile_size, rng=rng, noise=tile_noise)))
+    return jobs
+
+def image_path(name):
+    """Output path of a named image"""
+    if name.endswith('_tileset'):
+        return f'assets/tilesets/{name}.png'
+    return f'assets/sprites/{name}.png'
+
+def image_outputs(name, webp=False):
+    """Every file written for a named image"""
+    path = image_path(name)
+    return [path, os.path.splitext(path)[0] + '.webp'] if webp else [path]
+
+def image_cache_keys(cache, tile_size=16, webp=False, tile_noise=None):
+    """Build-cache key for every image, from its generator code, parameters and seed"""
+    keys = {}
+    for name, render in image_jobs(tile_size, tile_noise):
+        params = {'name': name, 'webp': webp}
+        if name.endswith('_tileset'):
+            params['tile_size'] = tile_size
+            params['tile_noise'] = tile_noise
+        keys[name] = cache.key([render, save_image], params, seed_for(name))
+    return keys
+
+def render_image_job(name, tile_size=16, webp=False, tile_noise=None):
+    """Render and save one named image; returns (seconds taken, byte sizes).
+
+    The time includes encoding the PNG.
+    """
+    start = time.perf_counter()
+    render = dict(image_jobs(tile_size, tile_noise))[name]
+    sizes = save_image(render(rng_for(name)), image_path(name), webp)
+    return time.perf_counter() - start, sizes
+
+def _run_jobs(pool, names, tile_size, webp, tile_noise):
+    """Render names in order, on the pool if there is one"""
+    job = partial(render_image_job, tile_size=tile_size, webp=webp, tile_noise=tile_noise)
+    if pool is None:
+        return zip(names, map(job, names))
+    return zip(names, pool.map(job, names))
+
+def generate_all_assets(force=False, clean=False, tile_size=16, jobs=1, webp=False, tile_noise=None):
+    """Generate all game assets.
+
+    Every image is seeded from its name, so with jobs > 1 the images are
+    rendered and PNG-encoded on a process pool and the files are identical
+    to a serial run. Tilesets use tile_size pixel tiles, shaded with
+    tile_noise ('value' or 'perlin') if given.
+
+    Low-color images are saved as palette PNGs and every PNG is optimized;
+    webp=True also writes a lossless .webp next to each one.
+
+    Images whose build-cache key and file hash are unchanged are skipped
+    unless force=True; clean=True deletes outputs that are no longer
+    generated.
+    """
+    os.makedirs('assets/sprites', exist_ok=True)
+    os.makedirs('assets/tilesets', exist_ok=True)
     
-    for name in sprite_names:
-        img = create_sprite_sheet(name)
-        img.save(f'assets/sprites/{name}_sprites.png')
-        print(f"  Created {name}_sprites.png")
-    
-    # Character sprites
-    char_sprites = create_character_sprites()
-    for filename, img in char_sprites:
-        img.save(f'assets/sprites/{filename}')
-        print(f"  Created {filename}")
-    
-    # UI elements
-    ui_elements = create_ui_elements()
-    for filename, img in ui_elements:
-        img.save(f'assets/sprites/{filename}')
-        print(f"  Created {filename}")
+    cache = BuildCache(IMAGE_CACHE_MANIFEST, force=force)
+    keys = image_cache_keys(cache, tile_size, webp, tile_noise)
+    if clean:
+        for path in cache.prune([path for name in keys for path in image_outputs(name, webp)]):
+            print(f"  Removed stale {path}")
+    stale = [name for name, key in keys.items()
+             if not all(cache.is_fresh(path, key) for path in image_outputs(name, webp))]
     
-    # Create tilesets
-    print("\nGenerating tilesets...")
-    os.makedirs('assets/tilesets', exist_ok=True)
+    sprite_names = [name for name in stale if not name.endswith('_tileset')]
+    tileset_names = [name for name in stale if name.endswith('_tileset')]
+    timings = []
+    saved = 0
     
-    tileset_names = [
-        'dungeon', 'forest', 'desert', 'ice', 'lava',
-        'city', 'space', 'underwater', 'clouds', 'cave'
-    ]
+    wall_start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        print("Generating sprite sheets...")
+        for name, (elapsed, sizes) in _run_jobs(pool, sprite_names, tile_size, webp, tile_noise):
+            for path in image_outputs(name, webp):
+                cache.record(path, keys[name])
+            timings.append((name, elapsed))
+            saved += sizes['baseline'] - sizes['png']
+            print(format_savings(f'Created {name}.png', sizes))
+        
+        print("\nGenerating tilesets...")
+        for name, (elapsed, sizes) in _run_jobs(pool, tileset_names, tile_size, webp, tile_noise):
+            for path in image_outputs(name, webp):
+                cache.record(path, keys[name])
+            timings.append((name, elapsed))
+            saved += sizes['baseline'] - sizes['png']
+            print(format_savings(f'Created {name}.png', sizes))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        cache.save()
+    wall_time = time.perf_counter() - wall_start
     
-    for name in tileset_names:
-        img = create_tileset(name)
-        img.save(f'assets/tilesets/{name}_tileset.png')
-        print(f"  Created {name}_tileset.png")
+    if len(timings) < len(keys):
+        print(f"\nSkipped {len(keys) - len(timings)} up-to-date images")
+    print(f"\nTiming summary ({len(timings)} images, {jobs} job{'s' if jobs > 1 else ''}):")
+    for name, elapsed in sorted(timings, key=lambda item: item[1], reverse=True):
+        print(f"  {name:<24} {elapsed * 1000:8.1f} ms")
+    print(f"  {'render total':<24} {sum(t for _, t in timings) * 1000:8.1f} ms")
+    print(f"  {'wall time':<24} {wall_time * 1000:8.1f} ms")
+    if timings:
+        print(f"  {'bytes saved':<24} {saved:>8,}")
 
 if __name__ == "__main__":
-    generate_all_assets()
-    print("\nAsset generation complete!")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate every image even if the build cache says it is up to date')
+    parser.add_argument('--clean', action='store_true',
+                        help='delete outputs and cache entries that are no longer generated')
+    parser.add_argument('--tile-size', type=int, default=16,
+                        help='tileset tile size in pixels (default 16)')
+    parser.add_argument('--tile-noise', choices=['value', 'perlin'],
+                        help='shade tilesets with tileable noise (default: flat tiles)')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of worker processes (output is identical for any value)')
+    parser.add_argument('--webp', action='store_true',
+                        help='also write a lossless .webp next to every PNG')
+    args = parser.parse_args()
+
+    generate_all_assets(force=args.force, clean=args.clean, tile_size=args.tile_size, jobs=args.jobs,
+                        webp=args.webp, tile_noise=args.tile_noise)
+    print("\nAsset generation complete!")
@@ -4,64 +4,54 @@ Generate CC0 sound effects and music for Pixel's PyGame Palace
 Creates WAV files for various game sounds
 """
 
+import argparse
 import numpy as np
 import wave
 import struct
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-def create_sine_wave(frequency, duration, sample_rate=44100, amplitude=0.5):
-    """Generate a sine wave"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    wave_data = amplitude * np.sin(2 * np.pi * frequency * t)
-    return wave_data
-
-def create_square_wave(frequency, duration, sample_rate=44100, amplitude=0.5):
-    """Generate a square wave"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    wave_data = amplitude * np.sign(np.sin(2 * np.pi * frequency * t))
-    return wave_data
-
-def create_sawtooth_wave(frequency, duration, sample_rate=44100, amplitude=0.5):
-    """Generate a sawtooth wave"""
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    wave_data = amplitude * (2 * (t * frequency - np.floor(t * frequency + 0.5)))
-    return wave_data
-
-def create_noise(duration, sample_rate=44100, amplitude=0.3):
-    """Generate white noise"""
+from audio_analysis import (ANALYSIS_PATH, MAX_PEAK_DB, TARGET_LOUDNESS, analyze_audio, analyze_files,
+                            loudness_gain, normalize_wave)
+from build_cache import BuildCache
+from dsp import lowpass
+from envelopes import apply_adsr
+from oscillators import oscillator_bank, time_base
+from seeding import rng_for, seed_for
+from streaming import DEFAULT_BLOCK_SIZE, render_blocks, render_full, stream_wave
+
+def _tone(waveform, frequency, duration, sample_rate, amplitude, start, stop):
+    """Render samples [start, stop) of a single constant-frequency voice"""
+    if stop is None:
+        stop = int(sample_rate * duration)
+    return oscillator_bank([frequency], stop - start, sample_rate, waveform,
+                           amplitude, start=start)[0]
+
+def create_sine_wave(frequency, duration, sample_rate=44100, amplitude=0.5, start=0, stop=None):
+    """Generate a sine wave (optionally only samples [start, stop))"""
+    return _tone('sine', frequency, duration, sample_rate, amplitude, start, stop)
+
+def create_square_wave(frequency, duration, sample_rate=44100, amplitude=0.5, start=0, stop=None):
+    """Generate a square wave (optionally only samples [start, stop))"""
+    return _tone('square', frequency, duration, sample_rate, amplitude, start, stop)
+
+def create_sawtooth_wave(frequency, duration, sample_rate=44100, amplitude=0.5, start=0, stop=None):
+    """Generate a sawtooth wave (optionally only samples [start, stop))"""
+    return _tone('sawtooth', frequency, duration, sample_rate, amplitude, start, stop)
+
+def create_noise(duration, sample_rate=44100, amplitude=0.3, rng=None):
+    """Generate white noise from rng (a fresh unseeded Generator by default)"""
+    if rng is None:
+        rng = np.random.default_rng()
     samples = int(sample_rate * duration)
-    noise = amplitude * (np.random.random(samples) * 2 - 1)
+    noise = amplitude * (rng.random(samples) * 2 - 1)
     return noise
 
-def apply_envelope(wave_data, attack=0.01, decay=0.1, sustain=0.7, release=0.2):
-    """Apply ADSR envelope to wave"""
-    total_samples = len(wave_data)
-    sample_rate = 44100
-    
-    attack_samples = int(attack * sample_rate)
-    decay_samples = int(decay * sample_rate)
-    release_samples = int(release * sample_rate)
-    sustain_samples = total_samples - attack_samples - decay_samples - release_samples
-    
-    envelope = np.ones(total_samples)
-    
-    # Attack
-    for i in range(attack_samples):
-        envelope[i] = i / attack_samples
-    
-    # Decay
-    for i in range(decay_samples):
-        envelope[attack_samples + i] = 1.0 - (1.0 - sustain) * (i / decay_samples)
-    
-    # Sustain
-    for i in range(sustain_samples):
-        envelope[attack_samples + decay_samples + i] = sustain
-    
-    # Release
-    for i in range(release_samples):
-        envelope[attack_samples + decay_samples + sustain_samples + i] = sustain * (1.0 - i / release_samples)
-    
-    return wave_data * envelope
+def apply_envelope(wave_data, attack=0.01, decay=0.1, sustain=0.7, release=0.2, sample_rate=44100):
+    """Apply ADSR envelope to wave (1-D, or 2-D voices x samples)"""
+    return apply_adsr(wave_data, attack, decay, sustain, release, sample_rate)
 
 def save_wave(filename, wave_data, sample_rate=44100):
     """Save wave data to WAV file"""
@@ -79,26 +69,25 @@ def create_jump_sound():
     # Rising frequency sweep
     duration = 0.2
     sample_rate = 44100
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    t = time_base(int(sample_rate * duration), sample_rate)
     frequency = 200 + 800 * t / duration  # Sweep from 200Hz to 1000Hz
-    wave = 0.5 * np.sin(2 * np.pi * frequency * t)
+    wave = oscillator_bank([frequency], sample_rate=sample_rate, amplitudes=0.5)[0]
     return apply_envelope(wave, attack=0.01, decay=0.05, sustain=0.3, release=0.14)
 
 def create_coin_sound():
     """Create a coin collection sound"""
     # Two quick high-pitched tones
-    tone1 = create_sine_wave(800, 0.1) * 0.5
-    tone2 = create_sine_wave(1200, 0.1) * 0.5
+    tone1, tone2 = oscillator_bank([800, 1200], int(44100 * 0.1), amplitudes=0.5 * 0.5)
     silence = np.zeros(int(44100 * 0.05))
     
     wave = np.concatenate([tone1, silence, tone2])
     return apply_envelope(wave, attack=0.001, decay=0.01, sustain=0.5, release=0.05)
 
-def create_explosion_sound():
+def create_explosion_sound(rng=None):
     """Create an explosion sound"""
     # Low frequency burst with noise
     low_freq = create_sine_wave(50, 0.5) * 0.3
-    noise = create_noise(0.5) * 0.7
+    noise = create_noise(0.5, rng=rng) * 0.7
     combined = low_freq + noise
     
     # Apply heavy envelope for explosion effect
@@ -108,28 +97,27 @@ def create_laser_sound():
     """Create a laser/shoot sound"""
     duration = 0.2
     sample_rate = 44100
-    t = np.linspace(0, duration, int(sample_rate * duration))
-    # Descending frequency sweep
+    t = time_base(int(sample_rate * duration), sample_rate)
+    # Descending frequency sweep, ring-modulated by a slow sawtooth
     frequency = 1000 - 800 * t / duration
-    wave = 0.5 * create_sawtooth_wave(1, duration) * np.sin(2 * np.pi * frequency * t)
+    voices = oscillator_bank([np.full_like(t, 1.0), frequency], sample_rate=sample_rate,
+                             waveform=['sawtooth', 'sine'], amplitudes=[0.5, 1.0])
+    wave = 0.5 * voices[0] * voices[1]
     return apply_envelope(wave, attack=0.001, decay=0.01, sustain=0.3, release=0.05)
 
 def create_powerup_sound():
     """Create a powerup collection sound"""
     # Ascending arpeggio
     notes = [261.63, 329.63, 392.00, 523.25]  # C, E, G, C (C major)
-    wave = np.array([])
-    
-    for freq in notes:
-        tone = create_sine_wave(freq, 0.1) * 0.4
-        wave = np.concatenate([wave, tone])
+    # One voice per note, played back to back
+    wave = oscillator_bank(notes, int(44100 * 0.1), amplitudes=0.5 * 0.4).ravel()
     
     return apply_envelope(wave, attack=0.01, decay=0.05, sustain=0.6, release=0.1)
 
-def create_hit_sound():
+def create_hit_sound(rng=None):
     """Create a hit/damage sound"""
     # Short burst of noise with low frequency
-    noise = create_noise(0.1) * 0.5
+    noise = create_noise(0.1, rng=rng) * 0.5
     low_tone = create_square_wave(100, 0.1) * 0.5
     combined = noise + low_tone
     return apply_envelope(combined, attack=0.001, decay=0.02, sustain=0.3, release=0.05)
@@ -140,11 +128,11 @@ def create_menu_select_sound():
     click = create_sine_wave(600, 0.05) * 0.3
     return apply_envelope(click, attack=0.001, decay=0.01, sustain=0.5, release=0.02)
 
-def create_footstep_sound():
+def create_footstep_sound(rng=None):
     """Create a footstep sound"""
     # Short low frequency thud
     thud = create_sine_wave(80, 0.05) * 0.2
-    noise = create_noise(0.05) * 0.1
+    noise = create_noise(0.05, rng=rng) * 0.1
     combined = thud + noise
     return apply_envelope(combined, attack=0.001, decay=0.01, sustain=0.2, release=0.02)
 
@@ -153,24 +141,24 @@ def create_door_sound():
     # Creaking sound
     duration = 0.3
     sample_rate = 44100
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    t = time_base(int(sample_rate * duration), sample_rate)
     frequency = 150 + 50 * np.sin(20 * t)
-    wave = 0.3 * np.sin(2 * np.pi * frequency * t)
+    wave = oscillator_bank([frequency], sample_rate=sample_rate, amplitudes=0.3)[0]
     return apply_envelope(wave, attack=0.05, decay=0.1, sustain=0.5, release=0.1)
 
-def create_splash_sound():
+def create_splash_sound(rng=None):
     """Create a water splash sound"""
     # Filtered noise
-    noise = create_noise(0.3) * 0.4
-    # Simple low-pass filter effect (averaging)
-    filtered = np.convolve(noise, np.ones(5)/5, mode='same')
+    noise = create_noise(0.3, rng=rng) * 0.4
+    # Low-pass the noise so it sounds like water rather than hiss
+    filtered = lowpass(noise, 3000)
     return apply_envelope(filtered, attack=0.01, decay=0.05, sustain=0.3, release=0.2)
 
-def create_ambient_music(duration=30):
-    """Create simple ambient background music"""
-    sample_rate = 44100
+def ambient_music_block(duration, start, stop, sample_rate=44100):
+    """Render samples [start, stop) of the ambient music bed"""
     samples = int(sample_rate * duration)
-    music = np.zeros(samples)
+    stop = min(stop, samples)
+    music = np.zeros(max(stop - start, 0))
     
     # Create chord progression
     chords = [
@@ -184,110 +172,240 @@ def create_ambient_music(duration=30):
     chord_samples = int(sample_rate * chord_duration)
     
     for i, chord in enumerate(chords):
-        start = i * chord_samples
-        end = min(start + chord_samples, samples)
-        chord_wave = np.zeros(end - start)
-        
-        for freq in chord:
-            tone = create_sine_wave(freq, chord_duration)[:end-start] * 0.2
-            chord_wave += tone
+        chord_start = i * chord_samples
+        chord_end = min(chord_start + chord_samples, samples)
+        # Only the part of this chord that overlaps the requested block
+        lo = max(start, chord_start)
+        hi = min(stop, chord_end)
+        if hi <= lo:
+            continue
+        # All chord notes plus the LFO in one bank call
+        voices = oscillator_bank(chord + [0.5], hi - lo, sample_rate,
+                                 amplitudes=[0.5 * 0.2] * len(chord) + [0.1],
+                                 start=lo - chord_start)
+        chord_wave = voices[:-1].sum(axis=0)
         
         # Add some movement with LFO
-        lfo = 1 + 0.1 * np.sin(2 * np.pi * 0.5 * np.arange(end-start) / sample_rate)
-        music[start:end] = chord_wave * lfo
+        lfo = 1 + voices[-1]
+        music[lo - start:hi - start] = chord_wave * lfo
     
     return music * 0.3
 
-def generate_all_sounds():
-    """Generate all sound effects"""
-    print("Generating sound effects...")
-    os.makedirs('assets/sounds', exist_ok=True)
-    
-    sound_generators = {
-        'jump': create_jump_sound,
-        'coin': create_coin_sound,
-        'explosion': create_explosion_sound,
-        'laser': create_laser_sound,
-        'powerup': create_powerup_sound,
-        'hit': create_hit_sound,
-        'menu_select': create_menu_select_sound,
-        'footstep': create_footstep_sound,
-        'door': create_door_sound,
-        'splash': create_splash_sound,
-    }
-    
-    # Generate base sounds
-    for name, generator in sound_generators.items():
-        wave_data = generator()
-        save_wave(f'assets/sounds/{name}.wav', wave_data)
-        print(f"  Created {name}.wav")
+def create_ambient_music(duration=30):
+    """Create simple ambient background music"""
+    return ambient_music_block(duration, 0, int(44100 * duration))
+
+def music_layers(style):
+    """Return (duration, layers) for a music style.
+
+    Each layer renders samples [start, stop) of one part of the track, so
+    the same definition drives both the in-memory and the streamed render.
+    """
+    if style == 'ambient':
+        return 30, [lambda a, b: ambient_music_block(30, a, b)]
+    elif style == 'action':
+        # Fast-paced music with drums (simple beat)
+        return 20, [
+            lambda a, b: ambient_music_block(20, a, b),
+            lambda a, b: create_square_wave(2, 20, start=a, stop=b) * 0.1,
+        ]
+    elif style == 'peaceful':
+        # Slow, calm music
+        return 40, [lambda a, b: ambient_music_block(40, a, b) * 0.5]
+    elif style == 'mysterious':
+        # Minor key, slower, with some dissonance
+        return 35, [
+            lambda a, b: ambient_music_block(35, a, b),
+            lambda a, b: create_sine_wave(139, 35, start=a, stop=b) * 0.05,
+        ]
+    else:  # victory
+        # Major key, upbeat, with higher frequencies
+        return 15, [
+            lambda a, b: ambient_music_block(15, a, b),
+            lambda a, b: create_sine_wave(523.25, 15, start=a, stop=b) * 0.1,
+        ]
+
+def create_ui_sound(rng):
+    """Create a short UI blip with a random pitch and length"""
+    freq = 400 + rng.integers(0, 400)
+    duration = 0.05 + rng.random() * 0.05
+    wave = create_sine_wave(freq, duration) * 0.3
+    return apply_envelope(wave, attack=0.001, decay=0.01, sustain=0.3, release=0.02)
+
+SOUND_CACHE_MANIFEST = 'assets/.build-cache/sounds.json'
+
+MUSIC_STYLES = ['ambient', 'action', 'peaceful', 'mysterious', 'victory']
+
+def sound_effect_jobs():
+    """Return [(name, render)] for every sound effect, in output order.
+
+    render(rng) returns the wave data; rng is the sound's own Generator.
+    """
+    jobs = [
+        ('jump', lambda rng: create_jump_sound()),
+        ('coin', lambda rng: create_coin_sound()),
+        ('explosion', create_explosion_sound),
+        ('laser', lambda rng: create_laser_sound()),
+        ('powerup', lambda rng: create_powerup_sound()),
+        ('hit', create_hit_sound),
+        ('menu_select', lambda rng: create_menu_select_sound()),
+        ('footstep', create_footstep_sound),
+        ('door', lambda rng: create_door_sound()),
+        ('splash', create_splash_sound),
+    ]
     
-    # Generate variations of some sounds
+    # Variations of some sounds
     for i in range(3):
-        # Jump variations
-        jump_var = create_jump_sound()
-        jump_var = jump_var * (0.8 + 0.4 * np.random.random())  # Vary amplitude
-        save_wave(f'assets/sounds/jump_{i+1}.wav', jump_var)
-        print(f"  Created jump_{i+1}.wav")
-        
-        # Footstep variations
-        step_var = create_footstep_sound()
-        step_var = step_var * (0.7 + 0.6 * np.random.random())
-        save_wave(f'assets/sounds/footstep_{i+1}.wav', step_var)
-        print(f"  Created footstep_{i+1}.wav")
-        
-        # Hit variations
-        hit_var = create_hit_sound()
-        save_wave(f'assets/sounds/hit_{i+1}.wav', hit_var)
-        print(f"  Created hit_{i+1}.wav")
+        jobs += [
+            # Vary amplitude
+            (f'jump_{i+1}', lambda rng: create_jump_sound() * (0.8 + 0.4 * rng.random())),
+            (f'footstep_{i+1}', lambda rng: create_footstep_sound(rng) * (0.7 + 0.6 * rng.random())),
+            (f'hit_{i+1}', create_hit_sound),
+        ]
     
-    # Generate UI sounds
-    ui_sounds = ['click', 'hover', 'error', 'success', 'notification']
-    for sound in ui_sounds:
-        freq = 400 + np.random.randint(0, 400)
-        duration = 0.05 + np.random.random() * 0.05
-        wave = create_sine_wave(freq, duration) * 0.3
-        wave = apply_envelope(wave, attack=0.001, decay=0.01, sustain=0.3, release=0.02)
-        save_wave(f'assets/sounds/ui_{sound}.wav', wave)
-        print(f"  Created ui_{sound}.wav")
+    # UI sounds
+    for sound in ['click', 'hover', 'error', 'success', 'notification']:
+        jobs.append((f'ui_{sound}', create_ui_sound))
     
-    # Generate music tracks
-    print("\nGenerating music tracks...")
+    return jobs
+
+def write_music_track(style, filename, stream=False, block_size=DEFAULT_BLOCK_SIZE):
+    """Render one music style to filename, optionally streamed block by block"""
+    duration, layers = music_layers(style)
+    total_samples = int(44100 * duration)
+    if stream:
+        stream_wave(filename, lambda: render_blocks(layers, total_samples, block_size))
+    else:
+        save_wave(filename, render_full(layers, total_samples))
+
+def sound_path(name):
+    """Output path of a named sound or '<style>_theme' track"""
+    if name.endswith('_theme'):
+        return f'assets/music/{name}.wav'
+    return f'assets/sounds/{name}.wav'
+
+def sound_cache_keys(cache, loudness=None):
+    """Build-cache key for every sound, from its generator code, name and seed
+    (and the normalization code and target, if any)"""
+    # Normalizing rewrites the file, so its code and target are part of the key
+    normalize = [analyze_audio, loudness_gain, normalize_wave] if loudness is not None else []
+    extra = {'loudness': loudness, 'max_peak_db': MAX_PEAK_DB} if loudness is not None else {}
+    keys = {}
+    for name, render in sound_effect_jobs():
+        keys[name] = cache.key([render, save_wave] + normalize, dict(name=name, **extra), seed_for(name))
+    for style in MUSIC_STYLES:
+        # Streaming does not change the output, so it is not part of the key
+        keys[f'{style}_theme'] = cache.key([write_music_track] + normalize, dict(style=style, **extra))
+    return keys
+
+def render_sound_job(name, stream=False, block_size=DEFAULT_BLOCK_SIZE, loudness=None):
+    """Render and save one named sound or '<style>_theme' track; returns seconds taken.
+
+    With loudness (LUFS) the saved file is rescaled to that loudness, as
+    far as MAX_PEAK_DB allows.
+    """
+    start = time.perf_counter()
+    if name.endswith('_theme'):
+        write_music_track(name[:-len('_theme')], sound_path(name), stream, block_size)
+    else:
+        render = dict(sound_effect_jobs())[name]
+        save_wave(sound_path(name), render(rng_for(name)))
+    if loudness is not None:
+        normalize_wave(sound_path(name), loudness_gain(analyze_audio(sound_path(name)), loudness, MAX_PEAK_DB))
+    return time.perf_counter() - start
+
+def _run_jobs(pool, names, stream, block_size, loudness=None):
+    """Render names in order, on the pool if there is one"""
+    job = partial(render_sound_job, stream=stream, block_size=block_size, loudness=loudness)
+    if pool is None:
+        return zip(names, map(job, names))
+    return zip(names, pool.map(job, names))
+
+def generate_all_sounds(stream=False, block_size=DEFAULT_BLOCK_SIZE, jobs=1, force=False, clean=False,
+                        loudness=None):
+    """Generate all sound effects.
+
+    With stream=True the music tracks are rendered block by block and
+    written incrementally instead of being built as full arrays. With
+    jobs > 1 sounds are rendered on a process pool; every sound is seeded
+    from its name, so the files are identical either way.
+
+    Sounds whose build-cache key and file hash are unchanged are skipped
+    unless force=True; clean=True deletes outputs that are no longer
+    generated. loudness (LUFS) normalizes every output to a common level.
+
+    Finally every output is analyzed (duration, peak, RMS, loudness and
+    waveform peaks) into ANALYSIS_PATH; unchanged files reuse their entry.
+    """
+    os.makedirs('assets/sounds', exist_ok=True)
     os.makedirs('assets/music', exist_ok=True)
     
-    # Create simple background music loops
-    music_styles = ['ambient', 'action', 'peaceful', 'mysterious', 'victory']
+    cache = BuildCache(SOUND_CACHE_MANIFEST, force=force)
+    keys = sound_cache_keys(cache, loudness)
+    if clean:
+        for path in cache.prune([sound_path(name) for name in keys]):
+            print(f"  Removed stale {path}")
+    stale = {name for name, key in keys.items() if not cache.is_fresh(sound_path(name), key)}
+    
+    effect_names = [name for name, _ in sound_effect_jobs() if name in stale]
+    music_names = [f'{style}_theme' for style in MUSIC_STYLES if f'{style}_theme' in stale]
+    timings = []
     
-    for style in music_styles:
-        if style == 'ambient':
-            music = create_ambient_music(30)
-        elif style == 'action':
-            # Fast-paced music
-            music = create_ambient_music(20)
-            # Add drums (simple beat)
-            beat = create_square_wave(2, 20) * 0.1
-            music += beat
-        elif style == 'peaceful':
-            # Slow, calm music
-            music = create_ambient_music(40) * 0.5
-        elif style == 'mysterious':
-            # Minor key, slower
-            music = create_ambient_music(35)
-            # Add some dissonance
-            dissonance = create_sine_wave(139, 35) * 0.05
-            music += dissonance
-        else:  # victory
-            # Major key, upbeat
-            music = create_ambient_music(15)
-            # Add higher frequencies
-            high = create_sine_wave(523.25, 15) * 0.1
-            music += high
+    wall_start = time.perf_counter()
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        print("Generating sound effects...")
+        for name, elapsed in _run_jobs(pool, effect_names, stream, block_size, loudness):
+            cache.record(sound_path(name), keys[name])
+            timings.append((name, elapsed))
+            print(f"  Created {name}.wav")
         
-        save_wave(f'assets/music/{style}_theme.wav', music)
-        print(f"  Created {style}_theme.wav")
+        # Generate music tracks
+        print("\nGenerating music tracks...")
+        for name, elapsed in _run_jobs(pool, music_names, stream, block_size, loudness):
+            cache.record(sound_path(name), keys[name])
+            timings.append((name, elapsed))
+            print(f"  Created {name}.wav")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        cache.save()
+    wall_time = time.perf_counter() - wall_start
+    
+    if len(timings) < len(keys):
+        print(f"\nSkipped {len(keys) - len(timings)} up-to-date sounds")
+
+    print("\nAnalyzing sounds...")
+    analysis_start = time.perf_counter()
+    digests = {path: entry['sha256'] for path, entry in cache.entries.items()}
+    analyses, decoded = analyze_files([sound_path(name) for name in keys], ANALYSIS_PATH, digests)
+    print(f"  {decoded} analyzed, {len(analyses) - decoded} unchanged, written to {ANALYSIS_PATH} "
+          f"({(time.perf_counter() - analysis_start) * 1000:.1f} ms)")
+    print(f"\nTiming summary ({len(timings)} sounds, {jobs} job{'s' if jobs > 1 else ''}):")
+    for name, elapsed in sorted(timings, key=lambda item: item[1], reverse=True):
+        print(f"  {name:<20} {elapsed * 1000:8.1f} ms")
+    print(f"  {'render total':<20} {sum(t for _, t in timings) * 1000:8.1f} ms")
+    print(f"  {'wall time':<20} {wall_time * 1000:8.1f} ms")
 
 if __name__ == "__main__":
-    generate_all_sounds()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--stream', action='store_true',
+                        help='render music in fixed-size blocks and stream frames to disk')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE,
+                        help='samples per block in --stream mode')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='number of worker processes (output is identical for any value)')
+    parser.add_argument('--force', action='store_true',
+                        help='regenerate every sound even if the build cache says it is up to date')
+    parser.add_argument('--clean', action='store_true',
+                        help='delete outputs and cache entries that are no longer generated')
+    parser.add_argument('--normalize', type=float, metavar='LUFS',
+                        help=f'rescale every sound to this integrated loudness (e.g. {TARGET_LOUDNESS}), '
+                             f'keeping peaks under {MAX_PEAK_DB} dBFS')
+    args = parser.parse_args()
+
+    generate_all_sounds(stream=args.stream, block_size=args.block_size, jobs=args.jobs,
+                        force=args.force, clean=args.clean, loudness=args.normalize)
     print("\nSound generation complete!")
     print("Total sounds created: 24")
     print("Total music tracks created: 5")
\ No newline at end of file
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Compact image encoding for generated and copied PNGs
+Images with at most 256 distinct RGBA colors are written as palette (P-mode)
+PNGs with per-entry transparency, everything goes through the PNG optimizer,
+and a lossless WebP can be written alongside
+"""
+
+import argparse
+import io
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, features
+
+MAX_PALETTE_COLORS = 256
+
+def _packed_rgba(img):
+    """(H, W) little-endian uint32 RGBA words; fully transparent pixels become 0"""
+    pixels = np.ascontiguousarray(np.asarray(img.convert('RGBA'))).view('<u4')[..., 0]
+    # The color under alpha 0 is invisible, so every such pixel shares one palette entry
+    return np.where(pixels >> 24 == 0, np.uint32(0), pixels)
+
+def to_palette(img, max_colors=MAX_PALETTE_COLORS):
+    """Exact P-mode copy of img if it has at most max_colors colors, else None.
+
+    Translucent entries are sorted to the front of the palette so the PNG
+    tRNS chunk only lists the entries that need it.
+    """
+    packed = _packed_rgba(img)
+    colors, inverse = np.unique(packed, return_inverse=True)
+    if len(colors) > max_colors:
+        return None
+
+    rgba = colors.astype('<u4').view(np.uint8).reshape(-1, 4)
+    order = np.argsort(rgba[:, 3] == 255, kind='stable')
+    remap = np.empty(len(order), dtype=np.uint8)
+    remap[order] = np.arange(len(order))
+    rgba = rgba[order]
+
+    indices = remap[inverse.reshape(packed.shape)]
+    palette_img = Image.fromarray(indices, 'P')
+    palette_img.putpalette(rgba[:, :3].tobytes(), rawmode='RGB')
+    translucent = int(np.count_nonzero(rgba[:, 3] < 255))
+    if translucent:
+        palette_img.info['transparency'] = rgba[:translucent, 3].tobytes()
+    return palette_img
+
+def encode_png(img):
+    """Smallest lossless PNG bytes for img: palette when possible, always optimized"""
+    palette_img = to_palette(img)
+    buffer = io.BytesIO()
+    if palette_img is not None:
+        palette_img.save(buffer, 'PNG', optimize=True,
+                         transparency=palette_img.info.get('transparency'))
+    else:
+        img.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+def webp_available():
+    """True if this Pillow build can write WebP"""
+    return features.check('webp')
+
+def encode_webp(img):
+    """Lossless WebP bytes for img"""
+    buffer = io.BytesIO()
+    # In lossless mode quality is compression effort; 100 is ~15x slower for <1% smaller files
+    img.convert('RGBA').save(buffer, 'WEBP', lossless=True, quality=80, method=6)
+    return buffer.getvalue()
+
+def _write(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def save_compact(img, path, webp=False, baseline=True):
+    """Write img as a compact PNG (and path.webp when webp=True).
+
+    Returns {'png': bytes written, 'baseline': bytes of a default RGBA save
+    (None when baseline=False), 'webp': WebP bytes or None}.
+    """
+    data = encode_png(img)
+    _write(path, data)
+    sizes = {'png': len(data), 'baseline': None, 'webp': None}
+    if baseline:
+        buffer = io.BytesIO()
+        img.save(buffer, 'PNG')
+        sizes['baseline'] = len(buffer.getvalue())
+    if webp and webp_available():
+        webp_data = encode_webp(img)
+        _write(os.path.splitext(path)[0] + '.webp', webp_data)
+        sizes['webp'] = len(webp_data)
+    return sizes
+
+def optimize_png_file(source, dest, webp=False):
+    """Copy a PNG to dest re-encoded compactly, never larger than the source.
+
+    Returns {'png': bytes written, 'baseline': source bytes, 'webp': ...}.
+    """
+    source_size = os.path.getsize(source)
+    with Image.open(source) as img:
+        img.load()
+        data = encode_png(img)
+        webp_data = encode_webp(img) if webp and webp_available() else None
+    if len(data) < source_size:
+        _write(dest, data)
+    elif os.path.abspath(source) != os.path.abspath(dest):
+        shutil.copy2(source, dest)
+    if webp_data is not None:
+        _write(os.path.splitext(dest)[0] + '.webp', webp_data)
+    return {'png': min(len(data), source_size), 'baseline': source_size,
+            'webp': len(webp_data) if webp_data is not None else None}
+
+def format_savings(path, sizes):
+    """One report line: bytes before and after for a written image"""
+    line = f"  {path}: {sizes['png']:,} bytes"
+    if sizes['baseline']:
+        saved = sizes['baseline'] - sizes['png']
+        line += f" (was {sizes['baseline']:,}, saved {saved:,} / {saved / sizes['baseline']:.0%})"
+    if sizes['webp'] is not None:
+        line += f", webp {sizes['webp']:,}"
+    return line
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='PNG files or directories to recompress in place')
+    parser.add_argument('--webp', action='store_true', help='also write a lossless .webp next to each PNG')
+    args = parser.parse_args()
+
+    files = []
+    for path in map(Path, args.paths):
+        files += sorted(path.rglob('*.png')) if path.is_dir() else [path]
+
+    total_before = total_after = 0
+    for path in files:
+        sizes = optimize_png_file(str(path), str(path), webp=args.webp)
+        total_before += sizes['baseline']
+        total_after += sizes['png']
+        print(format_savings(path, sizes))
+    if files:
+        print(f"\n{len(files)} files: {total_before:,} -> {total_after:,} bytes "
+              f"(saved {total_before - total_after:,})")
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Oscillator bank for Pixel's PyGame Palace sound generation
+Renders many voices as one (voices x samples) array from a shared time base,
+with phase accumulated from per-sample frequency so sweeps stay continuous
+"""
+
+from functools import lru_cache
+import numpy as np
+
+# Time axes up to one streamed block (streaming.DEFAULT_BLOCK_SIZE) are cached so
+# the layers of a block share one; whole-track axes are freed with the track
+MAX_CACHED_SAMPLES = 65536
+
+def _time_axis(num_samples, sample_rate, start):
+    t = np.arange(start, start + num_samples) / sample_rate
+    t.flags.writeable = False
+    return t
+
+_cached_time_axis = lru_cache(maxsize=4)(_time_axis)
+
+def time_base(num_samples, sample_rate=44100, start=0):
+    """Read-only time axis in seconds for samples [start, start + num_samples)"""
+    if num_samples <= MAX_CACHED_SAMPLES:
+        return _cached_time_axis(num_samples, sample_rate, start)
+    return _time_axis(num_samples, sample_rate, start)
+
+def oscillator_phase(frequencies, num_samples=None, sample_rate=44100, start=0, phase0=0.0):
+    """Phase in radians for each voice.
+
+    frequencies is either a sequence of constant frequencies (one per voice)
+    or a 2-D (voices x samples) array of frequency curves in Hz. Constant
+    voices use the closed form 2*pi*f*t, which gives the same samples
+    however a track is split into blocks; curves integrate the frequency
+    with a cumulative sum so the phase never jumps.
+    """
+    frequencies = np.asarray(frequencies, dtype=float)
+    if frequencies.ndim <= 1:
+        t = time_base(num_samples, sample_rate, start)
+        return 2 * np.pi * frequencies.reshape(-1, 1) * t + np.reshape(phase0, (-1, 1))
+
+    increments = 2 * np.pi * frequencies / sample_rate
+    phase = np.empty_like(increments)
+    phase[:, 0] = 0.0
+    np.cumsum(increments[:, :-1], axis=1, out=phase[:, 1:])
+    return phase + np.reshape(phase0, (-1, 1))
+
+def _shape(waveform, phase):
+    """Turn a phase array into a waveform in [-1, 1]"""
+    if waveform == 'sine':
+        return np.sin(phase)
+    elif waveform == 'square':
+        return np.sign(np.sin(phase))
+    elif waveform == 'sawtooth':
+        cycles = phase / (2 * np.pi)
+        return 2 * (cycles - np.floor(cycles + 0.5))
+    raise ValueError(f"Unknown waveform: {waveform}")
+
+def oscillator_bank(frequencies, num_samples=None, sample_rate=44100, waveform='sine',
+                    amplitudes=1.0, start=0, phase0=0.0):
+    """Render N voices as one (voices x samples) array.
+
+    waveform may be one name for every voice or a list with one name per
+    voice ('sine', 'square' or 'sawtooth'); amplitudes may be a scalar or
+    one value per voice. start offsets constant-frequency voices so a long
+    track can be rendered block by block.
+    """
+    phase = oscillator_phase(frequencies, num_samples, sample_rate, start, phase0)
+    if isinstance(waveform, str):
+        voices = _shape(waveform, phase)
+    else:
+        voices = np.empty_like(phase)
+        for row, name in enumerate(waveform):
+            voices[row] = _shape(name, phase[row])
+    return np.reshape(amplitudes, (-1, 1)) * voices
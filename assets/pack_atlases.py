@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Pack sprites into texture atlases per game category
+Trims transparent borders, packs the images into power-of-two atlases with
+a MaxRects packer and writes a JSON frame index of
+{id: {atlas, x, y, w, h, offset_x, offset_y, source_w, source_h}} per
+category, so a game loads a handful of atlases instead of every PNG
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+from PIL import Image
+
+from build_cache import BuildCache, file_hash
+
+DEFAULT_MAX_SIZE = 2048
+DEFAULT_PADDING = 2
+ATLAS_DIR = 'assets/atlases'
+ATLAS_CACHE_MANIFEST = 'assets/.build-cache/atlases.json'
+
+def collect_generated_sprites(sprite_dir='assets/sprites'):
+    """Group the *_sprites.png sheets from generate_assets.py into one 'generated' category"""
+    sprites = [(path.stem, str(path)) for path in sorted(Path(sprite_dir).glob('*_sprites.png'))]
+    return {'generated': sprites} if sprites else {}
+
+def collect_catalog_sprites(catalog_path='assets/2d/catalog-2d.json'):
+    """Group catalog-2d.json entries by game category (platformer, rpg, space, ...)"""
+    with open(catalog_path) as f:
+        catalog = json.load(f)
+    base_dir = Path(catalog_path).parent
+    groups = {}
+    for category, info in catalog['categories'].items():
+        entries = [entry for entries in info['subcategories'].values() for entry in entries]
+        entries += info['assets']
+        for entry in sorted(entries, key=lambda e: e['path']):
+            if os.path.exists(entry['path']):
+                sprite_id = os.path.splitext(os.path.relpath(entry['path'], base_dir))[0]
+                groups.setdefault(category, []).append((sprite_id, entry['path']))
+    return groups
+
+def collect_ui_sprites(catalog_path='assets/ui/catalog-ui.json'):
+    """Group every file listed in catalog-ui.json into a 'ui' category"""
+    with open(catalog_path) as f:
+        catalog = json.load(f)
+    base_dir = Path(catalog_path).parent
+    sprites = []
+    for section in catalog['ui_assets'].values():
+        for group in section.get('categories', []):
+            for filename in group.get('files', []):
+                path = base_dir / filename
+                if path.suffix == '.png' and path.exists():
+                    sprites.append((os.path.splitext(filename)[0], str(path)))
+    return {'ui': sorted(set(sprites))} if sprites else {}
+
+def trim(img):
+    """Crop fully transparent borders; returns (cropped, offset_x, offset_y)"""
+    img = img.convert('RGBA')
+    bbox = img.getchannel('A').getbbox()
+    if bbox is None:
+        # Keep one transparent pixel so the frame still has a place in the atlas
+        return img.crop((0, 0, 1, 1)), 0, 0
+    return img.crop(bbox), bbox[0], bbox[1]
+
+class MaxRectsPacker:
+    """MaxRects bin packer (best short side fit) for one width x height page"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.free = [(0, 0, width, height)]
+
+    def insert(self, w, h):
+        """Place a w x h rectangle; returns (x, y) or None when it does not fit"""
+        best = None
+        for fx, fy, fw, fh in self.free:
+            if w <= fw and h <= fh:
+                score = (min(fw - w, fh - h), max(fw - w, fh - h))
+                if best is None or score < best[0]:
+                    best = (score, fx, fy)
+        if best is None:
+            return None
+        _, x, y = best
+        self._split(x, y, w, h)
+        return x, y
+
+    def _split(self, x, y, w, h):
+        """Replace every free rectangle the placement overlaps by its leftovers"""
+        free = []
+        for fx, fy, fw, fh in self.free:
+            if x >= fx + fw or x + w <= fx or y >= fy + fh or y + h <= fy:
+                free.append((fx, fy, fw, fh))
+                continue
+            if x > fx:
+                free.append((fx, fy, x - fx, fh))
+            if x + w < fx + fw:
+                free.append((x + w, fy, fx + fw - x - w, fh))
+            if y > fy:
+                free.append((fx, fy, fw, y - fy))
+            if y + h < fy + fh:
+                free.append((fx, y + h, fw, fy + fh - y - h))
+        # Drop free rectangles contained in another one
+        self.free = [a for i, a in enumerate(free)
+                     if not any(i != j and a[0] >= b[0] and a[1] >= b[1]
+                                and a[0] + a[2] <= b[0] + b[2] and a[1] + a[3] <= b[1] + b[3]
+                                and (a != b or j < i)
+                                for j, b in enumerate(free))]
+
+def _pack_page(sizes, width, height):
+    """Positions for every (w, h) in one width x height page, or None if they do not all fit"""
+    packer = MaxRectsPacker(width, height)
+    positions = []
+    for w, h in sizes:
+        position = packer.insert(w, h)
+        if position is None:
+            return None
+        positions.append(position)
+    return positions
+
+def pack_frames(sizes, max_size=DEFAULT_MAX_SIZE, padding=DEFAULT_PADDING):
+    """Assign (w, h) sizes to pages; returns ([(page, x, y)] in input order, [(page_w, page_h)]).
+
+    Frames are placed largest first and a new page opens when one is full.
+    Each page is then repacked into the smallest power-of-two size that
+    holds all of its frames.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (-max(sizes[i]), -min(sizes[i]), i))
+    padded = [(w + padding, h + padding) for w, h in sizes]
+    pages = []
+    for i in order:
+        for packer, members in pages:
+            if packer.insert(*padded[i]) is not None:
+                members.append(i)
+                break
+        else:
+            packer = MaxRectsPacker(max_size, max_size)
+            packer.insert(*padded[i])
+            pages.append((packer, [i]))
+
+    candidates = sorted(((w, h) for w in _powers_of_two(max_size) for h in _powers_of_two(max_size)
+                         if h <= w), key=lambda size: (size[0] * size[1], size[0]))
+    placements = [None] * len(sizes)
+    page_sizes = []
+    for page_index, (_, members) in enumerate(pages):
+        area = sum(padded[i][0] * padded[i][1] for i in members)
+        # The full max_size page is the last candidate and always fits
+        for width, height in candidates:
+            if width * height >= area:
+                positions = _pack_page([padded[i] for i in members], width, height)
+                if positions is not None:
+                    break
+        page_sizes.append((width, height))
+        for i, (x, y) in zip(members, positions):
+            placements[i] = (page_index, x, y)
+    return placements, page_sizes
+
+def _powers_of_two(limit):
+    """1, 2, 4, ... up to limit"""
+    return [1 << n for n in range(int(limit).bit_length()) if 1 << n <= limit]
+
+def build_atlases(category, sprites, out_dir=ATLAS_DIR, max_size=DEFAULT_MAX_SIZE, padding=DEFAULT_PADDING):
+    """Trim and pack (id, path) sprites into {category}-{n}.png pages; returns the frame index.
+
+    Images too large to share a page (more than half of max_size on a side)
+    are left where they are and indexed as their own atlas.
+    """
+    index = {}
+    frames = []
+    for sprite_id, path in sprites:
+        with Image.open(path) as img:
+            source_w, source_h = img.size
+            if max(source_w, source_h) > max_size // 2:
+                index[sprite_id] = {'atlas': path, 'x': 0, 'y': 0, 'w': source_w, 'h': source_h,
+                                    'offset_x': 0, 'offset_y': 0,
+                                    'source_w': source_w, 'source_h': source_h}
+                continue
+            cropped, offset_x, offset_y = trim(img)
+        frames.append((sprite_id, cropped, offset_x, offset_y, source_w, source_h))
+
+    placements, page_sizes = pack_frames([frame[1].size for frame in frames], max_size, padding)
+    pages = [Image.new('RGBA', size, (0, 0, 0, 0)) for size in page_sizes]
+    page_paths = [os.path.join(out_dir, f'{category}-{n}.png') for n in range(len(pages))]
+    for (sprite_id, cropped, offset_x, offset_y, source_w, source_h), (page, x, y) in zip(frames, placements):
+        pages[page].paste(cropped, (x, y))
+        index[sprite_id] = {'atlas': page_paths[page], 'x': x, 'y': y,
+                            'w': cropped.width, 'h': cropped.height,
+                            'offset_x': offset_x, 'offset_y': offset_y,
+                            'source_w': source_w, 'source_h': source_h}
+    for page, path in zip(pages, page_paths):
+        page.save(path)
+    return dict(sorted(index.items())), page_paths
+
+def pack_atlases(groups, out_dir=ATLAS_DIR, max_size=DEFAULT_MAX_SIZE, padding=DEFAULT_PADDING, force=False):
+    """Write atlases + a frame index per category, skipping categories whose images are unchanged"""
+    os.makedirs(out_dir, exist_ok=True)
+    cache = BuildCache(ATLAS_CACHE_MANIFEST, force=force)
+    written = 0
+    try:
+        for category, sprites in sorted(groups.items()):
+            index_path = os.path.join(out_dir, f'{category}.json')
+            members = [(sprite_id, file_hash(path)) for sprite_id, path in sprites]
+            key = cache.key([build_atlases, trim, pack_frames, _pack_page, MaxRectsPacker.insert, MaxRectsPacker._split],
+                            {'members': members, 'max_size': max_size, 'padding': padding})
+            if cache.is_fresh(index_path, key):
+                with open(index_path) as f:
+                    pages = sorted({frame['atlas'] for frame in json.load(f).values()
+                                    if frame['atlas'].startswith(out_dir)})
+                if all(cache.is_fresh(page, key) for page in pages):
+                    continue
+
+            index, pages = build_atlases(category, sprites, out_dir, max_size, padding)
+            with open(index_path, 'w') as f:
+                json.dump(index, f, indent=2)
+            for page in pages:
+                cache.record(page, key)
+            cache.record(index_path, key)
+            written += 1
+            print(f"  Packed {len(sprites)} images into {len(pages)} atlases for {category}")
+    finally:
+        cache.save()
+    print(f"  {written} categories written, {len(groups) - written} up to date")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--max-size', type=int, default=DEFAULT_MAX_SIZE,
+                        help='largest atlas side in pixels (a power of two)')
+    parser.add_argument('--padding', type=int, default=DEFAULT_PADDING,
+                        help='transparent pixels kept between frames')
+    parser.add_argument('--no-catalog', action='store_true',
+                        help='only pack the sheets from generate_assets.py')
+    parser.add_argument('--out', default=ATLAS_DIR, help='output directory')
+    parser.add_argument('--force', action='store_true', help='repack every category')
+    args = parser.parse_args()
+
+    print("Packing texture atlases...")
+    groups = collect_generated_sprites()
+    if not args.no_catalog:
+        groups.update(collect_catalog_sprites())
+        groups.update(collect_ui_sprites())
+    pack_atlases(groups, args.out, args.max_size, args.padding, args.force)
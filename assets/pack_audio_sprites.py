@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Pack sound effects into one audio sprite per category
+Concatenates each category's clips with silence padding and writes a JSON
+index of {id: [offset_ms, duration_ms]} next to the sprite, so a page loads
+one file per category instead of one per sound
+"""
+
+import argparse
+import json
+import os
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from build_cache import BuildCache, file_hash
+
+try:
+    import soundfile
+except ImportError:  # Only needed for the OGG catalog, not for generated WAVs
+    soundfile = None
+
+DEFAULT_PADDING_MS = 100
+SPRITE_DIR = 'assets/audio-sprites'
+SPRITE_CACHE_MANIFEST = 'assets/.build-cache/audio-sprites.json'
+
+def collect_generated_sounds(sound_dir='assets/sounds'):
+    """Group the WAVs from generate_sounds.py into 'ui' and 'sfx' categories"""
+    groups = {}
+    for path in sorted(Path(sound_dir).glob('*.wav')):
+        category = 'ui' if path.stem.startswith('ui_') else 'sfx'
+        groups.setdefault(category, []).append((path.stem, str(path)))
+    return groups
+
+def collect_catalog_sounds(catalog_path='assets/audio/catalog-audio.json', include_music=False):
+    """Group catalog-audio.json entries by category ('sfx/interface' -> 'sfx-interface')"""
+    with open(catalog_path) as f:
+        catalog = json.load(f)
+    base_dir = Path(catalog_path).parent
+    groups = {}
+    for entry in sorted(catalog['audio_files'], key=lambda e: e['file_path']):
+        if not include_music and not entry['category'].startswith('sfx/'):
+            continue
+        path = base_dir / entry['file_path']
+        if path.exists():
+            category = entry['category'].replace('/', '-')
+            groups.setdefault(category, []).append((path.stem, str(path)))
+    return groups
+
+def read_audio(path):
+    """Return (frames x channels float32 samples, sample_rate) for a WAV or any soundfile format"""
+    if path.endswith('.wav'):
+        with wave.open(path) as wav_file:
+            width = wav_file.getsampwidth()
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            raw = wav_file.readframes(wav_file.getnframes())
+        if width == 1:
+            data = (np.frombuffer(raw, np.uint8).astype(np.float32) - 128) / 128
+        elif width == 2:
+            data = np.frombuffer(raw, '<i2').astype(np.float32) / 32768
+        elif width == 4:
+            data = np.frombuffer(raw, '<i4').astype(np.float32) / 2147483648
+        else:
+            raise ValueError(f"Unsupported WAV sample width {width} in {path}")
+        return data.reshape(-1, channels), sample_rate
+
+    if soundfile is None:
+        raise RuntimeError(f"Reading {path} needs the optional 'soundfile' package")
+    data, sample_rate = soundfile.read(path, dtype='float32', always_2d=True)
+    return data, sample_rate
+
+def audio_info(path):
+    """Return (frames, channels, sample_rate) without decoding the samples"""
+    if path.endswith('.wav'):
+        with wave.open(path) as wav_file:
+            return wav_file.getnframes(), wav_file.getnchannels(), wav_file.getframerate()
+    if soundfile is None:
+        raise RuntimeError(f"Reading {path} needs the optional 'soundfile' package")
+    info = soundfile.info(path)
+    return info.frames, info.channels, info.samplerate
+
+def resample(data, source_rate, target_rate):
+    """Linear-interpolation resample of frames x channels data"""
+    if source_rate == target_rate or len(data) == 0:
+        return data
+    frames = int(round(len(data) * target_rate / source_rate))
+    positions = np.arange(frames) * (source_rate / target_rate)
+    source_positions = np.arange(len(data))
+    return np.stack([np.interp(positions, source_positions, data[:, c]) for c in range(data.shape[1])],
+                    axis=1).astype(np.float32)
+
+def _open_writer(path, sample_rate, channels):
+    """Return (write(frames), close()) for a WAV or OGG sprite file"""
+    if path.endswith('.wav'):
+        wav_file = wave.open(path, 'w')
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(2)  # 2 bytes = 16 bit
+        wav_file.setframerate(sample_rate)
+
+        def write(frames):
+            pcm = np.clip(np.round(frames * 32767), -32768, 32767).astype('<i2')
+            wav_file.writeframes(pcm.tobytes())
+        return write, wav_file.close
+
+    if soundfile is None:
+        raise RuntimeError(f"Writing {path} needs the optional 'soundfile' package")
+    sound_file = soundfile.SoundFile(path, 'w', sample_rate, channels, format='OGG', subtype='VORBIS')
+    return sound_file.write, sound_file.close
+
+def write_sprite(path, clips, padding_ms=DEFAULT_PADDING_MS):
+    """Concatenate (id, source_path) clips into one sprite file; returns the index.
+
+    Clips are decoded and written one at a time, so only one clip is held
+    in memory. Mono clips are duplicated when other clips are stereo, and
+    clips are resampled to the most common sample rate in the group.
+    """
+    infos = [(clip_id, source) + audio_info(source) for clip_id, source in clips]
+    rates = [info[4] for info in infos]
+    sample_rate = max(set(rates), key=lambda rate: (rates.count(rate), rate))
+    channels = max(info[3] for info in infos)
+    padding = np.zeros((int(sample_rate * padding_ms / 1000), channels), dtype=np.float32)
+
+    index = {}
+    offset = 0
+    write, close = _open_writer(path, sample_rate, channels)
+    try:
+        for clip_id, source, _, clip_channels, _ in infos:
+            data, clip_rate = read_audio(source)
+            data = resample(data, clip_rate, sample_rate)
+            frames = len(data)
+            if clip_channels < channels:
+                data = np.repeat(data, channels // clip_channels, axis=1)
+            write(data)
+            write(padding)
+            index[clip_id] = [round(offset * 1000 / sample_rate, 3), round(frames * 1000 / sample_rate, 3)]
+            offset += frames + len(padding)
+    finally:
+        close()
+    return index
+
+def pack_sprites(groups, out_dir=SPRITE_DIR, padding_ms=DEFAULT_PADDING_MS, force=False):
+    """Write one sprite + index per category, skipping categories whose clips are unchanged"""
+    os.makedirs(out_dir, exist_ok=True)
+    cache = BuildCache(SPRITE_CACHE_MANIFEST, force=force)
+    written = 0
+    try:
+        for category, clips in sorted(groups.items()):
+            extension = os.path.splitext(clips[0][1])[1]
+            sprite_path = os.path.join(out_dir, f'{category}{extension}')
+            index_path = os.path.join(out_dir, f'{category}.json')
+            members = [(clip_id, file_hash(source)) for clip_id, source in clips]
+            key = cache.key([write_sprite, read_audio, audio_info, resample],
+                            {'members': members, 'padding_ms': padding_ms})
+            if cache.is_fresh(sprite_path, key) and cache.is_fresh(index_path, key):
+                continue
+
+            index = write_sprite(sprite_path, clips, padding_ms)
+            with open(index_path, 'w') as f:
+                json.dump(index, f, indent=2)
+            cache.record(sprite_path, key)
+            cache.record(index_path, key)
+            written += 1
+            size_kb = os.path.getsize(sprite_path) / 1024
+            print(f"  Packed {len(clips)} sounds into {sprite_path} ({size_kb:.0f} KB)")
+    finally:
+        cache.save()
+    print(f"  {written} sprites written, {len(groups) - written} up to date")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--padding-ms', type=float, default=DEFAULT_PADDING_MS,
+                        help='silence inserted after each clip')
+    parser.add_argument('--catalog', action='store_true',
+                        help='also pack the Kenney OGGs listed in assets/audio/catalog-audio.json '
+                             '(requires soundfile)')
+    parser.add_argument('--out', default=SPRITE_DIR, help='output directory')
+    parser.add_argument('--force', action='store_true', help='repack every category')
+    args = parser.parse_args()
+
+    print("Packing audio sprites...")
+    groups = collect_generated_sounds()
+    if args.catalog:
+        groups.update(collect_catalog_sounds())
+    pack_sprites(groups, args.out, args.padding_ms, args.force)
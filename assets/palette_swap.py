@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Palette-swap variants for sprite sheets
+An image is split once into a palette of its distinct RGBA colors and a
+per-pixel index array; every recolored variant is then a lookup of a new
+palette through those indices, so dozens of variants share one source
+render and cost one gather each
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+from PIL import Image
+
+from image_encoding import save_compact
+
+def index_image(img):
+    """Split an image into (palette, indices): (n, 4) uint8 RGBA colors and (H, W) palette indices"""
+    rgba = np.ascontiguousarray(np.asarray(img.convert('RGBA')))
+    packed = rgba.view('<u4')[..., 0]
+    colors, inverse = np.unique(packed, return_inverse=True)
+    palette = colors.astype('<u4').view(np.uint8).reshape(-1, 4)
+    return palette, inverse.reshape(packed.shape)
+
+def apply_palette(palette, indices):
+    """Rebuild an RGBA image from a palette and the indices of index_image"""
+    return Image.fromarray(np.asarray(palette, dtype=np.uint8)[indices], 'RGBA')
+
+def remap_colors(palette, mapping):
+    """Copy of palette with exact RGB matches replaced: mapping is {(r, g, b): (r, g, b)}.
+
+    Alpha is kept, so anti-aliased edges of a replaced color keep their coverage.
+    """
+    palette = palette.copy()
+    for source, target in mapping.items():
+        palette[np.all(palette[:, :3] == source, axis=1), :3] = target
+    return palette
+
+def _rgb_to_hsv(rgb):
+    """Vectorized colorsys.rgb_to_hsv for (n, 3) floats in [0, 1]"""
+    r, g, b = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+    value = rgb.max(axis=1)
+    chroma = value - rgb.min(axis=1)
+    saturation = np.divide(chroma, value, out=np.zeros_like(value), where=value > 0)
+    safe = np.where(chroma > 0, chroma, 1)
+    hue = np.where(value == r, (g - b) / safe,
+                   np.where(value == g, 2 + (b - r) / safe, 4 + (r - g) / safe))
+    hue = np.where(chroma > 0, (hue / 6) % 1.0, 0.0)
+    return hue, saturation, value
+
+def _hsv_to_rgb(hue, saturation, value):
+    """Vectorized colorsys.hsv_to_rgb returning (n, 3) floats"""
+    sector = np.floor(hue * 6).astype(int) % 6
+    f = hue * 6 - np.floor(hue * 6)
+    p = value * (1 - saturation)
+    q = value * (1 - saturation * f)
+    t = value * (1 - saturation * (1 - f))
+    choices = np.stack([
+        np.stack([value, t, p], axis=1), np.stack([q, value, p], axis=1),
+        np.stack([p, value, t], axis=1), np.stack([p, q, value], axis=1),
+        np.stack([t, p, value], axis=1), np.stack([value, p, q], axis=1),
+    ])
+    return choices[sector, np.arange(len(hue))]
+
+def hue_shift(palette, degrees, saturation=1.0, value=1.0):
+    """Copy of palette rotated by `degrees` of hue and scaled in saturation/value"""
+    hue, sat, val = _rgb_to_hsv(palette[:, :3] / 255.0)
+    rgb = _hsv_to_rgb((hue + degrees / 360.0) % 1.0, np.clip(sat * saturation, 0, 1),
+                      np.clip(val * value, 0, 1))
+    shifted = palette.copy()
+    shifted[:, :3] = np.round(rgb * 255)
+    return shifted
+
+def hue_variants(palette, indices, count, saturation=1.0, value=1.0):
+    """`count` images with hues spread evenly around the color wheel (the first is the original hue)"""
+    return [apply_palette(hue_shift(palette, i * 360.0 / count, saturation, value), indices)
+            for i in range(count)]
+
+def recolor_file(source, dest_dir, count, saturation=1.0, value=1.0):
+    """Write `count` hue variants of a PNG (generated or Kenney) as {stem}_v{i}.png; returns the paths"""
+    with Image.open(source) as img:
+        palette, indices = index_image(img)
+    os.makedirs(dest_dir, exist_ok=True)
+    stem = os.path.splitext(os.path.basename(source))[0]
+    paths = []
+    for i, variant in enumerate(hue_variants(palette, indices, count, saturation, value)):
+        path = os.path.join(dest_dir, f'{stem}_v{i}.png')
+        save_compact(variant, path, baseline=False)
+        paths.append(path)
+    return paths
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('sources', nargs='+', help='PNG sheets to recolor')
+    parser.add_argument('--count', type=int, default=12, help='variants per sheet')
+    parser.add_argument('--saturation', type=float, default=1.0, help='saturation scale')
+    parser.add_argument('--value', type=float, default=1.0, help='brightness scale')
+    parser.add_argument('--out', default='assets/sprites/variants', help='output directory')
+    args = parser.parse_args()
+
+    for source in args.sources:
+        start = time.perf_counter()
+        paths = recolor_file(source, args.out, args.count, args.saturation, args.value)
+        print(f"  {source}: {len(paths)} variants in {(time.perf_counter() - start) * 1000:.1f} ms")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Publish source files into the served asset tree without duplicating them
+A published file can be a hard link, a reflink (copy-on-write clone), a
+symlink or a copy; copies are skipped when the destination already holds
+the same bytes. Links fall back to copying when the filesystem refuses them
+(e.g. across devices), and every call reports the bytes it actually wrote
+"""
+
+import errno
+import os
+import shutil
+
+from build_cache import file_hash
+
+try:
+    import fcntl
+except ImportError:  # not on Windows
+    fcntl = None
+
+PUBLISH_MODES = ('copy', 'copy-if-changed', 'hardlink', 'reflink', 'symlink')
+
+# ioctl(dest_fd, FICLONE, source_fd) from linux/fs.h; btrfs, XFS and others share the extents
+FICLONE = 0x40049409
+
+# Errors that mean "this filesystem cannot link/clone here", not a real failure
+_UNSUPPORTED = {errno.EXDEV, errno.EPERM, errno.EACCES, errno.EMLINK, errno.EINVAL,
+                errno.ENOTTY, errno.EOPNOTSUPP, errno.ENOSYS}
+
+def _temp_path(dest):
+    return f'{dest}.publish-tmp'
+
+def _replace(dest, make):
+    """Build dest under a temporary name with make(tmp), then move it into place.
+
+    Going through a new file means an existing link at dest is replaced,
+    never written through to the source it points at.
+    """
+    tmp = _temp_path(dest)
+    if os.path.lexists(tmp):
+        os.remove(tmp)
+    try:
+        make(tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        if os.path.lexists(tmp):
+            os.remove(tmp)
+        raise
+
+def _copy(source, dest):
+    _replace(dest, lambda tmp: shutil.copy2(source, tmp))
+    return os.path.getsize(dest)
+
+def _reflink(source, dest):
+    def clone(tmp):
+        with open(source, 'rb') as src, open(tmp, 'wb') as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        shutil.copystat(source, tmp)
+    _replace(dest, clone)
+
+def _same_file(source, dest):
+    try:
+        return os.path.samefile(source, dest)
+    except OSError:
+        return False
+
+def _same_content(source, dest):
+    """True if dest is an independent file (not a link to source) with the same bytes"""
+    try:
+        if os.path.islink(dest) or _same_file(source, dest) or os.path.getsize(source) != os.path.getsize(dest):
+            return False
+    except OSError:
+        return False
+    return file_hash(source) == file_hash(dest)
+
+def publish_file(source, dest, mode='copy-if-changed'):
+    """Make dest serve the contents of source; returns (bytes_written, method).
+
+    method is what actually happened: 'hardlink', 'reflink', 'symlink',
+    'copy' or 'unchanged'. hardlink, reflink and symlink fall back to a copy
+    when the filesystem does not support them.
+    """
+    if mode not in PUBLISH_MODES:
+        raise ValueError(f"unknown publish mode {mode!r} (expected one of {', '.join(PUBLISH_MODES)})")
+    source, dest = str(source), str(dest)
+
+    if mode == 'symlink':
+        target = os.path.relpath(source, os.path.dirname(dest) or '.')
+        if os.path.islink(dest) and os.readlink(dest) == target:
+            return 0, 'unchanged'
+        try:
+            _replace(dest, lambda tmp: os.symlink(target, tmp))
+            return 0, 'symlink'
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+    elif mode == 'hardlink':
+        if _same_file(source, dest) and not os.path.islink(dest):
+            return 0, 'unchanged'
+        try:
+            _replace(dest, lambda tmp: os.link(source, tmp))
+            return 0, 'hardlink'
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+    elif mode == 'reflink' and fcntl is not None:
+        if _same_content(source, dest):
+            return 0, 'unchanged'
+        try:
+            _reflink(source, dest)
+            return 0, 'reflink'
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+
+    # Plain copies, and links the filesystem refused
+    if mode != 'copy' and _same_content(source, dest):
+        return 0, 'unchanged'
+    return _copy(source, dest), 'copy'
+
+def format_publish_report(results):
+    """One summary line for a list of publish_file() results"""
+    methods = {}
+    for _, method in results:
+        methods[method] = methods.get(method, 0) + 1
+    breakdown = ', '.join(f'{count} {method}' for method, count in sorted(methods.items()))
+    written = sum(size for size, _ in results)
+    return f"{len(results)} files published, {written:,} bytes written" + (f" ({breakdown})" if breakdown else '')
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Precomputed search index for the 2D and audio catalogs
+Every catalog entry gets an integer id; words from its name and description
+map to delta-encoded postings lists of ids, tags and categories get postings
+of their own, and a trigram index over the word list answers prefix and
+fuzzy queries without loading or scanning the catalogs themselves.
+catalog-kenney-assets.py builds the same index over the published Kenney
+assets for the client's asset browser (search-index.ts).
+"""
+
+import argparse
+import bisect
+import json
+import os
+import re
+import time
+
+CATALOG_2D = 'assets/2d/catalog-2d.json'
+CATALOG_AUDIO = 'assets/audio/catalog-audio.json'
+INDEX_PATH = 'assets/search-index.json'
+INDEX_VERSION = 1
+
+# Words sharing at least this fraction of trigrams count as a fuzzy match
+FUZZY_THRESHOLD = 0.4
+
+# Scores per query word; summed over words to rank results
+SCORE_EXACT, SCORE_PREFIX, SCORE_FUZZY = 3, 2, 1
+
+_WORD = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+def tokenize(text):
+    """Lowercase words of text, splitting camelCase, snake_case, kebab-case and digits"""
+    return [word.lower() for word in _WORD.findall(text)]
+
+def trigrams(word):
+    """Trigrams of a word padded with one leading and trailing space ('cat' -> ' ca', 'cat', 'at ').
+
+    A word of n letters has n of them.
+    """
+    padded = f' {word} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _tag(name):
+    return name.lower().replace(' ', '_')
+
+def catalog_documents(catalog_2d=CATALOG_2D, catalog_audio=CATALOG_AUDIO):
+    """[(path, name, kind, text, tags)] for every catalog entry, sorted by path"""
+    docs = []
+    if os.path.exists(catalog_2d):
+        with open(catalog_2d) as f:
+            catalog = json.load(f)
+        for category, info in catalog['categories'].items():
+            entries = [entry for entries in info['subcategories'].values() for entry in entries]
+            for entry in entries + info['assets']:
+                name = os.path.splitext(entry['filename'])[0]
+                tags = {_tag(category), _tag(entry.get('subcategory') or 'misc'),
+                        _tag(entry.get('suggested_usage') or 'sprite')}
+                if entry.get('original_pack'):
+                    tags.add(_tag(entry['original_pack']))
+                text = ' '.join([name, entry.get('suggested_usage') or '', entry.get('original_pack') or ''])
+                docs.append((entry['path'], name, 'sprite', text, sorted(tags)))
+    if os.path.exists(catalog_audio):
+        with open(catalog_audio) as f:
+            catalog = json.load(f)
+        base_dir = os.path.dirname(catalog_audio)
+        for entry in catalog['audio_files']:
+            name = os.path.splitext(entry['filename'])[0]
+            tags = {_tag(part) for part in entry['category'].split('/')}
+            tags.add(entry['category'].replace('/', '-'))
+            text = ' '.join([name, entry.get('suggested_usage') or '', entry['category']])
+            docs.append((os.path.join(base_dir, entry['file_path']), name, 'audio', text, sorted(tags)))
+    return sorted(docs)
+
+def manifest_documents(assets):
+    """[(id, name, kind, text, tags)] for asset entries of the client manifests, sorted by id"""
+    docs = []
+    for asset in assets:
+        text = ' '.join([asset['name'], asset.get('description', ''), asset.get('category', '')])
+        tags = set(asset.get('tags', []))
+        if asset.get('category'):
+            tags.add(asset['category'])
+        docs.append((asset['id'], asset['name'], asset['type'], text, sorted(tags)))
+    return sorted(docs)
+
+def _delta(ids):
+    """Sorted ids as the first id followed by gaps"""
+    return [ids[0]] + [b - a for a, b in zip(ids, ids[1:])] if ids else []
+
+def _undelta(gaps):
+    ids, total = [], 0
+    for gap in gaps:
+        total += gap
+        ids.append(total)
+    return ids
+
+def build_index(docs):
+    """Compact index dict for catalog_documents() or manifest_documents() output.
+
+    Each doc is kept as [key, name, kind], key being the catalog path or asset id.
+    """
+    word_docs = {}
+    tag_docs = {}
+    for doc_id, (path, name, kind, text, tags) in enumerate(docs):
+        for word in set(tokenize(text)):
+            word_docs.setdefault(word, []).append(doc_id)
+        for tag in tags + [kind]:
+            tag_docs.setdefault(tag, []).append(doc_id)
+
+    words = sorted(word_docs)
+    grams = {}
+    for word_id, word in enumerate(words):
+        for gram in trigrams(word):
+            grams.setdefault(gram, []).append(word_id)
+
+    return {
+        'version': INDEX_VERSION,
+        'docs': [[path, name, kind] for path, name, kind, _, _ in docs],
+        'words': words,
+        'postings': [_delta(word_docs[word]) for word in words],
+        'tags': {tag: _delta(ids) for tag, ids in sorted(tag_docs.items())},
+        'trigrams': {gram: _delta(ids) for gram, ids in sorted(grams.items())},
+    }
+
+def write_index(index, path=INDEX_PATH):
+    """Write the index as compact JSON; returns the bytes written"""
+    with open(path, 'w', buffering=1 << 16) as f:
+        json.dump(index, f, separators=(',', ':'))
+    return os.path.getsize(path)
+
+class SearchIndex:
+    """Query side of a built index: prefix and fuzzy word matches, tag filters"""
+
+    def __init__(self, index):
+        self.docs = index['docs']
+        self.words = index['words']
+        self.postings = index['postings']
+        self.tags = index['tags']
+        self.trigrams = index['trigrams']
+        self._decoded = {}
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        with open(path) as f:
+            return cls(json.load(f))
+
+    def _docs_for_word(self, word_id):
+        if word_id not in self._decoded:
+            self._decoded[word_id] = _undelta(self.postings[word_id])
+        return self._decoded[word_id]
+
+    def prefix_words(self, prefix):
+        """Ids of the words starting with prefix (a contiguous range of the sorted word list)"""
+        start = bisect.bisect_left(self.words, prefix)
+        end = bisect.bisect_left(self.words, prefix + '\uffff', start)
+        return range(start, end)
+
+    def fuzzy_words(self, word, threshold=FUZZY_THRESHOLD):
+        """Ids of words whose trigram overlap (Dice coefficient) with word is at least threshold"""
+        grams = trigrams(word)
+        shared = {}
+        for gram in grams:
+            for word_id in _undelta(self.trigrams.get(gram, [])):
+                shared[word_id] = shared.get(word_id, 0) + 1
+        return [word_id for word_id, count in shared.items()
+                if 2 * count / (len(grams) + len(self.words[word_id])) >= threshold]
+
+    def _word_scores(self, word, fuzzy):
+        """{doc id: best score} for one query word"""
+        scores = {}
+        matches = [(word_id, SCORE_EXACT if self.words[word_id] == word else SCORE_PREFIX)
+                   for word_id in self.prefix_words(word)]
+        if not matches and fuzzy:
+            matches = [(word_id, SCORE_FUZZY) for word_id in self.fuzzy_words(word)]
+        for word_id, score in matches:
+            for doc_id in self._docs_for_word(word_id):
+                if scores.get(doc_id, 0) < score:
+                    scores[doc_id] = score
+        return scores
+
+    def search(self, query, tags=(), fuzzy=True, limit=50):
+        """[(score, doc)] for docs matching every word of query and every tag, best first.
+
+        Each query word matches exactly, as a prefix, or (when nothing starts
+        with it and fuzzy=True) by trigram similarity.
+        """
+        scores = None
+        for word in tokenize(query):
+            word_scores = self._word_scores(word, fuzzy)
+            if scores is None:
+                scores = word_scores
+            else:
+                scores = {doc_id: score + word_scores[doc_id]
+                          for doc_id, score in scores.items() if doc_id in word_scores}
+        for tag in tags:
+            tagged = set(_undelta(self.tags.get(tag, [])))
+            if scores is None:
+                scores = dict.fromkeys(tagged, 0)
+            else:
+                scores = {doc_id: score for doc_id, score in scores.items() if doc_id in tagged}
+        ranked = sorted((scores or {}).items(), key=lambda item: (-item[1], item[0]))
+        return [(score, self.docs[doc_id]) for doc_id, score in ranked[:limit]]
+
+def linear_haystacks(docs):
+    """Lowercased searchable text per document for linear_search()"""
+    return [' '.join([text.lower(), ' '.join(tags)] + tokenize(text)) for _, _, _, text, tags in docs]
+
+def linear_search(docs, haystacks, query, limit=50):
+    """Substring scan over every document, as the asset picker filtered before the index"""
+    words = tokenize(query)
+    results = []
+    for (path, name, kind, _, _), haystack in zip(docs, haystacks):
+        if all(word in haystack for word in words):
+            results.append([path, name, kind])
+            if len(results) == limit:
+                break
+    return results
+
+BENCHMARK_QUERIES = ['bunny', 'jump', 'enemy walk', 'laser', 'click', 'coin', 'tile grass',
+                     'explosion', 'jingle', 'bnny', 'explsion', 'ui button', 'car', 'ship']
+
+def benchmark(index_path=INDEX_PATH, rounds=200):
+    """Compare load time and per-query time of the index against a linear catalog scan"""
+    start = time.perf_counter()
+    docs = catalog_documents()
+    haystacks = linear_haystacks(docs)
+    catalog_load = time.perf_counter() - start
+    start = time.perf_counter()
+    index = SearchIndex.load(index_path)
+    index_load = time.perf_counter() - start
+
+    def per_query(search):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for query in BENCHMARK_QUERIES:
+                search(query)
+        return (time.perf_counter() - start) / (rounds * len(BENCHMARK_QUERIES))
+
+    linear = per_query(lambda query: linear_search(docs, haystacks, query))
+    indexed = per_query(lambda query: index.search(query))
+    catalog_bytes = sum(os.path.getsize(path) for path in (CATALOG_2D, CATALOG_AUDIO) if os.path.exists(path))
+    print(f"  {len(docs)} documents, {len(index.words)} words, {len(index.trigrams)} trigrams")
+    print(f"  load:  catalogs {catalog_bytes:,} bytes in {catalog_load * 1000:.1f} ms, "
+          f"index {os.path.getsize(index_path):,} bytes in {index_load * 1000:.1f} ms")
+    print(f"  query: linear scan {linear * 1e6:.1f} us, index {indexed * 1e6:.1f} us "
+          f"(x{linear / indexed:.1f}, averaged over {len(BENCHMARK_QUERIES)} queries)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--out', default=INDEX_PATH, help='index file to write')
+    parser.add_argument('--query', help='search the index and print the matches instead of building it')
+    parser.add_argument('--tag', action='append', default=[], help='only match entries with this tag')
+    parser.add_argument('--benchmark', action='store_true', help='time queries against a linear scan')
+    args = parser.parse_args()
+
+    if args.query is not None or args.tag:
+        for score, (path, name, kind) in SearchIndex.load(args.out).search(args.query or '', args.tag):
+            print(f"  {score:2d}  {kind:6s}  {path}")
+    else:
+        print("Building search index...")
+        docs = catalog_documents()
+        size = write_index(build_index(docs), args.out)
+        print(f"  {len(docs)} documents indexed into {args.out} ({size:,} bytes)")
+        if args.benchmark:
+            benchmark(args.out)
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Deterministic per-asset random seeds
+Every generated asset draws from its own generator seeded by its name, so
+output does not depend on render order or on how work is split across
+processes
+"""
+
+import hashlib
+import numpy as np
+
+def seed_for(name):
+    """Stable 64-bit seed derived from an asset name"""
+    return int.from_bytes(hashlib.sha256(name.encode('utf-8')).digest()[:8], 'little')
+
+def rng_for(name):
+    """NumPy Generator seeded from an asset name"""
+    return np.random.default_rng(seed_for(name))
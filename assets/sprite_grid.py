@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Detect animation-frame grids in sprite sheets
+The alpha channel is projected onto rows and columns; a frame pitch is a
+divisor of the sheet size at which the projection's autocorrelation is high
+and every frame boundary falls in a transparent gutter. Images of the same
+size are analyzed together as one NumPy batch. Results are written into
+assets/2d/catalog-2d.json as frame_width, frame_height, frames and rows,
+plus spacing_x/spacing_y for sheets with gaps between frames.
+"""
+
+import argparse
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+CATALOG_2D = 'assets/2d/catalog-2d.json'
+
+# Keys detect_grids() may set on a catalog entry
+GRID_KEYS = ('frame_width', 'frame_height', 'frames', 'rows', 'spacing', 'spacing_x', 'spacing_y')
+
+# Frames smaller than this are not considered (tiles of a tileset, dither patterns)
+MIN_FRAME_SIZE = 8
+# Sheets with transparent spacing between frames usually omit it after the
+# last frame, so a pitch may overshoot the sheet size by up to this much
+MAX_SPACING = 2
+# Normalized autocorrelation a projection needs at the frame pitch
+MIN_PERIODICITY = 0.6
+# A gutter is a row/column whose alpha sum is at most this share of the busiest one
+GUTTER_FRACTION = 0.02
+# Frames whose alpha sum is at most this share of the busiest frame count as empty cells
+EMPTY_FRAME_FRACTION = 0.01
+
+def _next_pow2(n):
+    return 1 << max(0, int(n - 1).bit_length())
+
+def autocorrelation(profiles):
+    """Unbiased, normalized autocorrelation of each row of an (N, L) array, lags 0..L-1.
+
+    Computed with one batched FFT; a flat profile gets zeros.
+    """
+    profiles = np.asarray(profiles, dtype=np.float64)
+    length = profiles.shape[1]
+    centered = profiles - profiles.mean(axis=1, keepdims=True)
+    spectrum = np.fft.rfft(centered, _next_pow2(2 * length), axis=1)
+    raw = np.fft.irfft(spectrum * spectrum.conj(), axis=1)[:, :length]
+    energy = raw[:, :1]
+    unbiased = raw * length / (length - np.arange(length))
+    return np.divide(unbiased, energy, out=np.zeros_like(unbiased), where=energy > 1e-9)
+
+def _has_gutters(profiles, pitch):
+    """(N,) True where every internal multiple of pitch has a transparent row/column within pitch/8"""
+    length = profiles.shape[1]
+    reach = max(1, pitch // 8)
+    quiet = profiles <= GUTTER_FRACTION * profiles.max(axis=1, keepdims=True)
+    ok = np.ones(len(profiles), dtype=bool)
+    for boundary in range(pitch, length, pitch):
+        ok &= quiet[:, max(0, boundary - reach):boundary + reach].any(axis=1)
+    return ok
+
+def detect_pitch(profiles):
+    """(pitches, spacings) along one axis for each row of an (N, L) projection array.
+
+    The smallest pitch of at least MIN_FRAME_SIZE that fits L at least
+    twice, with MIN_PERIODICITY and gutters, wins. Its spacing is how far
+    the last frame falls short of a whole pitch (at most MAX_SPACING).
+    Rows without one get (L, 0).
+    """
+    profiles = np.asarray(profiles, dtype=np.float64)
+    count, length = profiles.shape
+    pitches = np.full(count, length)
+    spacings = np.zeros(count, dtype=int)
+    correlation = autocorrelation(profiles)
+    for pitch in range(MIN_FRAME_SIZE, (length + MAX_SPACING) // 2 + 1):
+        spacing = -length % pitch
+        if spacing > MAX_SPACING or pitch >= length:
+            continue
+        found = (pitches == length) & (correlation[:, pitch] >= MIN_PERIODICITY)
+        if found.any():
+            found[found] &= _has_gutters(profiles[found], pitch)
+            pitches[found] = pitch
+            spacings[found] = spacing
+    return pitches, spacings
+
+def _trailing_gutter(profile, pitch, spacing):
+    """True if every pitch-long cell of a projection ends in a gap exactly `spacing` wide.
+
+    The last `spacing` positions must be transparent in every cell while
+    some cell is filled right before them and some cell right at its
+    start; frames that merely have transparent margins do not count.
+    """
+    quiet = profile <= GUTTER_FRACTION * profile.max()
+    cells = -(-len(profile) // pitch)
+    padded = np.ones(cells * pitch, dtype=bool)
+    padded[:len(profile)] = quiet
+    padded = padded.reshape(cells, pitch)
+    wider = padded[:, pitch - spacing - 1].all() or padded[:, 0].all()
+    return bool(padded[:, pitch - spacing:].all() and not wider)
+
+def _extent(profile):
+    """Length from the start of a projection to its last non-transparent position"""
+    filled = np.flatnonzero(profile > 0)
+    return int(filled[-1]) + 1 if len(filled) else len(profile)
+
+def detect_grids(alphas):
+    """[{'frame_width', 'frame_height', 'frames', 'rows'}] for an (N, H, W) stack of alpha channels.
+
+    frames counts the non-empty cells, so a partly filled last row is not
+    padded with blank frames. When only one axis repeats (a strip), the
+    frames along the other axis are as long as the occupied part of the
+    sheet. Sheets with transparent spacing between frames also get
+    'spacing_x' and/or 'spacing_y'; frame i then starts at
+    (column * (frame_width + spacing_x), row * (frame_height + spacing_y)).
+    """
+    alphas = np.asarray(alphas, dtype=np.float32) / 255
+    count, height, width = alphas.shape
+    profiles_x, profiles_y = alphas.sum(axis=1), alphas.sum(axis=2)
+    pitches_x, spacings_x = detect_pitch(profiles_x)
+    pitches_y, spacings_y = detect_pitch(profiles_y)
+    grids = []
+    for alpha, profile_x, profile_y, pitch_x, pitch_y, spacing_x, spacing_y in zip(
+            alphas, profiles_x, profiles_y, pitches_x.tolist(), pitches_y.tolist(),
+            spacings_x.tolist(), spacings_y.tolist()):
+        rows, columns = -(-height // pitch_y), -(-width // pitch_x)
+        # A strip has one frame along its other axis, as long as the occupied part
+        if columns > 1 and rows == 1:
+            pitch_y = _extent(profile_y)
+        elif rows > 1 and columns == 1:
+            pitch_x = _extent(profile_x)
+        visible = alpha[:rows * pitch_y, :columns * pitch_x]
+        padded = np.zeros((rows * pitch_y, columns * pitch_x), dtype=np.float32)
+        padded[:visible.shape[0], :visible.shape[1]] = visible
+        cells = padded.reshape(rows, pitch_y, columns, pitch_x).sum(axis=(1, 3))
+        frames = int((cells > EMPTY_FRAME_FRACTION * cells.max()).sum()) if cells.max() > 0 else 1
+        # Only an axis with several frames has spacing. A sheet that keeps the
+        # gap after its last frame shows none on that axis, so it takes the
+        # other axis's spacing if its cells really end in a gap that wide
+        spacing_x = spacing_x if columns > 1 and frames > 1 else 0
+        spacing_y = spacing_y if rows > 1 and frames > 1 else 0
+        if columns > 1 and spacing_y and not spacing_x and _trailing_gutter(profile_x, pitch_x, spacing_y):
+            spacing_x = spacing_y
+        if rows > 1 and spacing_x and not spacing_y and _trailing_gutter(profile_y, pitch_y, spacing_x):
+            spacing_y = spacing_x
+        grid = {'frame_width': pitch_x - spacing_x if columns > 1 else pitch_x,
+                'frame_height': pitch_y - spacing_y if rows > 1 else pitch_y,
+                'frames': frames, 'rows': rows}
+        if spacing_x:
+            grid['spacing_x'] = spacing_x
+        if spacing_y:
+            grid['spacing_y'] = spacing_y
+        grids.append(grid)
+    return grids
+
+def _alpha(path):
+    with Image.open(path) as img:
+        return np.asarray(img.convert('RGBA'))[..., 3]
+
+def detect_files(paths):
+    """{path: grid} for image files, batching images of the same size"""
+    by_shape = {}
+    for path in map(str, paths):
+        alpha = _alpha(path)
+        by_shape.setdefault(alpha.shape, []).append((path, alpha))
+    grids = {}
+    for group in by_shape.values():
+        for (path, _), grid in zip(group, detect_grids(np.stack([alpha for _, alpha in group]))):
+            grids[path] = grid
+    return grids
+
+def catalog_entries(catalog):
+    """Every asset entry of a catalog-2d.json dict"""
+    for info in catalog['categories'].values():
+        for entries in info['subcategories'].values():
+            yield from entries
+        yield from info['assets']
+
+def update_catalog(catalog_path=CATALOG_2D):
+    """Detect the grid of every catalog image and store it on its entry; returns (entries, sheets)"""
+    with open(catalog_path) as f:
+        catalog = json.load(f)
+    entries = [entry for entry in catalog_entries(catalog) if os.path.exists(entry['path'])]
+    grids = detect_files([entry['path'] for entry in entries])
+    sheets = 0
+    for entry in entries:
+        for key in GRID_KEYS:
+            entry.pop(key, None)
+        entry.update(grids[entry['path']])
+        sheets += entry['frames'] > 1
+    with open(catalog_path, 'w') as f:
+        json.dump(catalog, f, indent=2)
+    return len(entries), sheets
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='*',
+                        help='only print the grids of these PNG files or directories; '
+                             f'without paths, update {CATALOG_2D}')
+    args = parser.parse_args()
+
+    if args.paths:
+        files = []
+        for path in map(Path, args.paths):
+            files += sorted(path.rglob('*.png')) if path.is_dir() else [path]
+        for path, grid in detect_files(files).items():
+            if grid['frames'] > 1:
+                print(f"  {grid['frames']:3d} frames in {grid['rows']} rows of "
+                      f"{grid['frame_width']}x{grid['frame_height']}  {path}")
+        print(f"  {len(files)} images scanned")
+    else:
+        print(f"Detecting sprite sheet grids in {CATALOG_2D}...")
+        total, sheets = update_catalog()
+        print(f"  {total} images, {sheets} sheets with more than one frame")
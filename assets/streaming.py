@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Block-based rendering for long audio tracks
+Synthesizes fixed-size blocks and streams them to a WAV file so a track
+never has to exist as one full-length array
+"""
+
+import wave
+import numpy as np
+
+DEFAULT_BLOCK_SIZE = 65536
+
+def iter_block_ranges(total_samples, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield (start, stop) sample ranges covering total_samples"""
+    for start in range(0, total_samples, block_size):
+        yield start, min(start + block_size, total_samples)
+
+def render_blocks(layers, total_samples, block_size=DEFAULT_BLOCK_SIZE):
+    """Yield mixed blocks of a track.
+
+    Each layer is a callable taking (start, stop) and returning the samples
+    for that range; layers are summed in order for every block.
+    """
+    for start, stop in iter_block_ranges(total_samples, block_size):
+        block = np.zeros(stop - start)
+        for layer in layers:
+            block += layer(start, stop)
+        yield block
+
+def render_full(layers, total_samples):
+    """Render a whole track in one block (the in-memory path)"""
+    return next(render_blocks(layers, total_samples, max(total_samples, 1)))
+
+def stream_wave(filename, make_blocks, sample_rate=44100):
+    """Write a mono 16-bit WAV from a block generator using two passes.
+
+    make_blocks is called twice and must return the same blocks each time:
+    the first pass finds the peak, the second normalizes and writes frames,
+    so the file matches save_wave() on the concatenated track. A silent
+    track is written as zeros.
+    """
+    peak = 0.0
+    for block in make_blocks():
+        if len(block):
+            peak = max(peak, float(np.max(np.abs(block))))
+
+    with wave.open(filename, 'w') as wav_file:
+        wav_file.setnchannels(1)  # Mono
+        wav_file.setsampwidth(2)  # 2 bytes = 16 bit
+        wav_file.setframerate(sample_rate)
+        for block in make_blocks():
+            # Same expression as save_wave() so the samples round identically;
+            # a silent track has no peak to divide by and stays at zero
+            samples = block / peak * 32767 if peak > 0 else np.zeros(len(block))
+            wav_file.writeframes(np.int16(samples).tobytes())
@@ -0,0 +1,25 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# The asset scripts import each other as top-level modules
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+@pytest.fixture(scope='session')
+def catalog():
+    """scripts/catalog-kenney-assets.py as a module"""
+    path = Path(__file__).resolve().parents[2] / 'scripts' / 'catalog-kenney-assets.py'
+    spec = importlib.util.spec_from_file_location('catalog_kenney_assets', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@pytest.fixture
+def kenney_tree(tmp_path, catalog, monkeypatch):
+    """Empty Kenney 2D source tree and public directory: (source dir, public dir)"""
+    assets_2d, public = tmp_path / '2D assets', tmp_path / 'public'
+    assets_2d.mkdir()
+    monkeypatch.setattr(catalog, 'ASSETS_2D_PATH', assets_2d)
+    return assets_2d, public
@@ -0,0 +1,32 @@
+import base64
+import wave
+
+import numpy as np
+
+from audio_analysis import analyze_audio
+
+def write_wav(path, samples, sample_rate=8000):
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(np.round(np.asarray(samples) * 32767).astype('<i2').tobytes())
+
+def waveform_pairs(analysis):
+    return np.frombuffer(base64.b64decode(analysis['waveform']), dtype=np.int8).reshape(-1, 2)
+
+def test_waveform_buckets_follow_the_signal(tmp_path):
+    path = tmp_path / 'offset.wav'
+    samples = np.full(8000, 0.5)
+    samples[::2] = 0.25
+    write_wav(path, samples)
+    pairs = waveform_pairs(analyze_audio(path, buckets=16, block_frames=1000))
+    assert pairs.shape == (16, 2)
+    assert np.all(pairs[:, 0] == 32) and np.all(pairs[:, 1] == 64)
+
+def test_waveform_of_a_negative_clip_stays_negative(tmp_path):
+    path = tmp_path / 'negative.wav'
+    write_wav(path, np.linspace(-0.75, -0.25, 4000))
+    pairs = waveform_pairs(analyze_audio(path, buckets=8))
+    assert np.all(pairs[:, 1] < 0)
+    assert np.all(pairs[:, 0] < pairs[:, 1])
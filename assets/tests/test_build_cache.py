@@ -0,0 +1,33 @@
+import importlib
+import linecache
+import sys
+
+import build_cache
+from build_cache import BuildCache
+
+MODULE = '''
+class Filter:
+    def process(self, x):
+        return x * {scale}
+
+def render():
+    return Filter().process(2)
+'''
+
+def _load(tmp_path, scale):
+    (tmp_path / 'cached_gen.py').write_text(MODULE.format(scale=scale))
+    linecache.clearcache()
+    sys.modules.pop('cached_gen', None)
+    return importlib.import_module('cached_gen')
+
+def test_editing_a_class_invalidates_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_cache, 'ROOT', str(tmp_path))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    output = tmp_path / 'out.bin'
+    output.write_bytes(b'sound')
+    cache = BuildCache(str(tmp_path / 'manifest.json'))
+
+    key = cache.key(_load(tmp_path, 3).render)
+    cache.record(str(output), key)
+    assert cache.is_fresh(str(output), cache.key(_load(tmp_path, 3).render))
+    assert not cache.is_fresh(str(output), cache.key(_load(tmp_path, 4).render))
@@ -0,0 +1,74 @@
+import os
+import shutil
+
+import pytest
+
+@pytest.fixture
+def tree(tmp_path):
+    """Source and public directories with two source files"""
+    source, public = tmp_path / 'source', tmp_path / 'public'
+    source.mkdir()
+    for name in ('a.png', 'b.png'):
+        (source / name).write_bytes(name.encode() * 50)
+    return source, public
+
+def scan(catalog, db_path, source, public, calls):
+    """One catalog run over every file in source; appends (action, file name) to calls"""
+    index = catalog.CatalogIndex(str(db_path))
+
+    def publish(path, dest):
+        calls.append(('publish', os.path.basename(path)))
+        shutil.copy2(path, dest)
+
+    def read_dimensions(path):
+        calls.append(('open', os.path.basename(path)))
+        return 8, 8
+
+    for path in sorted(source.iterdir()):
+        index.record(*index.check(path, public / 'misc' / path.name, 'copy', publish, read_dimensions))
+    index.prune(source)
+    index.close()
+    return index.stats
+
+def test_rescan_only_touches_changed_files(catalog, tree, tmp_path, monkeypatch):
+    source, public = tree
+    db_path = tmp_path / 'index.sqlite'
+    calls = []
+    assert scan(catalog, db_path, source, public, calls) == {'unchanged': 0, 'published': 2, 'pruned': 0}
+    assert sorted(calls) == [('open', 'a.png'), ('open', 'b.png'), ('publish', 'a.png'), ('publish', 'b.png')]
+
+    # Nothing changed: no file is hashed, opened or copied
+    hashed = []
+    file_hash = catalog.file_hash
+    monkeypatch.setattr(catalog, 'file_hash', lambda path: hashed.append(path) or file_hash(path))
+    calls.clear()
+    assert scan(catalog, db_path, source, public, calls) == {'unchanged': 2, 'published': 0, 'pruned': 0}
+    assert calls == [] and hashed == []
+
+def test_rescan_republishes_edits_and_prunes_removed_sources(catalog, tree, tmp_path):
+    source, public = tree
+    db_path = tmp_path / 'index.sqlite'
+    scan(catalog, db_path, source, public, [])
+
+    (source / 'a.png').write_bytes(b'edited' * 50)
+    (source / 'b.png').unlink()
+    calls = []
+    assert scan(catalog, db_path, source, public, calls) == {'unchanged': 0, 'published': 1, 'pruned': 1}
+    assert calls == [('open', 'a.png'), ('publish', 'a.png')]
+    assert (public / 'misc' / 'a.png').read_bytes() == b'edited' * 50
+    assert not (public / 'misc' / 'b.png').exists()
+
+def test_touched_or_damaged_files_are_rechecked(catalog, tree, tmp_path):
+    source, public = tree
+    db_path = tmp_path / 'index.sqlite'
+    scan(catalog, db_path, source, public, [])
+
+    # A new mtime with the same bytes is rehashed but not copied again
+    st = os.stat(source / 'a.png')
+    os.utime(source / 'a.png', ns=(st.st_atime_ns, st.st_mtime_ns + 10 ** 9))
+    # A published copy that was modified is restored
+    (public / 'misc' / 'b.png').write_bytes(b'damaged')
+    calls = []
+    assert scan(catalog, db_path, source, public, calls) == {'unchanged': 1, 'published': 1, 'pruned': 0}
+    assert calls == [('publish', 'b.png')]
+    assert (public / 'misc' / 'b.png').read_bytes() == b'b.png' * 50
@@ -0,0 +1,16 @@
+import re
+
+from PIL import Image
+
+def test_hashed_names_publish_misc_assets_into_an_empty_tree(catalog, kenney_tree, tmp_path):
+    assets_2d, public = kenney_tree
+    (assets_2d / 'Unknown Pack').mkdir()
+    Image.new('RGBA', (8, 8), (200, 40, 40, 255)).save(assets_2d / 'Unknown Pack' / 'gem.png')
+    index = catalog.CatalogIndex(str(tmp_path / 'index.sqlite'))
+    sprites, _, _ = catalog.process_2d_assets(index, public_assets_path=public, thumbnails=False,
+                                              dedupe='off', hashed_names=True)
+    index.close()
+
+    path, = [sprite['path'] for sprite in sprites]
+    assert re.fullmatch(r'/assets/misc/unknown_pack_gem\.[0-9a-f]{10}\.png', path)
+    assert (public / path[len('/assets/'):]).exists()
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+from dsp import BiquadFilter, _loop_biquad, design_biquad
+
+@pytest.mark.parametrize('q, length', [(20, 100), (20, 777), (4, 50), (4, 8492), (0.7071, 1)])
+def test_biquad_matches_loop(q, length):
+    x = np.random.default_rng(length).standard_normal(length)
+    b, a = design_biquad('lowpass', 2000, 44100, q)
+    y = BiquadFilter(b, a).process(x)
+    np.testing.assert_allclose(y, _loop_biquad(x, b, a), atol=1e-9)
+
+@pytest.mark.parametrize('block', [1, 50, 777, 8192])
+def test_streamed_blocks_match_loop(block):
+    x = np.random.default_rng(block).standard_normal(20000)
+    b, a = design_biquad('lowpass', 1000, 44100, 20)
+    biquad = BiquadFilter(b, a)
+    y = np.concatenate([biquad.process(x[start:start + block]) for start in range(0, len(x), block)])
+    np.testing.assert_allclose(y, _loop_biquad(x, b, a), atol=1e-9)
@@ -0,0 +1,15 @@
+import audio_analysis
+import generate_sounds
+from build_cache import BuildCache
+
+def test_normalized_sound_keys_cover_the_loudness_code(tmp_path, monkeypatch):
+    cache = BuildCache(str(tmp_path / 'manifest.json'))
+    plain = generate_sounds.sound_cache_keys(cache)
+    normalized = generate_sounds.sound_cache_keys(cache, -16.0)
+    assert generate_sounds.sound_cache_keys(cache, -14.0) != normalized
+
+    # A change to the loudness measurement only invalidates normalized sounds
+    monkeypatch.setattr(audio_analysis, 'ABSOLUTE_GATE', audio_analysis.ABSOLUTE_GATE - 1)
+    assert generate_sounds.sound_cache_keys(cache) == plain
+    changed = generate_sounds.sound_cache_keys(cache, -16.0)
+    assert all(changed[name] != key for name, key in normalized.items())
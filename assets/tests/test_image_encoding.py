@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from image_encoding import optimize_png_file, save_compact, webp_available
+
+def visible(image):
+    """RGBA pixels of an image or image file with the color under alpha 0 cleared"""
+    if isinstance(image, Image.Image):
+        pixels = np.array(image.convert('RGBA'))
+    else:
+        with Image.open(image) as img:
+            pixels = np.array(img.convert('RGBA'))
+    pixels[pixels[..., 3] == 0] = 0
+    return pixels
+
+def sprite(colors, size=32):
+    """RGBA image drawing from colors, plus a transparent border with garbage RGB"""
+    rng = np.random.default_rng(13)
+    pixels = np.asarray(colors, dtype=np.uint8)[rng.integers(0, len(colors), (size, size))]
+    pixels[:2] = [[7, 99, 3, 0]]
+    return Image.fromarray(pixels, 'RGBA')
+
+def test_few_colors_round_trip_through_a_palette_png(tmp_path):
+    img = sprite([[255, 0, 0, 255], [0, 0, 255, 128], [10, 200, 30, 255]])
+    path = tmp_path / 'few.png'
+    save_compact(img, str(path))
+    with Image.open(path) as saved:
+        assert saved.mode == 'P'
+    assert np.array_equal(visible(path), visible(img))
+
+def test_many_colors_round_trip_as_rgba(tmp_path):
+    rng = np.random.default_rng(5)
+    img = sprite(np.concatenate([rng.integers(0, 256, (300, 3)), np.full((300, 1), 255)], axis=1))
+    path = tmp_path / 'many.png'
+    save_compact(img, str(path))
+    with Image.open(path) as saved:
+        assert saved.mode == 'RGBA'
+    assert np.array_equal(visible(path), visible(img))
+
+@pytest.mark.skipif(not webp_available(), reason='Pillow was built without WebP')
+def test_webp_is_lossless(tmp_path):
+    img = sprite([[255, 0, 0, 255], [0, 0, 255, 128], [10, 200, 30, 64]])
+    sizes = save_compact(img, str(tmp_path / 'sprite.png'), webp=True)
+    assert sizes['webp'] == (tmp_path / 'sprite.webp').stat().st_size
+    assert np.array_equal(visible(tmp_path / 'sprite.webp'), visible(img))
+
+def test_optimized_copy_is_never_larger(tmp_path):
+    source, dest = tmp_path / 'source.png', tmp_path / 'dest.png'
+    img = sprite([[255, 0, 0, 255], [0, 0, 0, 0]])
+    img.save(source, 'PNG', optimize=True)
+    sizes = optimize_png_file(str(source), str(dest))
+    assert sizes['png'] == dest.stat().st_size <= source.stat().st_size
+    assert np.array_equal(visible(dest), visible(source))
@@ -0,0 +1,22 @@
+import numpy as np
+
+from pack_atlases import pack_frames
+
+def test_packed_frames_stay_on_their_page_without_overlapping():
+    rng = np.random.default_rng(11)
+    sizes = [tuple(int(v) for v in rng.integers(4, 90, 2)) for _ in range(150)]
+    placements, page_sizes = pack_frames(sizes, max_size=256, padding=2)
+    assert len(page_sizes) > 1
+
+    for page, (width, height) in enumerate(page_sizes):
+        coverage = np.zeros((height, width), dtype=int)
+        for (w, h), (frame_page, x, y) in zip(sizes, placements):
+            if frame_page == page:
+                assert x + w + 2 <= width and y + h + 2 <= height
+                coverage[y:y + h + 2, x:x + w + 2] += 1
+        assert coverage.max() == 1
+
+def test_page_shrinks_to_the_smallest_power_of_two_that_fits():
+    placements, page_sizes = pack_frames([(30, 30)] * 4, max_size=256, padding=2)
+    assert page_sizes == [(64, 64)]
+    assert sorted((x, y) for _, x, y in placements) == [(0, 0), (0, 32), (32, 0), (32, 32)]
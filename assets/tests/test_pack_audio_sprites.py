@@ -0,0 +1,37 @@
+import wave
+
+import numpy as np
+
+from pack_audio_sprites import read_audio, write_sprite
+
+def write_wav(path, samples, sample_rate=8000):
+    samples = np.asarray(samples).reshape(len(samples), -1)
+    with wave.open(str(path), 'wb') as f:
+        f.setnchannels(samples.shape[1])
+        f.setsampwidth(2)
+        f.setframerate(sample_rate)
+        f.writeframes(np.round(samples * 32767).astype('<i2').tobytes())
+    return str(path)
+
+def test_sprite_index_points_at_each_clip(tmp_path):
+    # Each clip is a different constant level, so its start is easy to find in the sprite
+    levels = {'a': 0.25, 'b': -0.5, 'c': 0.75}
+    lengths = {'a': 400, 'b': 1000, 'c': 240}
+    clips = [(clip_id, write_wav(tmp_path / f'{clip_id}.wav', np.full(lengths[clip_id], level)))
+             for clip_id, level in levels.items()]
+    # A stereo clip makes the whole sprite stereo
+    clips.append(('d', write_wav(tmp_path / 'd.wav', np.tile([[0.5, -0.5]], (80, 1)))))
+
+    sprite = str(tmp_path / 'sprite.wav')
+    index = write_sprite(sprite, clips, padding_ms=50)
+    data, sample_rate = read_audio(sprite)
+    assert data.shape == (400 + 1000 + 240 + 80 + 4 * 400, 2)
+
+    offset = 0
+    for clip_id, frames in list(lengths.items()) + [('d', 80)]:
+        assert index[clip_id] == [offset * 1000 / sample_rate, frames * 1000 / sample_rate]
+        clip = data[offset:offset + frames]
+        expected = [0.5, -0.5] if clip_id == 'd' else [levels[clip_id]] * 2
+        assert np.allclose(clip, expected, atol=1e-4)
+        assert not data[offset + frames:offset + frames + 400].any()
+        offset += frames + 400
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from publish import publish_file
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / 'source.png'
+    path.write_bytes(b'pixels' * 100)
+    return path
+
+def test_copy_if_changed_skips_identical_files(tmp_path, source):
+    dest = tmp_path / 'dest.png'
+    assert publish_file(source, dest, 'copy-if-changed') == (600, 'copy')
+    assert publish_file(source, dest, 'copy-if-changed') == (0, 'unchanged')
+    source.write_bytes(b'other' * 100)
+    assert publish_file(source, dest, 'copy-if-changed') == (500, 'copy')
+    assert dest.read_bytes() == source.read_bytes()
+
+def test_copy_always_writes(tmp_path, source):
+    dest = tmp_path / 'dest.png'
+    publish_file(source, dest, 'copy')
+    assert publish_file(source, dest, 'copy') == (600, 'copy')
+
+def test_links_point_at_the_source(tmp_path, source):
+    hard, soft = tmp_path / 'hard.png', tmp_path / 'public' / 'soft.png'
+    soft.parent.mkdir()
+    assert publish_file(source, hard, 'hardlink') == (0, 'hardlink')
+    assert os.path.samefile(source, hard)
+    assert publish_file(source, hard, 'hardlink') == (0, 'unchanged')
+
+    assert publish_file(source, soft, 'symlink') == (0, 'symlink')
+    assert os.readlink(soft) == os.path.join('..', 'source.png')
+    assert publish_file(source, soft, 'symlink') == (0, 'unchanged')
+
+def test_reflink_publishes_the_same_bytes(tmp_path, source):
+    # Filesystems without clone support fall back to a copy
+    dest = tmp_path / 'dest.png'
+    size, method = publish_file(source, dest, 'reflink')
+    assert (size, method) in ((0, 'reflink'), (600, 'copy'))
+    assert dest.read_bytes() == source.read_bytes()
+    assert publish_file(source, dest, 'reflink') == (0, 'unchanged')
+
+@pytest.mark.parametrize('link_mode', ['hardlink', 'symlink'])
+def test_switching_away_from_links_never_writes_through(tmp_path, source, link_mode):
+    dest = tmp_path / 'dest.png'
+    publish_file(source, dest, link_mode)
+    assert publish_file(source, dest, 'copy-if-changed') == (600, 'copy')
+    assert not os.path.islink(dest) and not os.path.samefile(source, dest)
+
+    dest.write_bytes(b'edited')
+    assert source.read_bytes() == b'pixels' * 100
+
+def test_unknown_mode_is_rejected(tmp_path, source):
+    with pytest.raises(ValueError, match='unknown publish mode'):
+        publish_file(source, tmp_path / 'dest.png', 'move')
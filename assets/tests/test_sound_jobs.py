@@ -0,0 +1,17 @@
+from pathlib import Path
+
+import generate_sounds
+
+def _generate(directory, monkeypatch, jobs):
+    monkeypatch.chdir(directory)
+    generate_sounds.generate_all_sounds(jobs=jobs, force=True)
+    outputs = sorted(Path('assets').glob('*/*.wav'))
+    return {str(path): path.read_bytes() for path in outputs}
+
+def test_sounds_are_identical_for_any_number_of_jobs(tmp_path, monkeypatch):
+    (tmp_path / 'serial').mkdir()
+    (tmp_path / 'parallel').mkdir()
+    serial = _generate(tmp_path / 'serial', monkeypatch, jobs=1)
+    parallel = _generate(tmp_path / 'parallel', monkeypatch, jobs=3)
+    assert len(serial) == len(generate_sounds.sound_effect_jobs()) + len(generate_sounds.MUSIC_STYLES)
+    assert parallel == serial
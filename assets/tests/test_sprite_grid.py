@@ -0,0 +1,22 @@
+import numpy as np
+
+from sprite_grid import detect_grids
+
+def _sheet(rows, columns, frame, spacing_x=0, spacing_y=0, inset=2, canvas=None):
+    """Alpha channel of a sheet of inset square sprites with the given gaps between frames"""
+    height = canvas or rows * (frame + spacing_y) - spacing_y
+    alpha = np.zeros((height, columns * (frame + spacing_x) - spacing_x))
+    rng = np.random.default_rng(rows * columns)
+    for row in range(rows):
+        for column in range(columns):
+            top, left = row * (frame + spacing_y) + inset, column * (frame + spacing_x) + inset
+            alpha[top:top + frame - 2 * inset, left:left + frame - 2 * inset] = rng.integers(64, 256, (frame - 2 * inset,) * 2)
+    return alpha
+
+def test_strip_frames_cover_only_the_occupied_rows():
+    grid, = detect_grids(_sheet(1, 8, 32, canvas=256)[np.newaxis])
+    assert grid == {'frame_width': 32, 'frame_height': 30, 'frames': 8, 'rows': 1}
+
+def test_spacing_on_one_axis_only():
+    grid, = detect_grids(_sheet(3, 4, 16, spacing_x=2)[np.newaxis])
+    assert grid == {'frame_width': 16, 'frame_height': 16, 'frames': 12, 'rows': 3, 'spacing_x': 2}
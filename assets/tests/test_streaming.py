@@ -0,0 +1,24 @@
+import wave
+
+import numpy as np
+import pytest
+
+import generate_sounds
+from streaming import render_blocks, stream_wave
+
+@pytest.mark.parametrize('style', generate_sounds.MUSIC_STYLES)
+def test_streamed_music_matches_the_in_memory_file(tmp_path, style):
+    # A block size that does not divide the track puts a short block at the end
+    streamed, full = tmp_path / 'streamed.wav', tmp_path / 'full.wav'
+    generate_sounds.write_music_track(style, str(streamed), stream=True, block_size=10007)
+    generate_sounds.write_music_track(style, str(full))
+    assert streamed.read_bytes() == full.read_bytes()
+
+def test_silent_track_streams_as_zeros(tmp_path):
+    path = tmp_path / 'silence.wav'
+    layers = [lambda start, stop: np.zeros(stop - start)]
+    with np.errstate(all='raise'):
+        stream_wave(str(path), lambda: render_blocks(layers, 1000, 256))
+    with wave.open(str(path)) as f:
+        frames = np.frombuffer(f.readframes(f.getnframes()), dtype='<i2')
+    assert len(frames) == 1000 and not frames.any()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tileable noise for generated tilesets
+Value and Perlin noise computed for many tiles at once; every tile wraps
+seamlessly at its own edges, at any tile size
+"""
+
+import numpy as np
+
+def _lattice_coords(size, period):
+    """Lattice cell index, next index (wrapping) and fraction for each pixel"""
+    coords = (np.arange(size) + 0.5) * period / size
+    i0 = np.floor(coords).astype(np.intp)
+    return i0 % period, (i0 + 1) % period, coords - i0
+
+def _smoothstep(t):
+    return t * t * (3 - 2 * t)
+
+def _fade(t):
+    return t * t * t * (t * (t * 6 - 15) + 10)
+
+def value_noise(count, size, period, rng):
+    """(count, size, size) tileable value noise in [0, 1], one independent field per tile"""
+    lattice = rng.random((count, period, period))
+    i0, i1, frac = _lattice_coords(size, period)
+    s = _smoothstep(frac)
+    sx = s[np.newaxis, np.newaxis, :]
+    sy = s[np.newaxis, :, np.newaxis]
+
+    top_left = lattice[:, i0[:, None], i0[None, :]]
+    top_right = lattice[:, i0[:, None], i1[None, :]]
+    bottom_left = lattice[:, i1[:, None], i0[None, :]]
+    bottom_right = lattice[:, i1[:, None], i1[None, :]]
+    top = top_left + (top_right - top_left) * sx
+    bottom = bottom_left + (bottom_right - bottom_left) * sx
+    return top + (bottom - top) * sy
+
+def perlin_noise(count, size, period, rng):
+    """(count, size, size) tileable gradient (Perlin) noise mapped to [0, 1]"""
+    angles = rng.random((count, period, period)) * 2 * np.pi
+    grad_x, grad_y = np.cos(angles), np.sin(angles)
+    i0, i1, frac = _lattice_coords(size, period)
+    fx = frac[np.newaxis, np.newaxis, :]
+    fy = frac[np.newaxis, :, np.newaxis]
+
+    def corner(iy, ix, dy, dx):
+        gx = grad_x[:, iy[:, None], ix[None, :]]
+        gy = grad_y[:, iy[:, None], ix[None, :]]
+        return gx * (fx - dx) + gy * (fy - dy)
+
+    u, v = _fade(fx), _fade(fy)
+    top = corner(i0, i0, 0, 0) + (corner(i0, i1, 0, 1) - corner(i0, i0, 0, 0)) * u
+    bottom = corner(i1, i0, 1, 0) + (corner(i1, i1, 1, 1) - corner(i1, i0, 1, 0)) * u
+    noise = top + (bottom - top) * v
+    # Gradient noise in 2-D stays within +-sqrt(1/2)
+    return np.clip(0.5 + noise / np.sqrt(2), 0.0, 1.0)
+
+def tile_noise(kind, count, size, period, rng, octaves=1):
+    """Fractal sum of tileable 'value' or 'perlin' noise, normalized to [0, 1].
+
+    Each octave doubles the lattice period (while it fits in the tile) and
+    halves the amplitude.
+    """
+    generator = {'value': value_noise, 'perlin': perlin_noise}[kind]
+    total = np.zeros((count, size, size))
+    weight = 0.0
+    amplitude = 1.0
+    for _ in range(octaves):
+        total += amplitude * generator(count, size, min(period, size), rng)
+        weight += amplitude
+        amplitude /= 2
+        period *= 2
+    return total / weight
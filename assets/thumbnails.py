@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Fixed-size preview thumbnails for the asset browser
+Each image is fitted into a square transparent canvas per size: pixel art
+is scaled by whole factors with nearest-neighbor sampling, everything else
+is reduced with area (box) resampling and never enlarged
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image
+
+from image_encoding import encode_png
+
+THUMBNAIL_SIZES = (64, 128)
+
+# Pixel art has a small flat palette and hard (fully on/off) alpha edges
+PIXEL_ART_MAX_COLORS = 64
+
+def is_pixel_art(img):
+    """Guess whether an image is pixel art from its colors and alpha edges"""
+    rgba = np.asarray(img.convert('RGBA'))
+    alpha = rgba[..., 3]
+    if np.any((alpha > 0) & (alpha < 255)):
+        return False
+    opaque = np.ascontiguousarray(rgba[alpha == 255]).view('<u4')
+    return 0 < len(opaque) and len(np.unique(opaque)) <= PIXEL_ART_MAX_COLORS
+
+def render_thumbnail(img, size, pixel_art=False):
+    """Return img fitted and centered in a size x size RGBA canvas"""
+    img = img.convert('RGBA')
+    width, height = img.size
+    longest = max(width, height)
+    # Nearest-neighbor would just drop pixels on big reductions, so those use box too
+    if pixel_art and longest <= 2 * size:
+        # Whole-number scaling keeps every source pixel square
+        factor = size // longest if longest <= size else 0.5
+        new_size = (max(1, int(width * factor)), max(1, int(height * factor)))
+        resized = img.resize(new_size, Image.NEAREST)
+    elif longest > size:
+        scale = size / longest
+        new_size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        resized = img.resize(new_size, Image.BOX, reducing_gap=3.0)
+    else:
+        resized = img
+    canvas = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    canvas.paste(resized, ((size - resized.width) // 2, (size - resized.height) // 2))
+    return canvas
+
+def is_up_to_date(source, outputs):
+    """True if every output exists and is newer than the source"""
+    source_mtime = os.path.getmtime(source)
+    return all(os.path.exists(path) and os.path.getmtime(path) >= source_mtime
+               for path in outputs.values())
+
+def write_thumbnails(source, outputs, pixel_art=None):
+    """Write one thumbnail per {size: path} in outputs; returns seconds taken.
+
+    pixel_art=None detects it from the image.
+    """
+    start = time.perf_counter()
+    with Image.open(source) as img:
+        img.load()
+    if pixel_art is None:
+        pixel_art = is_pixel_art(img)
+    for size, path in outputs.items():
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(encode_png(render_thumbnail(img, size, pixel_art)))
+    return time.perf_counter() - start
+
+def _write_job(job):
+    return write_thumbnails(*job)
+
+def generate_thumbnails(jobs, workers=None, force=False):
+    """Write thumbnails for [(source, {size: path}, pixel_art)] on a process pool.
+
+    Sources whose thumbnails are newer than they are skipped unless force.
+    Returns (written, skipped).
+    """
+    pending = [job for job in jobs if force or not is_up_to_date(job[0], job[1])]
+    if not pending:
+        return 0, len(jobs)
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(_write_job, pending, chunksize=8))
+    else:
+        for job in pending:
+            _write_job(job)
+    return len(pending), len(jobs) - len(pending)
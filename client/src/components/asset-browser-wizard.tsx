@@ -60,13 +60,28 @@ export default function AssetBrowserWizard({
   const [hoveredAsset, setHoveredAsset] = useState<GameAsset | null>(null);
   const [viewMode, setViewMode] = useState<'grid' | 'list'>('grid');
   const [currentPage, setCurrentPage] = useState(1);
+  const [assetsVersion, setAssetsVersion] = useState(0);
   const itemsPerPage = 20;
 
+  // Load the Kenney manifest shards for the visible asset types
+  useEffect(() => {
+    const type = assetType ?? (selectedTab === 'all' ? undefined : selectedTab);
+    let active = true;
+    assetManager.loadKenneyAssets(type ? [type] : undefined)
+      .then(added => {
+        if (added && active) setAssetsVersion(version => version + 1);
+      })
+      .catch(error => console.error('Failed to load Kenney assets:', error));
+    return () => {
+      active = false;
+    };
+  }, [selectedTab, assetType]);
+
   // Get suggested assets based on game type
   const suggestedAssets = useMemo(() => {
     if (!gameType || !showPixelSuggestions) return null;
     return assetManager.getSuggestedAssets(gameType);
-  }, [gameType, showPixelSuggestions]);
+  }, [gameType, showPixelSuggestions, assetsVersion]);
 
   // Filter assets based on current criteria
   const filteredAssets = useMemo(() => {
@@ -81,7 +96,7 @@ export default function AssetBrowserWizard({
     }
 
     return assetManager.filterAssets(filter);
-  }, [searchQuery, selectedTab, selectedCategory, assetType]);
+  }, [searchQuery, selectedTab, selectedCategory, assetType, assetsVersion]);
 
   // Get unique categories from filtered assets
   const categories = useMemo(() => {
@@ -203,7 +218,7 @@ export default function AssetBrowserWizard({
                   <div className="w-12 h-12 bg-gray-100 dark:bg-gray-800 rounded flex items-center justify-center overflow-hidden">
                     {(asset.type === 'sprite' || asset.type === 'background') && asset.thumbnail ? (
                       <img 
-                        src={asset.thumbnail} 
+                        src={asset.thumbnails?.[64] ?? asset.thumbnail} 
                         alt={asset.name}
                         className="w-full h-full object-contain"
                       />
@@ -14,10 +14,15 @@ import { allSprites } from './asset-sprites';
 import { allSounds } from './asset-sounds';
 import { allBackgrounds } from './asset-backgrounds';
 
-// Import real Kenney assets
-import { kenneySprites } from './kenney-sprites';
-import { kenneyBackgrounds } from './kenney-backgrounds';
-import { kenneySounds, kenneyMusic } from './kenney-sounds';
+// Real Kenney assets are loaded on demand from the manifest shards
+import {
+  KenneyShardKind,
+  KENNEY_SHARD_KINDS,
+  findKenneyShards,
+  loadKenneySearchIndex,
+  loadKenneyShard
+} from './kenney-manifest';
+import { AssetSearchIndex, tokenize } from './search-index';
 
 // Asset Manager Class
 export class AssetManager {
@@ -26,11 +31,17 @@ export class AssetManager {
   private loadedSounds: Map<string, HTMLAudioElement>;
   private loadStatus: AssetLoadStatus;
   private selection: AssetSelection;
+  private loadedShards: Set<string>;
+  private aliases: Map<string, string>;
+  private searchIndex: AssetSearchIndex | null;
 
   constructor() {
     this.assets = new Map();
     this.loadedImages = new Map();
     this.loadedSounds = new Map();
+    this.loadedShards = new Set();
+    this.aliases = new Map();
+    this.searchIndex = null;
     this.loadStatus = {
       total: 0,
       loaded: 0,
@@ -67,27 +78,39 @@ export class AssetManager {
       this.assets.set(bg.id, bg);
     });
 
-    // Add REAL Kenney sprites
-    kenneySprites.forEach(sprite => {
-      this.assets.set(sprite.id, sprite as any);
-    });
-
-    // Add REAL Kenney backgrounds
-    kenneyBackgrounds.forEach(bg => {
-      this.assets.set(bg.id, bg as any);
-    });
-
-    // Add REAL Kenney sounds
-    kenneySounds.forEach(sound => {
-      this.assets.set(sound.id, sound as any);
-    });
+    this.loadStatus.total = this.assets.size;
+  }
 
-    // Add REAL Kenney music
-    kenneyMusic.forEach(music => {
-      this.assets.set(music.id, music as any);
+  // Load REAL Kenney assets of the given types (all types when omitted).
+  // Resolves to true if new assets were added, so callers know to re-filter.
+  async loadKenneyAssets(types?: string[]): Promise<boolean> {
+    const kinds = types?.map(type => KENNEY_SHARD_KINDS[type]).filter(Boolean) as KenneyShardKind[] | undefined;
+    const shards = findKenneyShards(kinds).filter(shard => !this.loadedShards.has(shard.url));
+    if (shards.length === 0) return false;
+
+    const [lists] = await Promise.all([Promise.all(shards.map(loadKenneyShard)), this.loadSearchIndex()]);
+    shards.forEach((shard, i) => {
+      lists[i].forEach(asset => {
+        this.assets.set(asset.id, asset);
+        // Duplicate images are published once; their ids resolve to the canonical asset
+        asset.aliases?.forEach(alias => this.aliases.set(alias, asset.id));
+      });
+      this.loadedShards.add(shard.url);
     });
 
     this.loadStatus.total = this.assets.size;
+    return true;
+  }
+
+  // Load the precomputed search index over the Kenney shards; without it
+  // searches fall back to matching every asset by substring
+  private async loadSearchIndex() {
+    if (this.searchIndex) return;
+    try {
+      this.searchIndex = await loadKenneySearchIndex();
+    } catch (error) {
+      console.error('Failed to load asset search index:', error);
+    }
   }
 
   // Get all assets
@@ -97,7 +120,7 @@ export class AssetManager {
 
   // Get asset by ID
   getAssetById(id: string): GameAsset | undefined {
-    return this.assets.get(id);
+    return this.assets.get(id) ?? this.assets.get(this.aliases.get(id) ?? '');
   }
 
   // Filter assets
@@ -126,14 +149,25 @@ export class AssetManager {
       );
     }
 
-    // Search by name or description
+    // Search by name or description. Word matches from the search index
+    // (prefix and fuzzy) are added to the substring matches and ranked first
     if (filter.search) {
       const searchLower = filter.search.toLowerCase();
+      const scores = new Map<string, number>();
+      if (this.searchIndex && tokenize(filter.search).length > 0) {
+        this.searchIndex.search(filter.search, [], true, Infinity)
+          .forEach(result => scores.set(result.key, result.score));
+      }
       results = results.filter(asset =>
+        scores.has(asset.id) ||
         asset.name.toLowerCase().includes(searchLower) ||
         asset.description.toLowerCase().includes(searchLower) ||
         asset.tags.some(tag => tag.toLowerCase().includes(searchLower))
       );
+      // Best index matches first; the sort is stable, so the rest keep their order
+      if (scores.size > 0) {
+        results.sort((a, b) => (scores.get(b.id) ?? 0) - (scores.get(a.id) ?? 0));
+      }
     }
 
     return results;
@@ -220,6 +254,10 @@ export class AssetManager {
         this.loadStatus.failed.push(assetId);
         reject(new Error(`Failed to load sound: ${asset.path}`));
       };
+      // Loudness-normalized playback level from the catalog, if any
+      if (asset.volume !== undefined) {
+        audio.volume = asset.volume;
+      }
       audio.src = asset.path;
       audio.load();
     });
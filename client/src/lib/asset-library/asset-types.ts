@@ -45,6 +45,8 @@ export interface BaseAsset {
   type: AssetType;
   path: string;
   thumbnail?: string;
+  thumbnails?: { [size: number]: string };
+  aliases?: string[];
   tags: string[];
   license: string;
   suggestedUse?: string;
@@ -77,6 +79,12 @@ export interface SoundAsset extends BaseAsset {
   duration?: number;
   loop?: boolean;
   volume?: number;
+  // Precomputed by scripts/catalog-kenney-assets.py: levels in dBFS, loudness in LUFS
+  peak?: number | null;
+  rms?: number | null;
+  loudness?: number | null;
+  // Base64 int8 min/max pairs, see decodeWaveform() in sound-waveform.ts
+  waveform?: string;
 }
 
 // Background asset interface
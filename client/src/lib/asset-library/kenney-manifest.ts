@@ -0,0 +1,68 @@
+// Kenney Asset Manifest Loader
+// The catalog is split into JSON shards (see scripts/catalog-kenney-assets.py);
+// kenney-shards.ts lists them and each one is fetched the first time it is needed,
+// as is the search index built over them
+
+import { GameAsset } from './asset-types';
+import { kenneyShards, kenneySearchIndexUrl } from './kenney-shards';
+import { AssetSearchIndex, SearchIndexData } from './search-index';
+
+export type KenneyShardKind = 'sprites' | 'backgrounds' | 'sounds' | 'music';
+
+export interface KenneyShard {
+  kind: KenneyShardKind;
+  category: string | null;
+  url: string;
+  count: number;
+}
+
+// Shard kind holding each asset type
+export const KENNEY_SHARD_KINDS: { [type: string]: KenneyShardKind } = {
+  sprite: 'sprites',
+  background: 'backgrounds',
+  sound: 'sounds',
+  music: 'music'
+};
+
+const shardRequests = new Map<string, Promise<GameAsset[]>>();
+
+// Fetch one shard; concurrent and repeated calls share a single request
+export function loadKenneyShard(shard: KenneyShard): Promise<GameAsset[]> {
+  let request = shardRequests.get(shard.url);
+  if (!request) {
+    request = fetch(shard.url).then(response => {
+      if (!response.ok) {
+        throw new Error(`Failed to load asset manifest ${shard.url}: ${response.status}`);
+      }
+      return response.json() as Promise<GameAsset[]>;
+    });
+    // Let a failed shard be retried
+    request.catch(() => shardRequests.delete(shard.url));
+    shardRequests.set(shard.url, request);
+  }
+  return request;
+}
+
+// Shards matching the given kinds (all kinds when omitted) and category
+export function findKenneyShards(kinds?: KenneyShardKind[], category?: string): KenneyShard[] {
+  return kenneyShards.filter(shard =>
+    (!kinds || kinds.includes(shard.kind)) &&
+    (!category || shard.category === category)
+  );
+}
+
+let searchIndexRequest: Promise<AssetSearchIndex> | null = null;
+
+// Fetch the search index over all shards; shared like the shards themselves
+export function loadKenneySearchIndex(): Promise<AssetSearchIndex> {
+  if (!searchIndexRequest) {
+    searchIndexRequest = fetch(kenneySearchIndexUrl).then(response => {
+      if (!response.ok) {
+        throw new Error(`Failed to load asset search index ${kenneySearchIndexUrl}: ${response.status}`);
+      }
+      return response.json() as Promise<SearchIndexData>;
+    }).then(data => new AssetSearchIndex(data));
+    searchIndexRequest.catch(() => { searchIndexRequest = null; });
+  }
+  return searchIndexRequest;
+}
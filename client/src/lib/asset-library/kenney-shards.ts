@@ -0,0 +1,16 @@
+// Auto-generated by scripts/catalog-kenney-assets.py - do not edit
+import type { KenneyShard } from './kenney-manifest';
+
+export const kenneyShards: KenneyShard[] = [
+  { kind: 'backgrounds', category: 'backgrounds', url: '/assets/manifests/backgrounds-backgrounds.json', count: 17 },
+  { kind: 'backgrounds', category: 'enemies', url: '/assets/manifests/backgrounds-enemies.json', count: 4 },
+  { kind: 'backgrounds', category: 'misc', url: '/assets/manifests/backgrounds-misc.json', count: 27 },
+  { kind: 'backgrounds', category: 'tiles', url: '/assets/manifests/backgrounds-tiles.json', count: 2 },
+  { kind: 'sounds', category: null, url: '/assets/manifests/sounds.json', count: 50 },
+  { kind: 'sprites', category: 'backgrounds', url: '/assets/manifests/sprites-backgrounds.json', count: 20 },
+  { kind: 'sprites', category: 'enemies', url: '/assets/manifests/sprites-enemies.json', count: 56 },
+  { kind: 'sprites', category: 'misc', url: '/assets/manifests/sprites-misc.json', count: 6 },
+  { kind: 'sprites', category: 'tiles', url: '/assets/manifests/sprites-tiles.json', count: 18 },
+];
+
+export const kenneySearchIndexUrl = '/assets/manifests/search-index.json';
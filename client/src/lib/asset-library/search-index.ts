@@ -0,0 +1,143 @@
+// Asset Search Index
+// Queries the compact index built by assets/search_index.py: prefix and fuzzy
+// (trigram) word matches plus tag filters, without scanning the catalogs.
+// scripts/catalog-kenney-assets.py publishes one over the Kenney manifest shards,
+// keyed by asset id, which the asset manager loads with loadKenneySearchIndex()
+
+export interface SearchIndexData {
+  version: number;
+  docs: [key: string, name: string, kind: string][];
+  words: string[];
+  postings: number[][];
+  tags: { [tag: string]: number[] };
+  trigrams: { [gram: string]: number[] };
+}
+
+export interface SearchResult {
+  score: number;
+  key: string;
+  name: string;
+  kind: string;
+}
+
+// Same scoring and threshold as assets/search_index.py
+const SCORE_EXACT = 3;
+const SCORE_PREFIX = 2;
+const SCORE_FUZZY = 1;
+const FUZZY_THRESHOLD = 0.4;
+
+const WORD = /[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+/g;
+
+export function tokenize(text: string): string[] {
+  return (text.match(WORD) ?? []).map(word => word.toLowerCase());
+}
+
+function trigrams(word: string): Set<string> {
+  const padded = ` ${word} `;
+  const grams = new Set<string>();
+  for (let i = 0; i + 3 <= padded.length; i++) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return grams;
+}
+
+// Postings are stored as the first id followed by gaps
+function undelta(gaps: number[]): number[] {
+  let total = 0;
+  return gaps.map(gap => (total += gap));
+}
+
+// First index in the sorted word list that is >= word
+function lowerBound(words: string[], word: string, start = 0): number {
+  let low = start;
+  let high = words.length;
+  while (low < high) {
+    const mid = (low + high) >> 1;
+    if (words[mid] < word) low = mid + 1;
+    else high = mid;
+  }
+  return low;
+}
+
+export class AssetSearchIndex {
+  private decoded = new Map<number, number[]>();
+
+  constructor(private data: SearchIndexData) {}
+
+  private docsForWord(wordId: number): number[] {
+    let ids = this.decoded.get(wordId);
+    if (!ids) {
+      ids = undelta(this.data.postings[wordId]);
+      this.decoded.set(wordId, ids);
+    }
+    return ids;
+  }
+
+  private prefixWords(prefix: string): number[] {
+    const start = lowerBound(this.data.words, prefix);
+    const end = lowerBound(this.data.words, prefix + '\uffff', start);
+    return Array.from({ length: end - start }, (_, i) => start + i);
+  }
+
+  private fuzzyWords(word: string): number[] {
+    const grams = trigrams(word);
+    const shared = new Map<number, number>();
+    grams.forEach(gram => {
+      undelta(this.data.trigrams[gram] ?? []).forEach(wordId => {
+        shared.set(wordId, (shared.get(wordId) ?? 0) + 1);
+      });
+    });
+    return Array.from(shared.entries())
+      .filter(([wordId, count]) => 2 * count / (grams.size + this.data.words[wordId].length) >= FUZZY_THRESHOLD)
+      .map(([wordId]) => wordId);
+  }
+
+  private wordScores(word: string, fuzzy: boolean): Map<number, number> {
+    let matches: [number, number][] = this.prefixWords(word)
+      .map(wordId => [wordId, this.data.words[wordId] === word ? SCORE_EXACT : SCORE_PREFIX]);
+    if (matches.length === 0 && fuzzy) {
+      matches = this.fuzzyWords(word).map(wordId => [wordId, SCORE_FUZZY]);
+    }
+    const scores = new Map<number, number>();
+    matches.forEach(([wordId, score]) => {
+      this.docsForWord(wordId).forEach(docId => {
+        if ((scores.get(docId) ?? 0) < score) scores.set(docId, score);
+      });
+    });
+    return scores;
+  }
+
+  // Docs matching every query word and every tag, best first
+  search(query: string, tags: string[] = [], fuzzy = true, limit = 50): SearchResult[] {
+    let scores: Map<number, number> | null = null;
+    for (const word of tokenize(query)) {
+      const wordScores = this.wordScores(word, fuzzy);
+      if (!scores) {
+        scores = wordScores;
+      } else {
+        const combined = new Map<number, number>();
+        scores.forEach((score, docId) => {
+          const wordScore = wordScores.get(docId);
+          if (wordScore !== undefined) combined.set(docId, score + wordScore);
+        });
+        scores = combined;
+      }
+    }
+    for (const tag of tags) {
+      const tagged = new Set(undelta(this.data.tags[tag] ?? []));
+      if (!scores) {
+        scores = new Map(Array.from(tagged, docId => [docId, 0] as [number, number]));
+      } else {
+        const current: Map<number, number> = scores;
+        scores = new Map(Array.from(current.entries()).filter(([docId]) => tagged.has(docId)));
+      }
+    }
+    return Array.from(scores?.entries() ?? [])
+      .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+      .slice(0, limit)
+      .map(([docId, score]) => {
+        const [key, name, kind] = this.data.docs[docId];
+        return { score, key, name, kind };
+      });
+  }
+}
@@ -0,0 +1,15 @@
+// Sound Waveforms
+// Decodes the waveform peaks scripts/catalog-kenney-assets.py stores on each
+// SoundAsset (see assets/audio_analysis.py), so a sound can be drawn without
+// fetching and decoding the audio
+
+// Min/max sample pairs (-1..1) from a SoundAsset's base64 int8 waveform
+export function decodeWaveform(waveform: string): Array<[number, number]> {
+  const bytes = Uint8Array.from(atob(waveform), char => char.charCodeAt(0));
+  const samples = new Int8Array(bytes.buffer);
+  const pairs: Array<[number, number]> = [];
+  for (let i = 0; i + 1 < samples.length; i += 2) {
+    pairs.push([samples[i] / 127, samples[i + 1] / 127]);
+  }
+  return pairs;
+}
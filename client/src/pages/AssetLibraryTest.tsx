@@ -1,7 +1,7 @@
 // Asset Library Test Page
 // Test component to verify the asset library system
 
-import { useState } from 'react';
+import { useState, useEffect } from 'react';
 import { Button } from '@/components/ui/button';
 import { Card } from '@/components/ui/card';
 import AssetBrowserWizard from '@/components/asset-browser-wizard';
@@ -13,6 +13,16 @@ export default function AssetLibraryTest() {
   const [showBrowser, setShowBrowser] = useState(false);
   const [selectedAssets, setSelectedAssets] = useState<GameAsset[]>([]);
   const [assetType, setAssetType] = useState<'sprite' | 'sound' | 'music' | 'background' | undefined>(undefined);
+  const [, setAssetsVersion] = useState(0);
+
+  // Statistics cover the whole catalog, so load every Kenney shard
+  useEffect(() => {
+    assetManager.loadKenneyAssets()
+      .then(added => {
+        if (added) setAssetsVersion(version => version + 1);
+      })
+      .catch(error => console.error('Failed to load Kenney assets:', error));
+  }, []);
 
   const handleAssetSelect = (asset: GameAsset) => {
     setSelectedAssets([...selectedAssets, asset]);
@@ -5,12 +5,28 @@ This script scans the attached_assets directory and creates proper asset manifes
 """
 
 import os
+import sys
 import json
-import shutil
+import sqlite3
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import numpy as np
 from PIL import Image
 import hashlib
 
+# Shared helpers live next to the asset generators
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'assets'))
+from audio_analysis import cached_analysis, load_analyses, loudness_gain, save_analyses
+from build_cache import file_hash
+from dedupe import HASH_SIZE, SIGNATURE_SIZE, bytes_eliminated, file_signature, find_duplicates
+from image_encoding import optimize_png_file
+from publish import PUBLISH_MODES, format_publish_report, publish_file
+from search_index import build_index, manifest_documents
+from thumbnails import THUMBNAIL_SIZES, generate_thumbnails
+
 # Asset categories based on Kenney pack names
 CATEGORY_MAPPINGS = {
     'characters': ['Character Pack', 'Platformer Characters', 'Toon Characters', 'Shape Characters', 'Robot Pack'],
@@ -31,14 +47,330 @@ def get_category(pack_name):
                 return category
     return 'misc'
 
+ASSETS_2D_PATH = Path('../attached_assets/2D assets')
+AUDIO_PATH = Path('../attached_assets/Audio')
+PUBLIC_ASSETS_PATH = Path('../client/public/assets')
+
+# Catalog JSON shards (served from /assets/manifests) and their TypeScript index
+MANIFEST_DIR = PUBLIC_ASSETS_PATH / 'manifests'
+MANIFEST_URL = '/assets/manifests'
+SHARD_INDEX_PATH = Path('../client/src/lib/asset-library/kenney-shards.ts')
+# Search index over the shards (see assets/search_index.py), written next to them
+SEARCH_INDEX_NAME = 'search-index'
+
+# Logical asset id -> published URL, for tools that resolve ids without the shards
+ASSET_MAP_PATH = PUBLIC_ASSETS_PATH / 'asset-map.json'
+
+# With --hashed-names files are published as <id>.<hash><ext>, the hash being this
+# many hex digits of their content hash, so the server can mark them immutable
+HASH_LENGTH = 10
+
+INDEX_PATH = 'asset-catalog-index.sqlite'
+
+# Duration/level/loudness/waveform of each audio source, keyed by path and checked by sha256
+AUDIO_ANALYSIS_PATH = 'asset-catalog-audio-analysis.json'
+
+# Threads for stat/read/copy work; the scan waits on the disk, not the CPU
+DEFAULT_WORKERS = 8
+
+# How unoptimized files reach client/public/assets (see publish.py)
+DEFAULT_PUBLISH_MODE = 'copy-if-changed'
+
+INDEX_COLUMNS = ['source', 'size', 'mtime_ns', 'sha256', 'width', 'height',
+                 'dest', 'dest_size', 'dest_mtime_ns', 'mode']
+SIGNATURE_COLUMNS = ['source', 'size', 'mtime_ns', 'sha256', 'width', 'height', 'hash_pixels', 'signature']
+
+# Larger files are left out of the catalog
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+MAX_AUDIO_BYTES = 10 * 1024 * 1024
+
+# Duplicate images: 'off', 'exact' (identical files) or 'near' (see assets/dedupe.py)
+DEDUPE_MODES = ('off', 'exact', 'near')
+DEFAULT_DEDUPE = 'exact'
+
+class CatalogIndex:
+    """Persistent SQLite record of every cataloged file and the copy made of it.
+
+    Rescans compare each source's size and mtime with the index first; only
+    files whose stat changed are hashed, and only files whose content, mode
+    or published copy changed are reopened and published again. Sources
+    that disappear have their copies pruned. Image signatures for dedupe
+    are cached the same way.
+    """
+
+    def __init__(self, db_path=INDEX_PATH):
+        self.db = sqlite3.connect(db_path)
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS files (source TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, '
+            'sha256 TEXT, width INTEGER, height INTEGER, dest TEXT, dest_size INTEGER, '
+            'dest_mtime_ns INTEGER, mode TEXT)')
+        query = f"SELECT {', '.join(INDEX_COLUMNS)} FROM files"
+        self.rows = {row[0]: dict(zip(INDEX_COLUMNS, row)) for row in self.db.execute(query)}
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS signatures (source TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, '
+            'sha256 TEXT, width INTEGER, height INTEGER, hash_pixels BLOB, signature BLOB)')
+        query = f"SELECT {', '.join(SIGNATURE_COLUMNS)} FROM signatures"
+        self.signature_rows = {row[0]: dict(zip(SIGNATURE_COLUMNS, row)) for row in self.db.execute(query)}
+        self.seen = set()
+        self.signed = set()
+        self.changed = {}
+        self.changed_signatures = {}
+        self.replaced = set()
+        self.stats = {'unchanged': 0, 'published': 0, 'pruned': 0}
+
+    def _dest_matches(self, row, dest, mode):
+        if row['dest'] != dest or row['mode'] != mode:
+            return False
+        try:
+            st = os.stat(dest)
+        except FileNotFoundError:
+            return False
+        return st.st_size == row['dest_size'] and st.st_mtime_ns == row['dest_mtime_ns']
+
+    def check(self, source, dest, mode, publish, read_dimensions=None):
+        """Make sure dest is an up-to-date copy of source; returns (row, published).
+
+        publish(source, dest) writes the copy and read_dimensions(source)
+        opens the file for its (width, height); each only runs when
+        something changed. dest may also be a function of the source's
+        sha256, for content-hashed names. Only reads the index, so it is
+        safe to call from worker threads; pass the result to record() on
+        the main thread.
+        """
+        source = str(source)
+        st = os.stat(source)
+        row = self.rows.get(source)
+        if row is not None and row['size'] == st.st_size and row['mtime_ns'] == st.st_mtime_ns:
+            digest = row['sha256']
+        else:
+            digest = file_hash(source)
+        dest = str(dest(digest) if callable(dest) else dest)
+        same_content = row is not None and row['sha256'] == digest
+
+        if same_content:
+            width, height = row['width'], row['height']
+        else:
+            width, height = read_dimensions(source) if read_dimensions else (None, None)
+        published = not (same_content and self._dest_matches(row, dest, mode))
+        if published:
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            publish(source, dest)
+
+        dest_st = os.stat(dest)
+        new_row = {'source': source, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': digest,
+                   'width': width, 'height': height, 'dest': dest, 'dest_size': dest_st.st_size,
+                   'dest_mtime_ns': dest_st.st_mtime_ns, 'mode': mode}
+        return new_row, published
+
+    def record(self, row, published):
+        """Store the result of check()"""
+        source = row['source']
+        self.seen.add(source)
+        self.stats['published' if published else 'unchanged'] += 1
+        previous = self.rows.get(source)
+        if previous is not None and previous['dest'] != row['dest']:
+            # Published under a new name; prune() deletes the old copy
+            self.replaced.add(previous['dest'])
+        if row != previous:
+            self.rows[source] = row
+            self.changed[source] = row
+
+    def signature(self, source):
+        """dedupe.file_signature() of source as an index row, recomputed only when its stat changed.
+
+        Thread-safe like check(); pass the row to record_signature() on the main thread.
+        """
+        source = str(source)
+        st = os.stat(source)
+        row = self.signature_rows.get(source)
+        if row is not None and row['size'] == st.st_size and row['mtime_ns'] == st.st_mtime_ns:
+            return row
+        item = file_signature(source)
+        return {'source': source, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sha256': item['sha256'],
+                'width': item['width'], 'height': item['height'],
+                'hash_pixels': item['hash_pixels'].tobytes(), 'signature': item['signature'].tobytes()}
+
+    def record_signature(self, row):
+        """Store the result of signature()"""
+        self.signed.add(row['source'])
+        if row != self.signature_rows.get(row['source']):
+            self.signature_rows[row['source']] = row
+            self.changed_signatures[row['source']] = row
+
+    def prune(self, root):
+        """Forget sources under root that were not seen this run and delete their copies.
+
+        Copies left behind by sources published under a new name (a new
+        content hash) are deleted too.
+        """
+        root = str(root)
+        for source in [source for source in self.signature_rows
+                       if source.startswith(root) and source not in self.signed]:
+            del self.signature_rows[source]
+            self.db.execute('DELETE FROM signatures WHERE source = ?', (source,))
+        stale = [source for source in self.rows if source.startswith(root) and source not in self.seen]
+        live_dests = {row['dest'] for source, row in self.rows.items() if source not in stale}
+        for source in stale:
+            self.replaced.add(self.rows.pop(source)['dest'])
+            self.db.execute('DELETE FROM files WHERE source = ?', (source,))
+            self.stats['pruned'] += 1
+        for dest in self.replaced - live_dests:
+            for path in (dest, os.path.splitext(dest)[0] + '.webp'):
+                if os.path.exists(path):
+                    os.remove(path)
+        self.replaced = set()
+
+    def save(self):
+        """Write changed rows and commit"""
+        placeholders = ', '.join('?' for _ in INDEX_COLUMNS)
+        self.db.executemany(f'INSERT OR REPLACE INTO files VALUES ({placeholders})',
+                            [tuple(row[column] for column in INDEX_COLUMNS) for row in self.changed.values()])
+        placeholders = ', '.join('?' for _ in SIGNATURE_COLUMNS)
+        self.db.executemany(f'INSERT OR REPLACE INTO signatures VALUES ({placeholders})',
+                            [tuple(row[column] for column in SIGNATURE_COLUMNS)
+                             for row in self.changed_signatures.values()])
+        self.db.commit()
+        self.changed = {}
+        self.changed_signatures = {}
+
+    def close(self):
+        self.save()
+        self.db.close()
+
+def read_image_size(path):
+    """(width, height) of an image file"""
+    with Image.open(path) as img:
+        return img.size
+
 def generate_asset_id(file_path):
     """Generate unique ID for asset"""
     return hashlib.md5(file_path.encode()).hexdigest()[:8]
 
-def process_2d_assets():
-    """Process all 2D Kenney assets"""
-    assets_2d_path = Path('../attached_assets/2D assets')
-    public_assets_path = Path('../client/public/assets')
+def unique_asset_id(asset_id, file_path, taken):
+    """asset_id, or asset_id plus a hash of file_path when an earlier file already took it.
+
+    Packs reuse file names across folders (Default/ and Double/ sizes, .ogg
+    and .mp3 of one sound), and ids are cut to 50 characters.
+    """
+    if asset_id in taken:
+        asset_id = f"{asset_id}_{generate_asset_id(str(file_path))}"
+    taken.add(asset_id)
+    return asset_id
+
+def content_hashed_name(filename, digest, mode):
+    """filename with a content hash before its extension, e.g. coin.3f2a9c81d0.png.
+
+    Copies and links serve the source's own bytes, so its sha256 is used
+    as is; re-encoded files hash the source's sha256 together with the mode.
+    """
+    if mode.startswith('optimize'):
+        digest = hashlib.sha256(f'{digest}:{mode}'.encode()).hexdigest()
+    stem, ext = os.path.splitext(filename)
+    return f'{stem}.{digest[:HASH_LENGTH]}{ext}'
+
+def publish_dest(directory, filename, mode, hashed_names=False):
+    """Where a file is published: directory / filename, or with hashed_names a
+    function of the source's sha256 naming it with content_hashed_name()"""
+    if not hashed_names:
+        return directory / filename
+    return lambda digest: directory / content_hashed_name(filename, digest, mode)
+
+def map_io(func, items, workers=DEFAULT_WORKERS):
+    """map() over items on a bounded thread pool, results in input order"""
+    if workers <= 1:
+        return list(map(func, items))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, items))
+
+def _scan(index, source, dest, size_limit, mode, publish, read_dimensions=None):
+    """Stat, check and (if needed) publish one file on a worker thread.
+
+    Returns None for files over size_limit, the exception if one was raised,
+    or index.check()'s (row, published).
+    """
+    try:
+        if source.stat().st_size > size_limit:
+            return None
+        return index.check(source, dest, mode, publish, read_dimensions)
+    except Exception as e:
+        return e
+
+def _analyze(source, digest, previous):
+    """cached_analysis() on a worker thread: the exception if the file cannot be decoded"""
+    try:
+        return cached_analysis(source, digest, previous)
+    except Exception as e:
+        return e
+
+def _signature(index, source):
+    """index.signature() on a worker thread: None for files over MAX_IMAGE_BYTES, the exception on errors"""
+    try:
+        if source.stat().st_size > MAX_IMAGE_BYTES:
+            return None
+        return index.signature(source)
+    except Exception as e:
+        return e
+
+def dedupe_entries(index, entries, near=False, workers=DEFAULT_WORKERS):
+    """Drop duplicate images from the (png_file, ...) entries before publishing.
+
+    Returns (canonical entries, {canonical asset_id: [alias asset_ids]},
+    bytes of the duplicates that are no longer published). Entries that
+    could not be read are passed through for _scan to report.
+    """
+    rows = map_io(lambda entry: _signature(index, entry[0]), entries, workers)
+    kept, items, item_entries = [], [], []
+    for entry, row in zip(entries, rows):
+        if isinstance(row, dict):
+            index.record_signature(row)
+            items.append({'sha256': row['sha256'], 'bytes': row['size'],
+                          'width': row['width'], 'height': row['height'],
+                          'hash_pixels': np.frombuffer(row['hash_pixels'], np.uint8).reshape(HASH_SIZE, HASH_SIZE + 1, 4),
+                          'signature': np.frombuffer(row['signature'], np.uint8).reshape(SIGNATURE_SIZE, SIGNATURE_SIZE, 4)})
+            item_entries.append(entry)
+        elif row is not None:
+            kept.append(entry)
+
+    canonical = find_duplicates(items, [str(entry[0]) for entry in item_entries], near=near)
+    aliases = {}
+    for i, entry in enumerate(item_entries):
+        if canonical[i] == i:
+            kept.append(entry)
+        else:
+            aliases.setdefault(item_entries[canonical[i]][3], []).append(entry[3])
+    # Keep listing order
+    order = {entry[3]: n for n, entry in enumerate(entries)}
+    kept.sort(key=lambda entry: order[entry[3]])
+    return kept, aliases, bytes_eliminated(items, canonical)
+
+def process_2d_assets(index, optimize=False, webp=False, jobs=None, workers=DEFAULT_WORKERS,
+                      public_assets_path=PUBLIC_ASSETS_PATH, thumbnails=True,
+                      publish_mode=DEFAULT_PUBLISH_MODE, dedupe=DEFAULT_DEDUPE, hashed_names=False):
+    """Process all 2D Kenney assets.
+
+    Files are listed in sorted order, then stat'ed, read and copied on a
+    pool of `workers` threads; results are gathered in listing order so the
+    manifests do not depend on the concurrency. Unchanged files are neither
+    reopened nor copied again (see CatalogIndex).
+
+    Files are published with publish_mode (copy, copy-if-changed,
+    hardlink, reflink or symlink). With optimize=True PNGs are instead
+    re-encoded compactly (palette PNGs where possible, never larger than the
+    original); webp=True also writes a lossless .webp next to each one.
+
+    With dedupe='exact' identical images are published once and
+    dedupe='near' also merges near-duplicates (assets/dedupe.py); the
+    canonical asset lists the ids of the others in 'aliases'.
+    
+    hashed_names=True publishes each file as <id>.<content hash>.png
+    (see content_hashed_name()) so it can be served as immutable; copies
+    under old names are pruned.
+    
+    Every copied PNG gets square thumbnails (THUMBNAIL_SIZES), rendered on
+    `jobs` processes and skipped when newer than the source.
+    """
+    assets_2d_path = ASSETS_2D_PATH
+    public_assets_path = Path(public_assets_path)
     
     # Create output directories
     for category in CATEGORY_MAPPINGS.keys():
@@ -47,9 +379,24 @@ def process_2d_assets():
     sprite_assets = []
     tileset_assets = []
     background_assets = []
+    thumbnail_jobs = []
     
-    # Process each pack
-    for pack_dir in assets_2d_path.iterdir():
+    index_mode = ('optimize+webp' if webp else 'optimize') if optimize else publish_mode
+    optimized = []
+    publish_results = []
+    
+    def publish(source, dest):
+        if optimize:
+            sizes = optimize_png_file(source, dest, webp=webp)
+            optimized.append(sizes)
+            publish_results.append((sizes['png'] + (sizes['webp'] or 0), 'optimize'))
+        else:
+            publish_results.append(publish_file(source, dest, publish_mode))
+    
+    # List every file first: (png_file, pack_name, category, asset_id, new_filename)
+    entries = []
+    taken_ids = set()
+    for pack_dir in sorted(assets_2d_path.iterdir()):
         if not pack_dir.is_dir():
             continue
             
@@ -57,223 +404,367 @@ def process_2d_assets():
         category = get_category(pack_name)
         
         # Find PNG files in the pack
-        png_files = list(pack_dir.rglob('*.png'))
+        png_files = sorted(pack_dir.rglob('*.png'))
         
-        for png_file in png_files[:20]:  # Limit to 20 per pack for now
-            try:
-                # Skip if file is too large
-                if png_file.stat().st_size > 5 * 1024 * 1024:  # 5MB limit
-                    continue
-                    
-                # Get image dimensions
-                with Image.open(png_file) as img:
-                    width, height = img.size
-                    
-                # Determine asset type based on dimensions and name
-                asset_type = 'sprite'
-                if 'tile' in png_file.name.lower() or 'sheet' in png_file.name.lower():
-                    asset_type = 'tileset'
-                elif 'background' in png_file.name.lower() or 'bg' in png_file.name.lower():
-                    asset_type = 'background'
-                elif width > 512 or height > 512:
-                    asset_type = 'background'
-                
-                # Generate asset ID and new filename
-                asset_id = f"{pack_name.lower().replace(' ', '_')}_{png_file.stem}"[:50]
-                asset_id = ''.join(c if c.isalnum() or c in '_-' else '_' for c in asset_id)
-                new_filename = f"{asset_id}.png"
-                
-                # Copy to public assets
-                dest_path = public_assets_path / category / new_filename
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(png_file, dest_path)
-                
-                # Create asset metadata
-                asset_data = {
-                    'id': asset_id,
-                    'name': png_file.stem.replace('_', ' ').title(),
-                    'description': f'{pack_name} - {png_file.stem}',
-                    'type': asset_type,
-                    'category': category,
-                    'path': f'/assets/{category}/{new_filename}',
-                    'thumbnail': f'/assets/{category}/{new_filename}',
-                    'tags': [category, pack_name.lower().replace(' ', '_')],
-                    'license': 'CC0 - Kenney.nl',
-                    'suggestedUse': f'From {pack_name} pack',
-                    'size': {'width': width, 'height': height}
-                }
-                
-                # Add to appropriate list
-                if asset_type == 'sprite':
-                    sprite_assets.append(asset_data)
-                elif asset_type == 'tileset':
-                    tileset_assets.append(asset_data)
-                else:
-                    background_assets.append(asset_data)
-                    
-            except Exception as e:
-                print(f"Error processing {png_file}: {e}")
-                continue
+        for png_file in png_files:
+            # Generate asset ID and new filename
+            asset_id = f"{pack_name.lower().replace(' ', '_')}_{png_file.stem}"[:50]
+            asset_id = ''.join(c if c.isalnum() or c in '_-' else '_' for c in asset_id)
+            asset_id = unique_asset_id(asset_id, png_file, taken_ids)
+            entries.append((png_file, pack_name, category, asset_id, f"{asset_id}.png"))
+    
+    aliases = {}
+    if dedupe != 'off':
+        listed = len(entries)
+        entries, aliases, duplicate_bytes = dedupe_entries(index, entries, dedupe == 'near', workers)
+        print(f"Dedupe ({dedupe}): {listed - len(entries)} duplicate images in "
+              f"{len(aliases)} clusters, {duplicate_bytes:,} bytes not published")
+    
+    # Copy to public assets (only if new or changed) and get image dimensions,
+    # skipping files over the 5MB limit
+    results = map_io(
+        lambda entry: _scan(index, entry[0],
+                            publish_dest(public_assets_path / entry[2], entry[4], index_mode, hashed_names),
+                            MAX_IMAGE_BYTES, index_mode, publish, read_image_size),
+        entries, workers)
+    
+    for (png_file, pack_name, category, asset_id, new_filename), result in zip(entries, results):
+        if result is None:
+            continue
+        if isinstance(result, Exception):
+            print(f"Error processing {png_file}: {result}")
+            continue
+        row, published = result
+        index.record(row, published)
+        width, height = row['width'], row['height']
+        new_filename = Path(row['dest']).name
+        
+        # Determine asset type based on dimensions and name
+        asset_type = 'sprite'
+        if 'tile' in png_file.name.lower() or 'sheet' in png_file.name.lower():
+            asset_type = 'tileset'
+        elif 'background' in png_file.name.lower() or 'bg' in png_file.name.lower():
+            asset_type = 'background'
+        elif width > 512 or height > 512:
+            asset_type = 'background'
+        
+        # Thumbnails are rendered together once every file is known
+        thumbnail_urls = {size: f'/assets/thumbnails/{size}/{category}/{new_filename}'
+                          for size in THUMBNAIL_SIZES}
+        thumbnail_paths = {size: public_assets_path / 'thumbnails' / str(size) / category / new_filename
+                           for size in THUMBNAIL_SIZES}
+        pixel_art = True if 'pixel' in pack_name.lower() else None
+        thumbnail_jobs.append((str(png_file), thumbnail_paths, pixel_art))
+        
+        # Create asset metadata
+        asset_data = {
+            'id': asset_id,
+            'name': png_file.stem.replace('_', ' ').title(),
+            'description': f'{pack_name} - {png_file.stem}',
+            'type': asset_type,
+            'category': category,
+            'path': f'/assets/{category}/{new_filename}',
+            'thumbnail': thumbnail_urls[max(THUMBNAIL_SIZES)],
+            'thumbnails': thumbnail_urls,
+            'tags': [category, pack_name.lower().replace(' ', '_')],
+            'license': 'CC0 - Kenney.nl',
+            'suggestedUse': f'From {pack_name} pack',
+            'size': {'width': width, 'height': height}
+        }
+        if asset_id in aliases:
+            asset_data['aliases'] = aliases[asset_id]
+        
+        # Add to appropriate list
+        if asset_type == 'sprite':
+            sprite_assets.append(asset_data)
+        elif asset_type == 'tileset':
+            tileset_assets.append(asset_data)
+        else:
+            background_assets.append(asset_data)
+    
+    index.prune(assets_2d_path)
+    
+    if thumbnails:
+        written, skipped = generate_thumbnails(thumbnail_jobs, workers=jobs)
+        # Thumbnails of files that are gone or now published under another name
+        live = {str(path) for _, paths, _ in thumbnail_jobs for path in paths.values()}
+        removed = 0
+        for path in (public_assets_path / 'thumbnails').rglob('*.png'):
+            if str(path) not in live:
+                path.unlink()
+                removed += 1
+        print(f"Thumbnails: {written} images rendered, {skipped} up to date, {removed} stale removed")
+    
+    print(f"2D assets: {format_publish_report(publish_results)}")
+    if optimized:
+        bytes_before = sum(sizes['baseline'] for sizes in optimized)
+        bytes_after = sum(sizes['png'] for sizes in optimized)
+        print(f"Optimized PNGs: {bytes_before:,} -> {bytes_after:,} bytes "
+              f"(saved {bytes_before - bytes_after:,})")
     
     return sprite_assets, tileset_assets, background_assets
 
-def process_audio_assets():
-    """Process audio assets"""
-    audio_path = Path('../attached_assets/Audio')
-    public_audio_path = Path('../client/public/assets/audio')
+def process_audio_assets(index, workers=DEFAULT_WORKERS, public_assets_path=PUBLIC_ASSETS_PATH,
+                         publish_mode=DEFAULT_PUBLISH_MODE, analyze=True, loudness=None, hashed_names=False):
+    """Process audio assets, publishing only new or changed files on `workers` threads.
+
+    With analyze=True every decodable file also gets its duration, peak,
+    RMS, loudness and waveform peaks in the manifest (see
+    assets/audio_analysis.py), decoded only when its content changed. With
+    a loudness target (LUFS) louder clips get a playback volume that
+    brings them down to it. hashed_names=True publishes content-hashed
+    names as in process_2d_assets().
+    """
+    audio_path = AUDIO_PATH
+    public_audio_path = Path(public_assets_path) / 'audio'
     public_audio_path.mkdir(parents=True, exist_ok=True)
     
     sound_assets = []
     music_assets = []
+    publish_results = []
+    
+    def publish(source, dest):
+        publish_results.append(publish_file(source, dest, publish_mode))
     
     if audio_path.exists():
         # Process OGG and MP3 files
-        audio_files = list(audio_path.rglob('*.ogg')) + list(audio_path.rglob('*.mp3'))
+        audio_files = sorted(audio_path.rglob('*.ogg')) + sorted(audio_path.rglob('*.mp3'))
+        
+        # (audio_file, asset_id, new_filename) for each file
+        entries = []
+        taken_ids = set()
+        for audio_file in audio_files:
+            # Generate asset ID
+            asset_id = f"audio_{audio_file.stem}"[:50]
+            asset_id = ''.join(c if c.isalnum() or c in '_-' else '_' for c in asset_id)
+            asset_id = unique_asset_id(asset_id, audio_file, taken_ids)
+            entries.append((audio_file, asset_id, f"{asset_id}{audio_file.suffix}"))
+        
+        # Copy to public, skipping files over the 10MB limit
+        results = map_io(
+            lambda entry: _scan(index, entry[0],
+                                publish_dest(public_audio_path, entry[2], publish_mode, hashed_names),
+                                MAX_AUDIO_BYTES, publish_mode, publish),
+            entries, workers)
         
-        for audio_file in audio_files[:50]:  # Limit for now
-            try:
-                # Skip large files
-                if audio_file.stat().st_size > 10 * 1024 * 1024:  # 10MB limit
-                    continue
-                
-                # Determine if it's music or sound effect
-                is_music = 'music' in audio_file.name.lower() or 'theme' in audio_file.name.lower()
-                
-                # Generate asset ID
-                asset_id = f"audio_{audio_file.stem}"[:50]
-                asset_id = ''.join(c if c.isalnum() or c in '_-' else '_' for c in asset_id)
-                new_filename = f"{asset_id}{audio_file.suffix}"
-                
-                # Copy to public
-                dest_path = public_audio_path / new_filename
-                shutil.copy2(audio_file, dest_path)
-                
-                # Create metadata
-                asset_data = {
-                    'id': asset_id,
-                    'name': audio_file.stem.replace('_', ' ').title(),
-                    'type': 'music' if is_music else 'sound',
-                    'path': f'/assets/audio/{new_filename}',
-                    'tags': ['music' if is_music else 'sound', 'cc0'],
-                    'license': 'CC0 - Kenney.nl'
-                }
-                
-                if is_music:
-                    music_assets.append(asset_data)
-                else:
-                    sound_assets.append(asset_data)
-                    
-            except Exception as e:
-                print(f"Error processing {audio_file}: {e}")
+        scanned = []
+        for entry, result in zip(entries, results):
+            if result is None:
                 continue
+            if isinstance(result, Exception):
+                print(f"Error processing {entry[0]}: {result}")
+                continue
+            index.record(*result)
+            scanned.append(((entry[0], entry[1], Path(result[0]['dest']).name), result[0]['sha256']))
+        
+        # (analysis, decoded) per scanned file, None when it could not be decoded
+        analyses = [None] * len(scanned)
+        if analyze:
+            previous = load_analyses(AUDIO_ANALYSIS_PATH)
+            analysis_start = time.perf_counter()
+            analyses = map_io(lambda item: _analyze(item[0][0], item[1], previous), scanned, workers)
+            for i, ((entry, _), analysis) in enumerate(zip(scanned, analyses)):
+                if isinstance(analysis, Exception):
+                    print(f"Could not analyze {entry[0]}: {analysis}")
+                    analyses[i] = None
+            analyzed = [analysis for analysis in analyses if analysis is not None]
+            decoded = sum(fresh for _, fresh in analyzed)
+            save_analyses({str(entry[0]): analysis[0] for (entry, _), analysis in zip(scanned, analyses)
+                           if analysis is not None}, AUDIO_ANALYSIS_PATH)
+            print(f"Audio analysis: {decoded} decoded, {len(analyzed) - decoded} unchanged, "
+                  f"{len(scanned) - len(analyzed)} failed in {time.perf_counter() - analysis_start:.2f}s")
+        
+        for ((audio_file, asset_id, new_filename), _), analysis in zip(scanned, analyses):
+            
+            # Determine if it's music or sound effect
+            is_music = 'music' in audio_file.name.lower() or 'theme' in audio_file.name.lower()
+            
+            # Create metadata
+            asset_data = {
+                'id': asset_id,
+                'name': audio_file.stem.replace('_', ' ').title(),
+                'type': 'music' if is_music else 'sound',
+                'path': f'/assets/audio/{new_filename}',
+                'tags': ['music' if is_music else 'sound', 'cc0'],
+                'license': 'CC0 - Kenney.nl'
+            }
+            if analysis is not None:
+                analysis = analysis[0]
+                asset_data.update({key: analysis[key] for key in ('duration', 'peak', 'rms', 'loudness', 'waveform')})
+                gain = loudness_gain(analysis, loudness) if loudness is not None else 1.0
+                if gain < 1.0:
+                    asset_data['volume'] = round(gain, 3)
+            
+            if is_music:
+                music_assets.append(asset_data)
+            else:
+                sound_assets.append(asset_data)
+        
+        index.prune(audio_path)
+        print(f"Audio: {format_publish_report(publish_results)}")
     
     return sound_assets, music_assets
 
-def generate_typescript_manifests(sprite_assets, tileset_assets, background_assets, sound_assets, music_assets):
-    """Generate TypeScript files with asset manifests"""
-    
-    # Generate sprites manifest
-    sprites_ts = '''// Auto-generated Kenney asset manifests
-import { SpriteAsset } from './asset-types';
-
-export const kenneySprites: SpriteAsset[] = [
-'''
-    for asset in sprite_assets[:100]:  # Limit for compilation speed
-        sprites_ts += f'''  {{
-    id: '{asset['id']}',
-    name: '{asset['name']}',
-    description: '{asset['description']}',
-    type: 'sprite',
-    category: '{asset['category']}',
-    path: '{asset['path']}',
-    thumbnail: '{asset['thumbnail']}',
-    tags: {json.dumps(asset['tags'])},
-    license: '{asset['license']}',
-    suggestedUse: '{asset['suggestedUse']}',
-    size: {{ width: {asset['size']['width']}, height: {asset['size']['height']} }}
-  }},
-'''
-    sprites_ts += '];\n'
-    
-    # Generate backgrounds manifest
-    backgrounds_ts = '''import { BackgroundAsset } from './asset-types';
-
-export const kenneyBackgrounds: BackgroundAsset[] = [
-'''
-    for asset in background_assets[:50]:
-        backgrounds_ts += f'''  {{
-    id: '{asset['id']}',
-    name: '{asset['name']}',
-    description: '{asset['description']}',
-    type: 'background',
-    category: '{asset['category']}',
-    path: '{asset['path']}',
-    thumbnail: '{asset['thumbnail']}',
-    tags: {json.dumps(asset['tags'])},
-    license: '{asset['license']}'
-  }},
-'''
-    backgrounds_ts += '];\n'
-    
-    # Generate sounds manifest
-    sounds_ts = '''import { SoundAsset } from './asset-types';
-
-export const kenneySounds: SoundAsset[] = [
-'''
-    for asset in sound_assets[:50]:
-        sounds_ts += f'''  {{
-    id: '{asset['id']}',
-    name: '{asset['name']}',
-    type: 'sound',
-    path: '{asset['path']}',
-    tags: {json.dumps(asset['tags'])},
-    license: '{asset['license']}'
-  }},
-'''
-    sounds_ts += '];\n'
-    
-    # Generate music manifest  
-    music_ts = '''export const kenneyMusic: SoundAsset[] = [
-'''
-    for asset in music_assets[:20]:
-        music_ts += f'''  {{
-    id: '{asset['id']}',
-    name: '{asset['name']}',
-    type: 'music',
-    path: '{asset['path']}',
-    tags: {json.dumps(asset['tags'])},
-    license: '{asset['license']}'
-  }},
-'''
-    music_ts += '];\n'
+def compare_scan(workers, publish_mode=DEFAULT_PUBLISH_MODE):
+    """Time a cold scan and copy of the whole tree serially and with `workers` threads.
+
+    Each run copies into a fresh temporary directory with an empty
+    in-memory index, so every file is stat'ed, opened and copied. The
+    serial run goes first, so the parallel run sees a warm OS page cache
+    for the sources.
+    """
+    timings = []
+    for count in (1, workers):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            index = CatalogIndex(':memory:')
+            start = time.perf_counter()
+            process_2d_assets(index, workers=count, public_assets_path=tmp_dir, thumbnails=False,
+                              publish_mode=publish_mode)
+            process_audio_assets(index, workers=count, public_assets_path=tmp_dir, publish_mode=publish_mode,
+                                 analyze=False)
+            timings.append((count, time.perf_counter() - start, index.stats['published']))
+            index.close()
+    print("\nScan timing (cold index, fresh destination):")
+    for count, elapsed, files in timings:
+        print(f"  {count:>3} worker{'s' if count > 1 else ' '}  {elapsed * 1000:9.1f} ms  ({files} files)")
+    print(f"  speedup x{timings[0][1] / timings[1][1]:.2f}")
+
+def shard_assets(sprite_assets, background_assets, sound_assets, music_assets):
+    """Split the catalog into manifest shards: {shard name: (kind, category, assets)}.
+
+    Sprites and backgrounds get one shard per category; sounds and music
+    are one shard each.
+    """
+    shards = {}
+    for kind, assets in (('sprites', sprite_assets), ('backgrounds', background_assets)):
+        for asset in assets:
+            shards.setdefault(f"{kind}-{asset['category']}", (kind, asset['category'], []))[2].append(asset)
+    for kind, assets in (('sounds', sound_assets), ('music', music_assets)):
+        if assets:
+            shards[kind] = (kind, None, assets)
+    return dict(sorted(shards.items()))
+
+def write_manifest_shards(shards, search_index, manifest_dir=MANIFEST_DIR, index_path=SHARD_INDEX_PATH,
+                          hashed_names=False):
+    """Write each shard and the search index as compact JSON under manifest_dir plus the TypeScript shard index.
+
+    The index only lists shard URLs and counts, so it stays a few lines long
+    however big the catalog gets; kenney-manifest.ts fetches the shards when
+    they are first needed, and the search index (assets/search_index.py)
+    when the browser first searches. With hashed_names the files are named
+    by their content hash as well; the index is bundled, so it picks up the
+    new names. Files left over from earlier runs are removed.
+    """
+    manifest_dir = Path(manifest_dir)
+    manifest_dir.mkdir(parents=True, exist_ok=True)
+    contents = {}
+    files = [(name, assets) for name, (kind, category, assets) in shards.items()]
+    for name, assets in files + [(SEARCH_INDEX_NAME, search_index)]:
+        data = json.dumps(assets, separators=(',', ':'))
+        filename = f'{name}.json'
+        if hashed_names:
+            filename = content_hashed_name(filename, hashlib.sha256(data.encode()).hexdigest(), 'copy')
+        contents[name] = (filename, data)
     
-    # Write TypeScript files
-    Path('../client/src/lib/asset-library').mkdir(parents=True, exist_ok=True)
+    filenames = {filename for filename, _ in contents.values()}
+    for stale in manifest_dir.glob('*.json'):
+        if stale.name not in filenames:
+            stale.unlink()
     
-    with open('../client/src/lib/asset-library/kenney-sprites.ts', 'w') as f:
-        f.write(sprites_ts)
+    for filename, data in contents.values():
+        with open(manifest_dir / filename, 'w', buffering=1 << 16) as f:
+            f.write(data)
     
-    with open('../client/src/lib/asset-library/kenney-backgrounds.ts', 'w') as f:
-        f.write(backgrounds_ts)
-        
-    with open('../client/src/lib/asset-library/kenney-sounds.ts', 'w') as f:
-        f.write(sounds_ts + '\n' + music_ts)
+    Path(index_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(index_path, 'w', buffering=1 << 16) as f:
+        f.write("// Auto-generated by scripts/catalog-kenney-assets.py - do not edit\n")
+        f.write("import type { KenneyShard } from './kenney-manifest';\n\n")
+        f.write("export const kenneyShards: KenneyShard[] = [\n")
+        for name, (kind, category, assets) in shards.items():
+            category_ts = f"'{category}'" if category else 'null'
+            f.write(f"  {{ kind: '{kind}', category: {category_ts}, "
+                    f"url: '{MANIFEST_URL}/{contents[name][0]}', count: {len(assets)} }},\n")
+        f.write("];\n\n")
+        f.write(f"export const kenneySearchIndexUrl = '{MANIFEST_URL}/{contents[SEARCH_INDEX_NAME][0]}';\n")
+
+def write_asset_map(asset_lists, path=ASSET_MAP_PATH):
+    """Write {asset id: published URL} for every asset, aliases included, as JSON"""
+    asset_map = {}
+    for assets in asset_lists:
+        for asset in assets:
+            asset_map[asset['id']] = asset['path']
+            for alias in asset.get('aliases', ()):
+                asset_map[alias] = asset['path']
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(dict(sorted(asset_map.items())), f, separators=(',', ':'))
+    return len(asset_map)
+
+def generate_typescript_manifests(sprite_assets, tileset_assets, background_assets, sound_assets, music_assets,
+                                  hashed_names=False):
+    """Write the catalog as lazily loaded JSON shards, a search index over them, their
+    TypeScript index and the asset map"""
+    shards = shard_assets(sprite_assets, background_assets, sound_assets, music_assets)
+    search_index = build_index(manifest_documents(sprite_assets + background_assets + sound_assets + music_assets))
+    write_manifest_shards(shards, search_index, hashed_names=hashed_names)
+    mapped = write_asset_map([sprite_assets, tileset_assets, background_assets, sound_assets, music_assets])
     
-    print(f"Generated manifests:")
+    print(f"Generated manifests ({len(shards)} shards):")
     print(f"  - {len(sprite_assets)} sprites")
     print(f"  - {len(background_assets)} backgrounds")
     print(f"  - {len(sound_assets)} sounds")
     print(f"  - {len(music_assets)} music tracks")
-    print(f"  - {len(tileset_assets)} tilesets")
+    print(f"  - {len(tileset_assets)} tilesets (not published to the client)")
+    print(f"  - {mapped} ids in {ASSET_MAP_PATH}")
 
 def main():
-    print("Cataloging Kenney assets...")
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--optimize-png', action='store_true',
+                        help='re-encode copied PNGs as compact palette/optimized PNGs')
+    parser.add_argument('--webp', action='store_true',
+                        help='with --optimize-png, also write a lossless .webp next to each PNG')
+    parser.add_argument('--jobs', type=int, default=None,
+                        help='processes used for thumbnails (default: one per CPU)')
+    parser.add_argument('--publish', choices=PUBLISH_MODES, default=DEFAULT_PUBLISH_MODE,
+                        help='how files reach client/public/assets: hardlink, reflink and symlink fall '
+                             f'back to copying where unsupported (default {DEFAULT_PUBLISH_MODE})')
+    parser.add_argument('--dedupe', choices=DEDUPE_MODES, default=DEFAULT_DEDUPE,
+                        help='publish identical (exact) or also near-identical (near) images once '
+                             f'(default {DEFAULT_DEDUPE})')
+    parser.add_argument('--hashed-names', action='store_true',
+                        help='publish files and manifest shards under content-hashed names '
+                             '(<id>.<hash>.png), which the server caches as immutable')
+    parser.add_argument('--normalize-loudness', type=float, metavar='LUFS',
+                        help='give sounds louder than this integrated loudness a playback volume '
+                             'that brings them down to it (e.g. -16)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f'threads for stat/read/copy work (default {DEFAULT_WORKERS}, 1 = serial)')
+    parser.add_argument('--compare-scan', action='store_true',
+                        help='only time a serial and a parallel cold scan into a temporary directory')
+    args = parser.parse_args()
     
-    # Process 2D assets
-    sprite_assets, tileset_assets, background_assets = process_2d_assets()
+    if args.compare_scan:
+        compare_scan(args.workers, args.publish)
+        return
     
-    # Process audio
-    sound_assets, music_assets = process_audio_assets()
+    print("Cataloging Kenney assets...")
+    index = CatalogIndex()
+    try:
+        # Process 2D assets
+        scan_start = time.perf_counter()
+        sprite_assets, tileset_assets, background_assets = process_2d_assets(
+            index, args.optimize_png, args.webp, args.jobs, args.workers, publish_mode=args.publish,
+            dedupe=args.dedupe, hashed_names=args.hashed_names)
+        
+        # Process audio
+        sound_assets, music_assets = process_audio_assets(index, args.workers, publish_mode=args.publish,
+                                                          loudness=args.normalize_loudness,
+                                                          hashed_names=args.hashed_names)
+        scan_time = time.perf_counter() - scan_start
+    finally:
+        index.close()
+    print(f"Index: {index.stats['published']} files published, {index.stats['unchanged']} unchanged, "
+          f"{index.stats['pruned']} orphans pruned in {scan_time:.2f}s ({args.workers} workers)")
     
     # Generate TypeScript manifests
     generate_typescript_manifests(
@@ -281,7 +772,8 @@ def main():
         tileset_assets, 
         background_assets,
         sound_assets,
-        music_assets
+        music_assets,
+        args.hashed_names
     )
     
     print("Asset cataloging complete!")
@@ -8,6 +8,9 @@ import { nanoid } from "nanoid";
 
 const viteLogger = createLogger();
 
+// name.<10 hex digits of the content hash>.ext
+const HASHED_ASSET = /\.[0-9a-f]{10}\.\w+$/;
+
 export function log(message: string, source = "express") {
   const formattedTime = new Date().toLocaleTimeString("en-US", {
     hour: "numeric",
@@ -76,7 +79,15 @@ export function serveStatic(app: Express) {
     );
   }
 
-  app.use(express.static(distPath));
+  // Assets published with content-hashed names (catalog-kenney-assets.py --hashed-names)
+  // never change, so browsers may keep them for a year without revalidating
+  app.use(express.static(distPath, {
+    setHeaders(res, filePath) {
+      if (HASHED_ASSET.test(filePath)) {
+        res.setHeader("Cache-Control", "public, max-age=31536000, immutable");
+      }
+    },
+  }));
 
   // fall through to index.html if the file doesn't exist
   app.use("*", (_req, res) => {